@@ -1,31 +1,64 @@
 """MachineQ Python API client."""
 
-from machineq.auth import MqApiEnvironment, MqAuth
+from machineq.auth import AsyncMqAuth, MqApiEnvironment, MqAuth
 from machineq.client import (
     APIError,
     AsyncClient,
+    AsyncRateLimiter,
+    ConnectionConfig,
+    InstrumentationHook,
     MachineQError,
+    MetricsCollector,
     NotFound,
     PermissionDenied,
+    RateLimit,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    RetryStats,
+    RevalidationCache,
     SyncClient,
+    Tracing,
     Unauthorized,
     ValidationError,
 )
+from machineq.fleet import FleetIndex
+from machineq.inventory import InventoryChanges, InventoryMirror
+from machineq.token_store import FileTokenStore, MemoryTokenStore, StoredToken, TokenStore
 
 __version__ = "0.0.1"
 
 __all__ = [
     "APIError",
     "AsyncClient",
+    "AsyncMqAuth",
+    "AsyncRateLimiter",
+    "ConnectionConfig",
+    "FileTokenStore",
+    "FleetIndex",
+    "InstrumentationHook",
+    "InventoryChanges",
+    "InventoryMirror",
     # Exceptions
     "MachineQError",
+    "MemoryTokenStore",
+    "MetricsCollector",
     "MqApiEnvironment",
     # Auth
     "MqAuth",
     "NotFound",
     "PermissionDenied",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "RetryStats",
+    "RevalidationCache",
+    "StoredToken",
     # Clients
     "SyncClient",
+    "TokenStore",
+    "Tracing",
     "Unauthorized",
     "ValidationError",
     "create_client",
@@ -1,9 +1,17 @@
+import asyncio
+import contextlib
+import threading
+import time
+import warnings
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
-from httpx import Client, Response
+from httpx import AsyncClient, Client, Response
 
+from .token_store import StoredToken, TokenStore
 from .utils import __version__
 
 GRACE_PERIOD_S = 5
@@ -18,6 +26,7 @@ class MqApiEnvironment(str, Enum):
 # authentication exception that will capture text error and optional status code
 class AuthenticationException(Exception):
     def __init__(self, res: Response | None = None):
+        message = "Failed to get an access token."
         if res is not None:
             if res.status_code == 429:
                 message = "Failed to get an access token. Rate limit exceeded. Please try again later."
@@ -28,18 +37,16 @@ class AuthenticationException(Exception):
         super().__init__(self.message)
 
 
-@dataclass
-class MqAuth:
-    client_id: str
-    client_secret: str = field(repr=False)
-    client: Client = field(default_factory=lambda: Client(), repr=False)
-    env: MqApiEnvironment = MqApiEnvironment.PROD
+class _MqAuthBase:
+    """Token endpoint logic shared by the sync and async auth providers.
+    The fields themselves are declared by the dataclasses below, so that `client` keeps its positional slot."""
 
-    expires_at: datetime = field(default_factory=lambda: datetime.now())
-    _token: str = field(default="", repr=False, init=False)
-
-    def __post_init__(self) -> None:
-        self.client.headers.update({"User-Agent": f"machineq-py/{__version__}"})
+    client_id: str
+    client_secret: str
+    env: MqApiEnvironment
+    expires_at: datetime
+    on_refresh: Callable[[float, Exception | None], None] | None
+    _token: str
 
     @property
     def env_str(self) -> str:
@@ -53,23 +60,145 @@ class MqAuth:
     def token_url(self) -> str:
         return f"{self.oauth_host}/token"
 
-    def refresh(self) -> None:
-        """Refresh the acccess token"""
-        auth_params: dict[str, str] = {
+    def _auth_params(self) -> dict[str, str]:
+        return {
             "grant_type": "client_credentials",
             "client_id": self.client_id,
             "client_secret": self.client_secret,
         }
-        res = self.client.post(
-            self.token_url,
-            timeout=10,
-            data=auth_params,
-        )
+
+    def _store_credentials(self, res: Response) -> int:
+        """Validate the token endpoint response and store the new token. Returns the token lifetime in seconds"""
         if res.status_code != 200:
             raise AuthenticationException(res)
         creds = res.json()
         self._token = creds["access_token"]
         self.expires_at = datetime.now() + timedelta(seconds=creds["expires_in"])
+        return creds["expires_in"]
+
+    def _report_refresh(self, started_at: float, error: Exception | None = None) -> None:
+        if self.on_refresh is not None:
+            self.on_refresh(time.perf_counter() - started_at, error)
+
+    def set_token(self, token: str, expires_at: datetime) -> None:
+        """Use an access token obtained elsewhere, e.g. by another auth instance, until `expires_at`"""
+        self._token = token
+        self.expires_at = expires_at
+
+    def _needs_refresh(self) -> bool:
+        return not self._token or (self.expires_at < datetime.now() + timedelta(seconds=GRACE_PERIOD_S))
+
+    @property
+    def _store_key(self) -> str:
+        return f"{self.env.value}:{self.client_id}"
+
+    def _adopt_stored_token(self, stored: StoredToken | None) -> bool:
+        """Switch to a stored token if it is valid and newer than ours"""
+        if stored is None or (self._token and stored.expires_at <= self.expires_at.timestamp()):
+            return False
+        expires_at = datetime.fromtimestamp(stored.expires_at)
+        if expires_at < datetime.now() + timedelta(seconds=GRACE_PERIOD_S):
+            return False
+        self._token = stored.access_token
+        self.expires_at = expires_at
+        return True
+
+
+@dataclass
+class MqAuth(_MqAuthBase):
+    client_id: str
+    client_secret: str = field(repr=False)
+    client: Client = field(default_factory=lambda: Client(), repr=False)
+    env: MqApiEnvironment = MqApiEnvironment.PROD
+
+    expires_at: datetime = field(default_factory=lambda: datetime.now())
+    renew_fraction: float | None = None
+    """Opt-in proactive renewal. When set (e.g. `0.8`), the token is renewed in a background thread once this
+    fraction of its lifetime (`expires_in`) has passed, so request-path callers only block on the identity
+    endpoint if the token has actually expired."""
+    token_store: TokenStore | None = field(default=None, repr=False)
+    """Optional store used to share the token with other `MqAuth` instances (e.g. worker processes
+    using a `FileTokenStore`). The store is checked before calling the identity endpoint, and only one
+    instance renews the token at a time."""
+    on_refresh: Callable[[float, Exception | None], None] | None = field(default=None, repr=False)
+    """Optional callback receiving the duration in seconds of each request to the identity endpoint,
+    and the error raised by a failed one"""
+    _token: str = field(default="", repr=False, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, init=False, compare=False)
+    _renew_timer: threading.Timer | None = field(default=None, repr=False, init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.renew_fraction is not None and not 0 < self.renew_fraction < 1:
+            raise ValueError("renew_fraction must be between 0 and 1")  # noqa: TRY003
+        self.client.headers.update({"User-Agent": f"machineq-py/{__version__}"})
+
+    def refresh(self) -> None:
+        """Refresh the acccess token"""
+        with self._lock:
+            self._renew(force=True)
+
+    def _renew(self, force: bool = False) -> None:
+        """Renew the token. Callers must hold `_lock`.
+
+        Unless forced, a newer valid token found in `token_store` is used instead of calling the identity endpoint.
+        """
+        if self.token_store is None:
+            self._fetch_token()
+            return
+        with self.token_store.lock(self._store_key):
+            if not force and self._adopt_stored_token(self.token_store.load(self._store_key)):
+                return
+            expires_in = self._fetch_token()
+            self.token_store.save(
+                self._store_key,
+                StoredToken(self._token, self.expires_at.timestamp(), expires_in),
+            )
+
+    def _adopt_stored_token(self, stored: StoredToken | None) -> bool:
+        if stored is None or not super()._adopt_stored_token(stored):
+            return False
+        if self.renew_fraction is not None:
+            issued_at = stored.expires_at - stored.expires_in
+            renew_at = issued_at + stored.expires_in * self.renew_fraction
+            self._schedule_renewal(max(renew_at - datetime.now().timestamp(), 0))
+        return True
+
+    def _fetch_token(self) -> int:
+        """Request a new token from the identity endpoint. Callers must hold `_lock`"""
+        started_at = time.perf_counter()
+        try:
+            res = self.client.post(
+                self.token_url,
+                timeout=10,
+                data=self._auth_params(),
+            )
+            expires_in = self._store_credentials(res)
+        except Exception as e:
+            self._report_refresh(started_at, e)
+            raise
+        self._report_refresh(started_at)
+        if self.renew_fraction is not None:
+            self._schedule_renewal(expires_in * self.renew_fraction)
+        return expires_in
+
+    def _schedule_renewal(self, delay_s: float) -> None:
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+        self._renew_timer = threading.Timer(delay_s, self._renew_in_background)
+        self._renew_timer.daemon = True
+        self._renew_timer.start()
+
+    def _renew_in_background(self) -> None:
+        # errors are not propagated from the background thread: once the token actually
+        # expires, the request path renews it synchronously and raises from there
+        with contextlib.suppress(Exception), self._lock:
+            self._renew()
+
+    def close(self) -> None:
+        """Stop the background renewal, if any"""
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+            self._renew_timer = None
 
     @property
     def token(self) -> str:
@@ -81,8 +210,138 @@ class MqAuth:
         Returns:
             str: the Bearer token, without `Bearer` prefix
         """
-        if not self._token or (self.expires_at < datetime.now() + timedelta(seconds=GRACE_PERIOD_S)):
-            self.refresh()
+        if self._needs_refresh():
+            with self._lock:
+                # another thread may have renewed the token while we were waiting for the lock
+                if self._needs_refresh():
+                    self._renew()
+        if not self._token:
+            raise AuthenticationException()
+        return self._token
+
+
+@dataclass
+class AsyncMqAuth(_MqAuthBase):
+    """Async counterpart of `MqAuth`, refreshing the token over an `httpx.AsyncClient`.
+
+    Concurrent callers that find the token expired wait on a single in-flight refresh
+    instead of each hitting the identity endpoint."""
+
+    client_id: str
+    client_secret: str = field(repr=False)
+    client: AsyncClient = field(default_factory=lambda: AsyncClient(), repr=False)
+    env: MqApiEnvironment = MqApiEnvironment.PROD
+
+    expires_at: datetime = field(default_factory=lambda: datetime.now())
+    token_store: TokenStore | None = field(default=None, repr=False)
+    """Optional store used to share the token with other auth instances, sync or async (e.g. worker
+    processes using a `FileTokenStore`). See `MqAuth.token_store`. The blocking store calls run in
+    worker threads."""
+    on_refresh: Callable[[float, Exception | None], None] | None = field(default=None, repr=False)
+    """Optional callback receiving the duration in seconds of each request to the identity endpoint,
+    and the error raised by a failed one"""
+    _token: str = field(default="", repr=False, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.client.headers.update({"User-Agent": f"machineq-py/{__version__}"})
+
+    async def refresh(self) -> None:
+        """Refresh the acccess token"""
+        async with self._lock:
+            await self._renew(force=True)
+
+    async def _renew(self, force: bool = False) -> None:
+        """Renew the token. Callers must hold `_lock`. See `MqAuth._renew`"""
+        store = self.token_store
+        if store is None:
+            await self._fetch_token()
+            return
+        async with _hold(store.lock(self._store_key)):
+            if not force and self._adopt_stored_token(await asyncio.to_thread(store.load, self._store_key)):
+                return
+            expires_in = await self._fetch_token()
+            token = StoredToken(self._token, self.expires_at.timestamp(), expires_in)
+            await asyncio.to_thread(store.save, self._store_key, token)
+
+    async def _fetch_token(self) -> int:
+        """Request a new token from the identity endpoint. Callers must hold `_lock`"""
+        started_at = time.perf_counter()
+        try:
+            res = await self.client.post(
+                self.token_url,
+                timeout=10,
+                data=self._auth_params(),
+            )
+            expires_in = self._store_credentials(res)
+        except Exception as e:
+            self._report_refresh(started_at, e)
+            raise
+        self._report_refresh(started_at)
+        return expires_in
+
+    async def get_token(self) -> str:
+        """Returns the token. If expired, will automatically renew without blocking the event loop.
+
+        Raises:
+            AuthenticationException: if the authentication fails
+
+        Returns:
+            str: the Bearer token, without `Bearer` prefix
+        """
+        if self._needs_refresh():
+            async with self._lock:
+                # another coroutine may have renewed the token while we were waiting for the lock
+                if self._needs_refresh():
+                    await self._renew()
         if not self._token:
             raise AuthenticationException()
         return self._token
+
+    @property
+    def token(self) -> str:
+        """Deprecated, use `await get_token()` instead.
+
+        Returns the token like `MqAuth.token`, as `AsyncClient.auth.token` did before `AsyncClient` authenticated
+        through `AsyncMqAuth`: an expired token is renewed with a blocking request, which stalls the event loop.
+        """
+        warnings.warn(
+            "AsyncMqAuth.token blocks the event loop to renew the token, use `await get_token()` instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if self._needs_refresh():
+            with Client() as client:
+                auth = MqAuth(
+                    self.client_id,
+                    self.client_secret,
+                    client,
+                    self.env,
+                    token_store=self.token_store,
+                    on_refresh=self.on_refresh,
+                )
+                auth.set_token(self._token, self.expires_at)
+                self.set_token(auth.token, auth.expires_at)
+        return self._token
+
+
+@contextlib.asynccontextmanager
+async def _hold(lock: AbstractContextManager[None]) -> AsyncIterator[None]:
+    """Acquire a blocking lock of a token store in a worker thread, so that waiting does not block the event loop"""
+    acquire = asyncio.ensure_future(asyncio.to_thread(lock.__enter__))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # the thread keeps waiting for the lock, release it once it is acquired
+
+        def release(done: asyncio.Future[None]) -> None:
+            if not done.cancelled() and done.exception() is None:
+                lock.__exit__(None, None, None)
+
+        acquire.add_done_callback(release)
+        raise
+    try:
+        yield
+    finally:
+        # releasing does not block
+        lock.__exit__(None, None, None)
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from .async_ import AsyncClient
+from .cache import REFERENCE_DATA_TTLS, ResponseCache, RevalidationCache
+from .coalesce import RequestCoalescer
+from .codec import JsonCodec, OrjsonCodec
+from .connection import ConnectionConfig
 from .exceptions import (
     APIError,
     InternalServerError,
@@ -16,21 +20,41 @@ from .exceptions import (
     Unauthorized,
     ValidationError,
 )
+from .instrumentation import InstrumentationHook, MetricsCollector, RequestEvent
+from .rate_limit import AsyncRateLimiter, RateLimit, RateLimiter
+from .retry import RetryPolicy, RetryStats
 from .sync import SyncClient
+from .tracing import Tracing
 
 __all__ = [
+    "REFERENCE_DATA_TTLS",
     "APIError",
     "AsyncClient",
+    "AsyncRateLimiter",
+    "ConnectionConfig",
+    "InstrumentationHook",
     "InternalServerError",
     "InvalidArgument",
+    "JsonCodec",
     # Exceptions
     "MachineQError",
+    "MetricsCollector",
     "NotFound",
+    "OrjsonCodec",
     "PermissionDenied",
+    "RateLimit",
     "RateLimited",
+    "RateLimiter",
+    "RequestCoalescer",
+    "RequestEvent",
+    "ResponseCache",
+    "RetryPolicy",
+    "RetryStats",
+    "RevalidationCache",
     "ServiceUnavailable",
     # Clients
     "SyncClient",
+    "Tracing",
     "Unauthenticated",
     "Unauthorized",
     "ValidationError",
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from types import TracebackType
 
 import httpx
 
-from machineq.auth import MqApiEnvironment, MqAuth
+from machineq.auth import AsyncMqAuth, MqApiEnvironment
 from machineq.core.account.api import AsyncAccount
 from machineq.core.application.api import AsyncApplications
 from machineq.core.decoder_type.api import AsyncDecoderTypes
@@ -24,8 +25,18 @@ from machineq.core.role.api import AsyncRoles
 from machineq.core.service_profile.api import AsyncServiceProfiles
 from machineq.core.users.api import AsyncUsers
 from machineq.core.version.api import AsyncVersion
+from machineq.token_store import TokenStore
 from machineq.utils import __version__
 
+from .cache import ResponseCache, RevalidationCache
+from .coalesce import RequestCoalescer
+from .codec import JsonCodec, default_codec
+from .connection import ConnectionConfig
+from .instrumentation import Instrumentation, InstrumentationHook
+from .rate_limit import AsyncRateLimiter
+from .retry import RetryPolicy, RetryStats
+from .tracing import Tracing
+
 
 class AsyncClient:
     """Asynchronous client for MachineQ API."""
@@ -37,6 +48,17 @@ class AsyncClient:
         version: str = "v1",
         extra_prefix: str = "",
         env: MqApiEnvironment = MqApiEnvironment.PROD,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        revalidation_cache: RevalidationCache | None = None,
+        coalesce_requests: bool = False,
+        json_codec: JsonCodec | None = None,
+        connection_config: ConnectionConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        hooks: Iterable[InstrumentationHook] | None = None,
+        tracing: Tracing | None = None,
+        token_store: TokenStore | None = None,
     ):
         """Initialize async client.
 
@@ -46,16 +68,56 @@ class AsyncClient:
             version: version of the API to use (default: v1)
             extra_prefix: extra prefix between the /{api_version} and {endpoint}. May be useful for some deprecated APIs.
             env: API environment (default: production)
+            retry_policy: policy for retrying transient failures (default: `RetryPolicy()`)
+            rate_limiter: optional client-side rate limiter applied to every request, retries included
+            cache: optional cache of the responses of slow-changing resources (see `ResponseCache`)
+            revalidation_cache: optional cache revalidating `GET` responses with conditional requests
+                (see `RevalidationCache`)
+            coalesce_requests: share one request between the identical `GET` requests in flight at the same
+                time, e.g. many concurrent `devices.get` calls for the same device (see `RequestCoalescer`)
+            json_codec: codec for untyped JSON and dict request bodies (default: orjson if installed,
+                the standard library otherwise). Models are always validated with `model_validate_json`.
+            connection_config: pool size, keepalive, timeouts and HTTP/2 settings of the HTTP client
+                (default: `ConnectionConfig()`, the httpx defaults)
+            transport: optional httpx transport to send the requests with, e.g. a custom
+                `httpx.HTTPTransport` or `httpx.MockTransport`. The pool settings of `connection_config`
+                then only apply if they are set on the transport itself.
+            hooks: optional instrumentation hooks called around each request, e.g. a `MetricsCollector`
+                (see `InstrumentationHook`)
+            tracing: optional OpenTelemetry tracing of the API calls (see `Tracing`)
+            token_store: optional store to share the access token with other clients or processes
+                (see `AsyncMqAuth.token_store`)
         """
-        # Create auth with a sync client (token refresh is always synchronous)
-        self.auth = MqAuth(
+        # Create HTTP client for this async client
+        self.instrumentation = Instrumentation(hooks or ())
+        # the same pool is used by the resources and by token renewals
+        connection_config = connection_config or ConnectionConfig()
+        http_client = httpx.AsyncClient(
+            headers={"User-Agent": f"machineq-py/{__version__}"},
+            transport=transport,
+            **connection_config.client_kwargs(),
+        )
+        # Create auth with the async client, so that token refresh does not block the event loop
+        self.auth = AsyncMqAuth(
             client_id=client_id,
             client_secret=client_secret,
+            client=http_client,
             env=env,
+            on_refresh=self.instrumentation.on_auth_refresh,
+            token_store=token_store,
         )
         self.api_version = version
         self.extra_prefix = extra_prefix
-        self.http_client = httpx.AsyncClient(headers={"User-Agent": f"machineq-py/{__version__}"})
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.revalidation_cache = revalidation_cache
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        self.json_codec = json_codec or default_codec()
+        self.connection_config = connection_config
+        self.tracing = tracing
+        self.http_client = http_client
 
         # Initialize all resource attributes
         self.account = AsyncAccount(self)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import httpx
@@ -10,18 +12,27 @@ from pydantic import BaseModel
 
 from machineq import MqApiEnvironment
 
+from .cache import _cache_key
 from .exceptions import parse_error_response
+from .streaming import JsonArrayParser
+from .tracing import current_call, trace_resource_methods
 
 if TYPE_CHECKING:
     from .async_ import AsyncClient
     from .sync import SyncClient
 
 ClientType = TypeVar("ClientType", "SyncClient", "AsyncClient")
+M = TypeVar("M", bound=BaseModel)
 
 
 class BaseResource(Generic[ClientType]):
     """Base class for API resources."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        # spans are only started when the client has tracing enabled
+        trace_resource_methods(cls)
+
     def __init__(
         self,
         client: ClientType,
@@ -43,19 +54,277 @@ class BaseResource(Generic[ClientType]):
         self.extra_prefix = client.extra_prefix
         self.base_path = base_path
 
-    def _get_all_generic(self: BaseResource[SyncClient]) -> Any:  # noqa: ANN401
-        """Common function for get_all, returns parsed json"""
+    def _get_all_generic(self: BaseResource[SyncClient], model: type[M]) -> M:
+        """Common function for get_all, returns the response parsed into `model`"""
         url = self._build_url()
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return data
+        response = self._request("GET", url)
+        return self._parse_model(response, model)
 
-    async def _get_all_generic_async(self: BaseResource[AsyncClient]) -> Any:  # noqa: ANN401
-        """Common function for get_all, returns parsed json"""
+    async def _get_all_generic_async(self: BaseResource[AsyncClient], model: type[M]) -> M:
+        """Common function for get_all, returns the response parsed into `model`"""
         url = self._build_url()
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return data
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, model)
+
+    def _stream_items(
+        self: BaseResource[SyncClient],
+        url: str,
+        container: type[BaseModel],
+        model: type[M],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[tuple[str, M]]:
+        """Send a `GET` request and yield the items of the lists of `container`, a model grouping lists
+        of `model` (e.g. `DevicesHealthResponse`), validated one at a time as the response is downloaded.
+        Memory stays proportional to a single item, and the response caches are bypassed.
+
+        Yields:
+            `(field name, item)` pairs, in the order of the response (e.g. `("offline", device)`).
+
+        Raises:
+            APIError: If response is not successful
+        """
+        response = self._send("GET", url, stream=True, **kwargs)
+        try:
+            if not response.is_success:
+                response.read()
+                self._raise_for_error(response)
+            names = {info.alias or name: name for name, info in container.model_fields.items()}
+            parser = JsonArrayParser(names)
+            for chunk in response.iter_bytes():
+                for key, item in parser.feed(chunk):
+                    yield names[key], model.model_validate(item)
+            parser.close()
+        finally:
+            response.close()
+
+    async def _stream_items_async(
+        self: BaseResource[AsyncClient],
+        url: str,
+        container: type[BaseModel],
+        model: type[M],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[tuple[str, M]]:
+        """Send a `GET` request and yield the items of the lists of `container`, a model grouping lists
+        of `model` (e.g. `DevicesHealthResponse`), validated one at a time as the response is downloaded.
+        Memory stays proportional to a single item, and the response caches are bypassed.
+
+        Yields:
+            `(field name, item)` pairs, in the order of the response (e.g. `("offline", device)`).
+
+        Raises:
+            APIError: If response is not successful
+        """
+        response = await self._send_async("GET", url, stream=True, **kwargs)
+        try:
+            if not response.is_success:
+                await response.aread()
+                self._raise_for_error(response)
+            names = {info.alias or name: name for name, info in container.model_fields.items()}
+            parser = JsonArrayParser(names)
+            async for chunk in response.aiter_bytes():
+                for key, item in parser.feed(chunk):
+                    yield names[key], model.model_validate(item)
+            parser.close()
+        finally:
+            await response.aclose()
+
+    def _request(self: BaseResource[SyncClient], method: str, url: str, **kwargs: Any) -> httpx.Response:  # noqa: ANN401
+        """Send a request with auth headers, pacing it with the client's rate limiter (if any) and retrying
+        transient failures according to the client's retry policy. Responses are served from and stored
+        in the client's response caches, if any, and identical concurrent `GET` requests are coalesced if
+        the client enables it. Each attempt is reported to the client's instrumentation hooks.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            **kwargs: Extra arguments for `httpx.Client.request` (params, content, ...)
+
+        Returns:
+            The response of the last attempt
+        """
+        coalescer = self.client.coalescer
+        if coalescer is not None and method == "GET":
+            key = _cache_key(url, kwargs.get("params"))
+            return coalescer.run(key, lambda: self._request_cached(method, url, **kwargs))
+        return self._request_cached(method, url, **kwargs)
+
+    def _request_cached(self: BaseResource[SyncClient], method: str, url: str, **kwargs: Any) -> httpx.Response:  # noqa: ANN401
+        """Serve a request from the response caches, or send it and store its response"""
+        cache = self.client.cache
+        revalidation_cache = self.client.revalidation_cache
+        if cache is None and revalidation_cache is None:
+            return self._send(method, url, **kwargs)
+        params = kwargs.get("params")
+        if cache is not None:
+            cached = cache.lookup(self.base_path, method, url, params)
+            if cached is not None:
+                return cached
+        conditional = revalidation_cache.prepare(method, url, params) if revalidation_cache is not None else None
+        if conditional is not None:
+            kwargs["headers"] = conditional.headers
+        response = self._send(method, url, **kwargs)
+        if revalidation_cache is not None and conditional is not None:
+            response = revalidation_cache.complete(conditional, response)
+        if cache is not None:
+            cache.store(self.base_path, method, url, params, response)
+        return response
+
+    def _send(
+        self: BaseResource[SyncClient],
+        method: str,
+        url: str,
+        stream: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> httpx.Response:
+        """Send a request, bypassing the response caches. With `stream`, the body of the returned response
+        is not read, and the caller must close it."""
+        extra_headers = kwargs.pop("headers", None) or {}
+        attempt = 1
+        while True:
+            if self.client.rate_limiter is not None:
+                self.client.rate_limiter.acquire(self.base_path)
+            http_client = self.client.http_client
+            instrumentation = self.client.instrumentation
+            traced = current_call()
+            try:
+                token_started = time.perf_counter()
+                headers = self._build_headers()
+                request = http_client.build_request(method, url, headers={**headers, **extra_headers}, **kwargs)
+                if traced is not None:
+                    traced.record_request(request, attempt, time.perf_counter() - token_started)
+                event = instrumentation.before_request(self.base_path, request, attempt)
+                try:
+                    response = http_client.send(request, stream=stream)
+                except Exception as e:
+                    instrumentation.on_error(event, e)
+                    raise
+                instrumentation.after_response(event, response)
+                if traced is not None:
+                    traced.record_response(response)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def _request_async(self: BaseResource[AsyncClient], method: str, url: str, **kwargs: Any) -> httpx.Response:  # noqa: ANN401
+        """Send a request with auth headers, pacing it with the client's rate limiter (if any) and retrying
+        transient failures according to the client's retry policy. Responses are served from and stored
+        in the client's response caches, if any, and identical concurrent `GET` requests are coalesced if
+        the client enables it. Each attempt is reported to the client's instrumentation hooks.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            **kwargs: Extra arguments for `httpx.AsyncClient.request` (params, content, ...)
+
+        Returns:
+            The response of the last attempt
+        """
+        coalescer = self.client.coalescer
+        if coalescer is not None and method == "GET":
+            key = _cache_key(url, kwargs.get("params"))
+            return await coalescer.run_async(key, lambda: self._request_cached_async(method, url, **kwargs))
+        return await self._request_cached_async(method, url, **kwargs)
+
+    async def _request_cached_async(
+        self: BaseResource[AsyncClient],
+        method: str,
+        url: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> httpx.Response:
+        """Serve a request from the response caches, or send it and store its response"""
+        cache = self.client.cache
+        revalidation_cache = self.client.revalidation_cache
+        if cache is None and revalidation_cache is None:
+            return await self._send_async(method, url, **kwargs)
+        params = kwargs.get("params")
+        if cache is not None:
+            cached = cache.lookup(self.base_path, method, url, params)
+            if cached is not None:
+                return cached
+        conditional = revalidation_cache.prepare(method, url, params) if revalidation_cache is not None else None
+        if conditional is not None:
+            kwargs["headers"] = conditional.headers
+        response = await self._send_async(method, url, **kwargs)
+        if revalidation_cache is not None and conditional is not None:
+            response = revalidation_cache.complete(conditional, response)
+        if cache is not None:
+            cache.store(self.base_path, method, url, params, response)
+        return response
+
+    async def _send_async(
+        self: BaseResource[AsyncClient],
+        method: str,
+        url: str,
+        stream: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> httpx.Response:
+        """Send a request, bypassing the response caches. With `stream`, the body of the returned response
+        is not read, and the caller must close it."""
+        extra_headers = kwargs.pop("headers", None) or {}
+        attempt = 1
+        while True:
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire(self.base_path)
+            http_client = self.client.http_client
+            instrumentation = self.client.instrumentation
+            traced = current_call()
+            try:
+                token_started = time.perf_counter()
+                headers = await self._build_headers_async()
+                request = http_client.build_request(method, url, headers={**headers, **extra_headers}, **kwargs)
+                if traced is not None:
+                    traced.record_request(request, attempt, time.perf_counter() - token_started)
+                event = instrumentation.before_request(self.base_path, request, attempt)
+                try:
+                    response = await http_client.send(request, stream=stream)
+                except Exception as e:
+                    instrumentation.on_error(event, e)
+                    raise
+                instrumentation.after_response(event, response)
+                if traced is not None:
+                    traced.record_response(response)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: httpx.TransportError | None = None,
+    ) -> float | None:
+        """Ask the retry policy whether to retry, and record the outcome in the client's retry stats"""
+        policy = self.client.retry_policy
+        delay = policy.next_delay(method, attempt, response=response, error=error)
+        if error is not None:
+            reason = type(error).__name__
+        elif response is not None and response.status_code in policy.retry_statuses:
+            reason = str(response.status_code)
+        else:
+            # success or non-transient error
+            return delay
+        if delay is not None:
+            self.client.retry_stats.record_retry(reason)
+        elif attempt > 1:
+            self.client.retry_stats.record_exhausted()
+        return delay
 
     @property
     def base_url(self) -> str:
@@ -78,13 +347,32 @@ class BaseResource(Generic[ClientType]):
             return f"{self.base_url}{self.base_path}/{path}"
         return f"{self.base_url}{self.base_path}"
 
+    def _raise_for_error(self, response: httpx.Response) -> None:
+        """Raise the API error matching an unsuccessful response.
+
+        Raises:
+            APIError: If response is not successful
+        """
+        if response.is_success:
+            return
+        try:
+            data = self.client.json_codec.loads(response.content)
+        except ValueError:
+            # Response is not JSON, create generic error
+            data = {
+                "message": response.text or f"HTTP {response.status_code}",
+                "code": response.status_code,
+            }
+        if not isinstance(data, dict):
+            data = {"message": response.text, "code": response.status_code}
+        raise parse_error_response(data, status_code=response.status_code)
+
     # the actual return type for this call is None | list | dict | str
     # but then subsequent calls to try and serialize it, like SomeModel(**data)
-    # fail type check, since it can only do that with a dict. Long term a better
-    # way would be to possibly pass a type instance and return that type instance.
-    @staticmethod
-    def _parse_response(response: httpx.Response) -> Any:  # noqa: ANN401
-        """Parse JSON response.
+    # fail type check, since it can only do that with a dict. Prefer `_parse_model`
+    # when the response is parsed into a model.
+    def _parse_response(self, response: httpx.Response) -> Any:  # noqa: ANN401
+        """Parse JSON response with the client's JSON codec.
 
         Args:
             response: httpx response
@@ -96,33 +384,50 @@ class BaseResource(Generic[ClientType]):
             APIError: If response is not successful
         """
         # Check for success first
-        if not response.is_success:
-            try:
-                data = response.json()
-            except (json.JSONDecodeError, ValueError):
-                # Response is not JSON, create generic error
-                data = {
-                    "message": response.text or f"HTTP {response.status_code}",
-                    "code": response.status_code,
-                }
-
-            raise parse_error_response(data, status_code=response.status_code)
+        self._raise_for_error(response)
 
         # Empty success response (e.g., 204 No Content)
         if not response.content:
             return None
 
         # Parse successful JSON response
+        started_at = time.perf_counter()
         try:
-            return response.json()
-        except (json.JSONDecodeError, ValueError):
+            return self.client.json_codec.loads(response.content)
+        except ValueError:
             # If no content, return None
             if not response.text:
                 return None
             # If we can't parse, return text
             return response.text
+        finally:
+            self.client.instrumentation.on_parse(self.base_path, "decode", started_at)
 
-    def _build_headers(self) -> dict[str, str]:
+    def _parse_model(self, response: httpx.Response, model: type[M]) -> M:
+        """Parse a JSON response into `model`, validating the response bytes in a single pass
+        with `model_validate_json`.
+
+        If the response is kept by the client's revalidation cache, the parsed instance is kept as well,
+        and reused as long as the server reports the response as unchanged. Callers then get a deep copy
+        of it, which they may modify.
+
+        Raises:
+            APIError: If response is not successful
+        """
+        revalidation_cache = self.client.revalidation_cache
+        if revalidation_cache is not None:
+            parsed = revalidation_cache.parsed(response, model)
+            if parsed is not None:
+                return parsed.model_copy(deep=True)
+        self._raise_for_error(response)
+        started_at = time.perf_counter()
+        result = model.model_validate_json(response.content)
+        self.client.instrumentation.on_parse(self.base_path, "validate", started_at)
+        if revalidation_cache is not None and revalidation_cache.keep_parsed(response, result):
+            return result.model_copy(deep=True)
+        return result
+
+    def _build_headers(self: BaseResource[SyncClient]) -> dict[str, str]:
         """Build request headers with auth token.
         Returns:
             Headers dict with Authorization header
@@ -132,8 +437,17 @@ class BaseResource(Generic[ClientType]):
             "Content-Type": "application/json",
         }
 
-    @staticmethod
-    def _serialize_request_data(data: BaseModel | dict) -> str:
+    async def _build_headers_async(self: BaseResource[AsyncClient]) -> dict[str, str]:
+        """Build request headers with auth token, renewing it without blocking the event loop.
+        Returns:
+            Headers dict with Authorization header
+        """
+        return {
+            "Authorization": f"Bearer {await self.client.auth.get_token()}",
+            "Content-Type": "application/json",
+        }
+
+    def _serialize_request_data(self, data: BaseModel | dict) -> str:
         """Serialize request data to JSON.
 
         Args:
@@ -147,9 +461,5 @@ class BaseResource(Generic[ClientType]):
         if isinstance(data, BaseModel):
             return data.model_dump_json(by_alias=True, exclude_none=True)
 
-        # Handle dicts
-        if isinstance(data, dict):
-            return json.dumps(data)
-
-        # Fallback
-        return json.dumps(data)
+        # Handle dicts and anything else with the client's JSON codec
+        return self.client.json_codec.dumps(data)
@@ -0,0 +1,249 @@
+"""Opt-in in-memory caches: a TTL cache for slow-changing resources and a conditional request cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+REFERENCE_DATA_TTLS: dict[str, float] = {
+    "/decodertypes": 300.0,
+    "/deviceprofiles": 300.0,
+    "/gatewayprofiles": 300.0,
+    "/rfregions": 300.0,
+    "/roles": 300.0,
+    "/serviceprofiles": 300.0,
+    "/version": 300.0,
+}
+"""Default TTLs in seconds of `ResponseCache`, covering the resources holding nearly static reference data"""
+
+
+def _cache_key(url: str, params: Any) -> str:  # noqa: ANN401
+    return str(httpx.URL(url, params=params)) if params else url
+
+
+class ResponseCache:
+    """LRU cache of successful `GET` responses with a TTL per endpoint family.
+
+    Endpoint families are keyed by resource base path (e.g. `"/roles"`), as for the rate limiter.
+    Any other request on a family (create, update, patch, delete, ...) invalidates its cached
+    responses. A cache holds responses for the credentials of a single client, so do not share
+    it between clients.
+
+    ```python
+    client = SyncClient(client_id, client_secret, cache=ResponseCache())
+    client.roles.get_all()  # fetched
+    client.roles.get_all()  # served from memory
+    ```
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float | None = None,
+        max_entries: int = 256,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttls: Time to live in seconds of the cached responses, per endpoint family
+                (default: `REFERENCE_DATA_TTLS`).
+            default_ttl: Time to live of the families missing from `ttls`. By default they are not cached.
+            max_entries: Maximum number of cached responses, the least recently used ones are evicted first.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")  # noqa: TRY003
+        self.ttls = dict(REFERENCE_DATA_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, httpx.Response]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        """Number of requests served from the cache"""
+        self.misses = 0
+        """Number of cacheable requests that had to be sent"""
+        self.invalidations = 0
+        """Number of times a family was invalidated"""
+
+    def _ttl(self, family: str) -> float | None:
+        return self.ttls.get(family, self.default_ttl)
+
+    def lookup(self, family: str, method: str, url: str, params: Any = None) -> httpx.Response | None:  # noqa: ANN401
+        """Return the cached response of a request, if any. Requests other than `GET` invalidate their family."""
+        if method.upper() != "GET":
+            self.invalidate(family)
+            return None
+        if self._ttl(family) is None:
+            return None
+        key = (family, _cache_key(url, params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def store(self, family: str, method: str, url: str, params: Any, response: httpx.Response) -> None:  # noqa: ANN401
+        """Cache the response of a successful `GET` request. Other requests invalidate their family,
+        since they may have changed it."""
+        if method.upper() != "GET":
+            self.invalidate(family)
+            return
+        ttl = self._ttl(family)
+        if ttl is None or response.status_code != httpx.codes.OK:
+            return
+        key = (family, _cache_key(url, params))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, family: str | None = None) -> None:
+        """Drop the cached responses of an endpoint family, or all of them if no family is given"""
+        with self._lock:
+            if family is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == family]:
+                    del self._entries[key]
+            self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class _Validated:
+    response: httpx.Response
+    etag: str | None
+    last_modified: str | None
+
+
+@dataclass
+class ConditionalRequest:
+    """A `GET` request prepared by `RevalidationCache.prepare`"""
+
+    key: str
+    entry: _Validated | None
+    headers: dict[str, str] = field(default_factory=dict)
+    """Conditional headers to send with the request"""
+
+
+class RevalidationCache:
+    """Cache of `GET` responses revalidated with conditional requests.
+
+    Responses carrying an `ETag` or `Last-Modified` validator are kept, and the next request for
+    the same URL is sent with `If-None-Match` / `If-Modified-Since`. When the server answers
+    `304 Not Modified`, the kept response is used instead, and so is the model parsed from it:
+    the body is neither downloaded nor validated again. Unlike `ResponseCache`, the server is
+    asked every time, so the data is never stale. Responses without validators are not kept.
+
+    The models returned for an unchanged response are the same instances as the previous call,
+    so treat them as read-only.
+
+    ```python
+    client = SyncClient(client_id, client_secret, revalidation_cache=RevalidationCache())
+    client.devices.get_all()  # downloaded and parsed
+    client.devices.get_all()  # 304, the previous list is reused
+    ```
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of kept responses, the least recently used ones are evicted first.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")  # noqa: TRY003
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Validated] = OrderedDict()
+        self._parsed: weakref.WeakKeyDictionary[httpx.Response, dict[type[BaseModel], BaseModel]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        """Number of conditional requests answered with `304 Not Modified`"""
+        self.misses = 0
+        """Number of `GET` requests that downloaded a body"""
+        self.revalidations = 0
+        """Number of conditional requests sent"""
+
+    def prepare(self, method: str, url: str, params: Any = None) -> ConditionalRequest | None:  # noqa: ANN401
+        """Return the conditional headers to send with a `GET` request, or None for other methods"""
+        if method.upper() != "GET":
+            return None
+        key = _cache_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        request = ConditionalRequest(key, entry)
+        if entry is not None:
+            if entry.etag is not None:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                request.headers["If-Modified-Since"] = entry.last_modified
+        return request
+
+    def complete(self, request: ConditionalRequest, response: httpx.Response) -> httpx.Response:
+        """Return the response to use for a prepared request: the kept one if the server answered
+        `304 Not Modified`, or the received one, which is kept if it carries validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            if request.entry is not None:
+                self.revalidations += 1
+            if response.status_code == httpx.codes.NOT_MODIFIED and request.entry is not None:
+                self.hits += 1
+                return request.entry.response
+            self.misses += 1
+            if response.status_code != httpx.codes.OK:
+                return response
+            if etag is None and last_modified is None:
+                self._entries.pop(request.key, None)
+                return response
+            self._entries[request.key] = _Validated(response, etag, last_modified)
+            self._entries.move_to_end(request.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def parsed(self, response: httpx.Response, model: type[M]) -> M | None:
+        """Return the model previously parsed from a kept response, if any"""
+        with self._lock:
+            parsed = self._parsed.get(response, {}).get(model)
+        return parsed if isinstance(parsed, model) else None
+
+    def keep_parsed(self, response: httpx.Response, parsed: BaseModel) -> bool:
+        """Remember the model parsed from a kept response, so that it is reused on `304 Not Modified`.
+        Returns whether it was kept."""
+        with self._lock:
+            if any(entry.response is response for entry in self._entries.values()):
+                self._parsed.setdefault(response, {})[type(parsed)] = parsed
+                return True
+            return False
+
+    def invalidate(self) -> None:
+        """Drop all kept responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
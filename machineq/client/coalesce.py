@@ -0,0 +1,75 @@
+"""Single-flight coalescing of identical concurrent `GET` requests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+
+import httpx
+
+
+class RequestCoalescer:
+    """Shares one request between the callers issuing the same `GET` at the same time.
+
+    The first caller of a URL (query string included) sends the request, and callers asking for the same
+    URL before its response arrives wait for it instead of sending their own. They all get the same
+    response object, read-only, and each parses it, so errors are raised to every one of them.
+    Requests are only shared while in flight, nothing is cached.
+
+    Created by the clients when `coalesce_requests` is set. A coalescer shares responses fetched with the
+    credentials of its client, so it is not meant to be shared between clients.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[httpx.Response]] = {}
+        self._tasks: dict[str, asyncio.Task[httpx.Response]] = {}
+        self.coalesced = 0
+        """Number of requests that were not sent because an identical one was in flight"""
+
+    def run(self, key: str, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Return the response of the in-flight request for `key`, or call `send` for it"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            response = send()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def run_async(self, key: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Return the response of the in-flight request for `key`, or await `send` for it.
+
+        The request runs in its own task, so that a caller being cancelled does not cancel it
+        for the other callers.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(send())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[httpx.Response]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # mark the exception as retrieved, in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,53 @@
+"""JSON codecs used to decode API responses and encode request bodies."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # ty:ignore[invalid-assignment]
+
+
+class JsonCodec:
+    """Codec backed by the standard library `json` module.
+
+    Models are always validated straight from the response bytes with pydantic's
+    `model_validate_json`, the codec is only used for untyped JSON (e.g. error bodies,
+    raw log pages and dict request bodies).
+    """
+
+    name = "json"
+
+    def loads(self, content: bytes | str) -> Any:  # noqa: ANN401
+        """Decode a JSON document. Raises `json.JSONDecodeError` (or a subclass) if it is invalid."""
+        return json.loads(content)
+
+    def dumps(self, data: Any) -> str:  # noqa: ANN401
+        """Encode data as a JSON document"""
+        return json.dumps(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by [orjson](https://github.com/ijl/orjson), installed with the `fast` extra
+    (`pip install machineq[fast]`)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("OrjsonCodec requires orjson, install it with `pip install machineq[fast]`")  # noqa: TRY003
+
+    def loads(self, content: bytes | str) -> Any:  # noqa: ANN401
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(content)
+
+    def dumps(self, data: Any) -> str:  # noqa: ANN401
+        return orjson.dumps(data).decode()
+
+
+def default_codec() -> JsonCodec:
+    """Return `OrjsonCodec` when orjson is installed, and the standard library codec otherwise"""
+    return OrjsonCodec() if orjson is not None else JsonCodec()
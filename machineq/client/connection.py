@@ -0,0 +1,69 @@
+"""Connection pool, timeout and HTTP/2 settings of the clients."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+
+@dataclass(frozen=True)
+class ConnectionConfig:
+    """Connection settings of the HTTP client shared by all resources of a client, and by its token renewals.
+
+    The defaults are those of httpx. At high concurrency (e.g. bulk operations or sharded log exports),
+    raise `max_connections` and `max_keepalive_connections` above the number of requests in flight, so that
+    requests do not wait for a free connection (`httpx.PoolTimeout`) and connections are reused instead of
+    paying a new TLS handshake. With `http2`, requests are multiplexed over a few connections instead;
+    it requires the `http2` extra (`pip install machineq[http2]`).
+
+    ```python
+    config = ConnectionConfig(max_connections=50, max_keepalive_connections=50, read_timeout=60.0, http2=True)
+    client = AsyncClient(client_id, client_secret, connection_config=config)
+    ```
+    """
+
+    max_connections: int | None = 100
+    """Maximum number of open connections, None for no limit"""
+    max_keepalive_connections: int | None = 20
+    """Maximum number of idle connections kept open for reuse, None for no limit"""
+    keepalive_expiry: float | None = 5.0
+    """Seconds after which idle connections are closed"""
+    connect_timeout: float | None = 5.0
+    """Seconds to wait for a connection to be established, None to wait forever"""
+    read_timeout: float | None = 5.0
+    """Seconds to wait for a chunk of the response, None to wait forever"""
+    write_timeout: float | None = 5.0
+    """Seconds to wait for a chunk of the request to be sent, None to wait forever"""
+    pool_timeout: float | None = 5.0
+    """Seconds to wait for a connection from the pool, None to wait forever"""
+    http2: bool = False
+    """Negotiate HTTP/2 with the server, multiplexing concurrent requests over a single connection"""
+
+    def __post_init__(self) -> None:
+        if self.max_connections is not None and self.max_connections < 1:
+            raise ValueError("max_connections must be at least 1")  # noqa: TRY003
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Pool limits for httpx"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """Per-phase timeouts for httpx"""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments of `httpx.Client` / `httpx.AsyncClient` applying these settings"""
+        return {"limits": self.limits, "timeout": self.timeout, "http2": self.http2}
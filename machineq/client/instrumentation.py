@@ -0,0 +1,329 @@
+"""Instrumentation hooks around API requests, and a built-in in-process metrics collector."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Default upper bounds in seconds of the histogram buckets, as used by Prometheus clients"""
+
+
+@dataclass
+class RequestEvent:
+    """A single attempt of an API request, passed to the hooks of `InstrumentationHook`"""
+
+    resource: str
+    """Endpoint family of the request, i.e. the resource base path (e.g. `"/devices"`)"""
+    request: httpx.Request
+    """Request about to be sent. Hooks may add headers to it in `before_request`"""
+    attempt: int
+    """Attempt number, starting at 1. Retries have higher numbers"""
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed: float | None = None
+    """Seconds until the response headers were received or the request failed"""
+    response: httpx.Response | None = None
+    error: Exception | None = None
+
+    @property
+    def method(self) -> str:
+        return self.request.method
+
+    @property
+    def request_bytes(self) -> int:
+        """Size of the request body"""
+        return int(self.request.headers.get("Content-Length", 0))
+
+    @property
+    def response_bytes(self) -> int:
+        """Size of the (decompressed) response body. Streamed responses are not read yet, so they count as 0"""
+        if self.response is None:
+            return 0
+        try:
+            return len(self.response.content)
+        except httpx.ResponseNotRead:
+            return 0
+
+
+class InstrumentationHook:
+    """Base class of instrumentation hooks. Every method is a no-op, override the ones you need.
+
+    Hooks are called synchronously on the request path, including from the event loop with `AsyncClient`,
+    so they should be quick. Exceptions raised by hooks propagate to the caller.
+
+    ```python
+    class SlowRequestLogger(InstrumentationHook):
+        def after_response(self, event: RequestEvent) -> None:
+            if event.elapsed > 1:
+                print(f"slow request: {event.method} {event.request.url} took {event.elapsed:.1f}s")
+
+    client = SyncClient(client_id, client_secret, hooks=[SlowRequestLogger()])
+    ```
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before each attempt of a request is sent"""
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called when the response headers of an attempt are received, whatever its status code"""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when an attempt fails without a response (connection error, timeout, ...)"""
+
+    def on_parse(self, resource: str, stage: str, seconds: float) -> None:
+        """Called after a response body is parsed, `stage` being `"decode"` for untyped JSON decoding
+        and `"validate"` for pydantic validation"""
+
+    def on_auth_refresh(self, seconds: float, error: Exception | None = None) -> None:
+        """Called after each request to the identity endpoint for a new access token"""
+
+
+class Instrumentation:
+    """Dispatches the events of a client to its hooks. Created by the clients from their `hooks` argument."""
+
+    def __init__(self, hooks: Iterable[InstrumentationHook] = ()):
+        self.hooks = list(hooks)
+
+    def before_request(self, resource: str, request: httpx.Request, attempt: int) -> RequestEvent | None:
+        """Start the event of an attempt, or return None when there are no hooks to call"""
+        if not self.hooks:
+            return None
+        event = RequestEvent(resource, request, attempt)
+        for hook in self.hooks:
+            hook.before_request(event)
+        # do not count the time spent in the hooks
+        event.started_at = time.perf_counter()
+        return event
+
+    def after_response(self, event: RequestEvent | None, response: httpx.Response) -> None:
+        if event is None:
+            return
+        event.elapsed = time.perf_counter() - event.started_at
+        event.response = response
+        for hook in self.hooks:
+            hook.after_response(event)
+
+    def on_error(self, event: RequestEvent | None, error: Exception) -> None:
+        if event is None:
+            return
+        event.elapsed = time.perf_counter() - event.started_at
+        event.error = error
+        for hook in self.hooks:
+            hook.on_error(event)
+
+    def on_parse(self, resource: str, stage: str, started_at: float) -> None:
+        seconds = time.perf_counter() - started_at
+        for hook in self.hooks:
+            hook.on_parse(resource, stage, seconds)
+
+    def on_auth_refresh(self, seconds: float, error: Exception | None = None) -> None:
+        for hook in self.hooks:
+            hook.on_auth_refresh(seconds, error)
+
+
+class Histogram:
+    """Cumulative histogram of durations, in the Prometheus style"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> dict[str, int]:
+        """Number of observations less than or equal to each bucket bound, keyed by bound (`"+Inf"` last)"""
+        result = {}
+        total = 0
+        for bound, count in zip((*map(_format_bound, self.buckets), "+Inf"), self.counts, strict=True):
+            total += count
+            result[bound] = total
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "buckets": self.cumulative()}
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class MetricsCollector(InstrumentationHook):
+    """In-process metrics of the requests of one or more clients.
+
+    Tracks the latency of each attempt per resource and method, the outcomes per status code or error,
+    retries, bytes sent and received, JSON decoding and pydantic validation times, and token renewals.
+    Export the metrics with `snapshot` (a JSON friendly dict) or `to_prometheus` (text exposition format).
+
+    ```python
+    metrics = MetricsCollector()
+    client = SyncClient(client_id, client_secret, hooks=[metrics])
+    client.devices.get_all()
+    print(metrics.to_prometheus())
+    ```
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "machineq"):
+        """Initialize the collector.
+
+        Args:
+            buckets: Upper bounds in seconds of the histogram buckets.
+            prefix: Prefix of the Prometheus metric names.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._latency: defaultdict[tuple[str, str], Histogram] = defaultdict(self._histogram)
+        self._outcomes: Counter[tuple[str, str, str]] = Counter()
+        self._retries: Counter[tuple[str, str]] = Counter()
+        self._bytes_sent: Counter[str] = Counter()
+        self._bytes_received: Counter[str] = Counter()
+        self._parse: defaultdict[tuple[str, str], Histogram] = defaultdict(self._histogram)
+        self._auth_refresh = self._histogram()
+        self._auth_errors = 0
+
+    def _histogram(self) -> Histogram:
+        return Histogram(self.buckets)
+
+    def before_request(self, event: RequestEvent) -> None:
+        if event.attempt > 1:
+            with self._lock:
+                self._retries[event.resource, event.method] += 1
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._record(event, str(event.response.status_code) if event.response is not None else "")
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event, type(event.error).__name__)
+
+    def _record(self, event: RequestEvent, outcome: str) -> None:
+        key = (event.resource, event.method)
+        with self._lock:
+            self._latency[key].observe(event.elapsed or 0.0)
+            self._outcomes[(*key, outcome)] += 1
+            self._bytes_sent[event.resource] += event.request_bytes
+            self._bytes_received[event.resource] += event.response_bytes
+
+    def on_parse(self, resource: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._parse[resource, stage].observe(seconds)
+
+    def on_auth_refresh(self, seconds: float, error: Exception | None = None) -> None:
+        with self._lock:
+            self._auth_refresh.observe(seconds)
+            if error is not None:
+                self._auth_errors += 1
+
+    def reset(self) -> None:
+        """Forget all the metrics collected so far"""
+        with self._lock:
+            self._latency.clear()
+            self._outcomes.clear()
+            self._retries.clear()
+            self._bytes_sent.clear()
+            self._bytes_received.clear()
+            self._parse.clear()
+            self._auth_refresh = self._histogram()
+            self._auth_errors = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the metrics as a dict of plain values, with requests keyed by `"METHOD /resource"`"""
+        with self._lock:
+            outcomes: dict[str, dict[str, int]] = {}
+            for (resource, method, outcome), count in self._outcomes.items():
+                outcomes.setdefault(f"{method} {resource}", {})[outcome] = count
+            return {
+                "latency": {f"{method} {resource}": h.to_dict() for (resource, method), h in self._latency.items()},
+                "outcomes": outcomes,
+                "retries": {f"{method} {resource}": count for (resource, method), count in self._retries.items()},
+                "bytes_sent": dict(self._bytes_sent),
+                "bytes_received": dict(self._bytes_received),
+                "parse": {f"{stage} {resource}": h.to_dict() for (resource, stage), h in self._parse.items()},
+                "auth_refresh": {**self._auth_refresh.to_dict(), "errors": self._auth_errors},
+            }
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format"""
+        lines: list[str] = []
+        p = self.prefix
+        with self._lock:
+            self._write_histograms(
+                lines,
+                f"{p}_request_duration_seconds",
+                "Duration of API request attempts until the response headers are received.",
+                {_labels(resource=r, method=m): h for (r, m), h in self._latency.items()},
+            )
+            self._write_counters(
+                lines,
+                f"{p}_requests_total",
+                "API request attempts by HTTP status code or transport error.",
+                {_labels(resource=r, method=m, outcome=o): c for (r, m, o), c in self._outcomes.items()},
+            )
+            self._write_counters(
+                lines,
+                f"{p}_retries_total",
+                "Retried API request attempts.",
+                {_labels(resource=r, method=m): c for (r, m), c in self._retries.items()},
+            )
+            self._write_counters(
+                lines,
+                f"{p}_request_bytes_total",
+                "Bytes of request bodies sent.",
+                {_labels(resource=r): c for r, c in self._bytes_sent.items()},
+            )
+            self._write_counters(
+                lines,
+                f"{p}_response_bytes_total",
+                "Bytes of response bodies received.",
+                {_labels(resource=r): c for r, c in self._bytes_received.items()},
+            )
+            self._write_histograms(
+                lines,
+                f"{p}_parse_duration_seconds",
+                "Duration of JSON decoding and pydantic validation of response bodies.",
+                {_labels(resource=r, stage=s): h for (r, s), h in self._parse.items()},
+            )
+            self._write_histograms(
+                lines,
+                f"{p}_auth_refresh_duration_seconds",
+                "Duration of access token requests.",
+                {"": self._auth_refresh},
+            )
+            self._write_counters(
+                lines, f"{p}_auth_refresh_errors_total", "Failed access token requests.", {"": self._auth_errors}
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_counters(lines: list[str], name: str, help_text: str, values: dict[str, int]) -> None:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [f"{name}{{{labels}}} {value}" if labels else f"{name} {value}" for labels, value in values.items()]
+
+    @staticmethod
+    def _write_histograms(lines: list[str], name: str, help_text: str, values: dict[str, Histogram]) -> None:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for labels, histogram in values.items():
+            prefix = f"{labels}," if labels else ""
+            for bound, count in histogram.cumulative().items():
+                lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {count}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines += [f"{name}_sum{suffix} {histogram.sum}", f"{name}_count{suffix} {histogram.count}"]
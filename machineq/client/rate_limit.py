@@ -0,0 +1,116 @@
+"""Client-side token bucket rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket parameters"""
+
+    rate: float
+    """Sustained number of requests per second"""
+    burst: int = 1
+    """Number of requests that can be sent at once after a quiet period"""
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")  # noqa: TRY003
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")  # noqa: TRY003
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit):
+        self.rate = limit.rate
+        self.capacity = limit.burst
+        self.tokens = float(limit.burst)
+        self.updated_at = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Take a token, returning how long the caller has to wait for it to be available.
+        Tokens may go negative, so that waiting callers are served in order."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class _BaseRateLimiter:
+    def __init__(
+        self,
+        global_limit: RateLimit | None = None,
+        family_limits: dict[str, RateLimit] | None = None,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            global_limit: Limit shared by all requests of the client.
+            family_limits: Limits per endpoint family, keyed by resource base path (e.g. `"/logs"`, `"/devices"`).
+                A request has to satisfy both the global limit and the limit of its family.
+        """
+        self._global = _TokenBucket(global_limit) if global_limit is not None else None
+        self._families = {family: _TokenBucket(limit) for family, limit in (family_limits or {}).items()}
+
+        self.throttled = 0
+        """Number of requests that had to wait"""
+        self.total_wait_s = 0.0
+        """Total time spent waiting, in seconds"""
+
+    def _reserve(self, family: str) -> float:
+        now = time.monotonic()
+        delay = 0.0
+        if self._global is not None:
+            delay = self._global.reserve(now)
+        bucket = self._families.get(family)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve(now))
+        if delay > 0:
+            self.throttled += 1
+            self.total_wait_s += delay
+        return delay
+
+
+class RateLimiter(_BaseRateLimiter):
+    """Thread-safe token bucket rate limiter for `SyncClient`.
+
+    ```python
+    limiter = RateLimiter(RateLimit(rate=20, burst=5), {"/logs": RateLimit(rate=2)})
+    client = SyncClient(client_id, client_secret, rate_limiter=limiter)
+    ```
+    """
+
+    def __init__(
+        self,
+        global_limit: RateLimit | None = None,
+        family_limits: dict[str, RateLimit] | None = None,
+    ):
+        super().__init__(global_limit, family_limits)
+        self._lock = threading.Lock()
+
+    def acquire(self, family: str) -> None:
+        """Block until a request of the given endpoint family is allowed"""
+        with self._lock:
+            delay = self._reserve(family)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter(_BaseRateLimiter):
+    """Token bucket rate limiter for `AsyncClient`, waiting with `asyncio.sleep`.
+
+    ```python
+    limiter = AsyncRateLimiter(RateLimit(rate=20, burst=5), {"/logs": RateLimit(rate=2)})
+    client = AsyncClient(client_id, client_secret, rate_limiter=limiter)
+    ```
+    """
+
+    async def acquire(self, family: str) -> None:
+        """Wait until a request of the given endpoint family is allowed"""
+        delay = self._reserve(family)
+        if delay > 0:
+            await asyncio.sleep(delay)
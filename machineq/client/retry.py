@@ -0,0 +1,113 @@
+"""Retry policy for transient API failures."""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy shared by all resources of a client.
+
+    Failed requests are retried with jittered exponential backoff (`backoff_base * 2 ** (attempt - 1)`,
+    capped at `backoff_max`). When the server sends a `Retry-After` header, it is honored instead,
+    unless it asks to wait longer than `max_retry_after`, in which case the error is raised right away.
+    Only idempotent methods are retried by default. Use `RetryPolicy(max_attempts=1)` to disable retries.
+    """
+
+    max_attempts: int = 3
+    """Total number of attempts, including the first one"""
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 60.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_on_transport_errors: bool = True
+    """Retry on connection errors, timeouts and connection resets"""
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")  # noqa: TRY003
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered ("full jitter") exponential backoff after the given attempt"""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Return how long to wait before retrying, or None if the request should not be retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: number of attempts made so far
+            response: response of the last attempt, if any
+            error: transport error raised by the last attempt, if any
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.retry_methods:
+            return None
+        if error is not None:
+            return self.backoff(attempt) if self.retry_on_transport_errors else None
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+        retry_after = parse_retry_after(response)
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Parse the `Retry-After` header, given either in seconds or as an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryStats:
+    """Counters of the retries taken by a client"""
+
+    retries: int = 0
+    """Number of retries taken"""
+    exhausted: int = 0
+    """Number of requests that still failed after their last retry"""
+    by_reason: Counter[str] = field(default_factory=Counter)
+    """Retries taken, keyed by HTTP status code or transport error name"""
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_retry(self, reason: str) -> None:
+        with self._lock:
+            self.retries += 1
+            self.by_reason[reason] += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
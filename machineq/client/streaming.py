@@ -0,0 +1,169 @@
+"""Incremental parsing of JSON arrays, to decode large responses item by item as they are downloaded."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Collection
+from typing import Any
+
+# characters that can change the parser state outside of the split arrays, everything else
+# is skipped by the regex engine
+_STRUCTURAL = re.compile(r'[\\"{}\[\],:]')
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _WHITESPACE.match(text, pos)
+    return match.end() if match else pos
+
+
+class JsonArrayParser:
+    """Push parser decoding the items of the JSON arrays held under some keys of the top-level object,
+    as the document is fed chunk by chunk.
+
+    Each item is decoded on its own with the C accelerated `json` scanner as soon as it is complete,
+    so memory stays proportional to a single item instead of the whole document. The rest of the
+    document is only scanned for its structure, and never decoded.
+
+    ```python
+    parser = JsonArrayParser(["Devices"])
+    for chunk in response.iter_bytes():
+        for key, item in parser.feed(chunk):
+            yield DeviceInstance.model_validate(item)
+    parser.close()
+    ```
+    """
+
+    def __init__(self, keys: Collection[str]):
+        """Initialize the parser.
+
+        Args:
+            keys: Keys of the top-level object holding the arrays to decode.
+        """
+        self._keys = frozenset(keys)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._depth = 0
+        self._in_string = False
+        self._skip_first = False
+        # key being read, and key whose value is being read, at the top level
+        self._name: list[str] = []
+        self._name_start: int | None = None
+        self._last_name: str | None = None
+        self._current_key: str | None = None
+        # key of the array whose items are being decoded
+        self._array_key = ""
+        self._in_array = False
+
+    def feed(self, chunk: bytes) -> list[tuple[str, Any]]:
+        """Feed the next chunk of the document.
+
+        Returns:
+            The items completed by the chunk, as `(key, item)` pairs.
+        """
+        text = self._buffer + self._text_decoder.decode(chunk)
+        items: list[tuple[str, Any]] = []
+        pos = 0
+        while pos < len(text):
+            if not self._in_array:
+                pos = self._scan(text, pos)
+                continue
+            pos = self._decode_items(text, pos, items)
+            if self._in_array:
+                # the next item is incomplete
+                break
+        self._buffer = text[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the document is complete.
+
+        Raises:
+            ValueError: If the document ended in the middle of a value.
+        """
+        self._text_decoder.decode(b"", final=True)
+        if self._depth or self._in_string or self._buffer.strip():
+            raise ValueError("Truncated JSON document")  # noqa: TRY003
+
+    def _scan(self, text: str, pos: int) -> int:  # noqa: C901
+        """Track the structure of the document until the start of an array to decode, whose position
+        is returned, or the end of the text."""
+        if self._skip_first:
+            self._skip_first = False
+            pos += 1
+        if self._name_start is not None:
+            self._name_start = pos
+        skip_to = pos
+        for match in _STRUCTURAL.finditer(text, pos):
+            pos = match.start()
+            if pos < skip_to:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    # skip the escaped character, which may be the first one of the next chunk
+                    skip_to = pos + 2
+                    self._skip_first = skip_to > len(text)
+                elif char == '"':
+                    self._in_string = False
+                    if self._name_start is not None:
+                        self._name.append(text[self._name_start : pos])
+                        self._last_name = "".join(self._name)
+                        self._name_start = None
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._current_key is None:
+                    self._name.clear()
+                    self._name_start = pos + 1
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._is_decoded(self._depth):
+                    self._in_array = True
+                    return pos + 1
+            elif char in "}]":
+                self._depth -= 1
+            elif char == ",":
+                if self._depth == 1:
+                    self._current_key = None
+            elif char == ":" and self._depth == 1:
+                self._current_key = self._last_name
+        if self._name_start is not None:
+            self._name.append(text[self._name_start :])
+        return len(text)
+
+    def _is_decoded(self, depth: int) -> bool:
+        # arrays are decoded when they are the value of one of the keys of the top-level object
+        if depth != 2 or self._current_key is None or self._current_key not in self._keys:
+            return False
+        self._array_key = self._current_key
+        return True
+
+    def _decode_items(self, text: str, pos: int, items: list[tuple[str, Any]]) -> int:
+        """Decode the complete items of the current array, returning the position of the first
+        incomplete one, or the position following the end of the array."""
+        while True:
+            pos = _skip_whitespace(text, pos)
+            if pos == len(text):
+                return pos
+            char = text[pos]
+            if char == "]":
+                self._in_array = False
+                self._depth -= 1
+                return pos + 1
+            if char == ",":
+                pos += 1
+                continue
+            try:
+                item, end = _decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                return pos
+            if not isinstance(item, (dict, list, str)):
+                # a number may continue in the next chunk, wait until it is followed by a separator
+                after = _skip_whitespace(text, end)
+                if after == len(text) or text[after] not in ",]":
+                    return pos
+            items.append((self._array_key, item))
+            pos = end
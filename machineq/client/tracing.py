@@ -0,0 +1,187 @@
+"""Optional OpenTelemetry spans around API calls."""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import re
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
+
+from machineq.utils import __version__
+
+from .exceptions import APIError
+
+try:
+    from opentelemetry import trace  # ty:ignore[unresolved-import]
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+
+if TYPE_CHECKING:
+    from .base import BaseResource
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current_call: contextvars.ContextVar[TracedCall | None] = contextvars.ContextVar("machineq_traced_call", default=None)
+
+
+def current_call() -> TracedCall | None:
+    """Return the traced API call running in the current context, if any"""
+    return _current_call.get()
+
+
+@dataclass
+class TracedCall:
+    """Data recorded on the span of an API call while its requests are sent"""
+
+    span: Any
+    arguments: dict[str, str]
+    """Names of the string arguments of the call, keyed by value, to build URL templates"""
+    url_template: str | None = None
+    method: str | None = None
+    status_code: int | None = None
+    requests: int = 0
+    retries: int = 0
+    token_wait: float = 0.0
+    """Seconds spent waiting for an access token"""
+
+    def record_request(self, request: httpx.Request, attempt: int, token_wait: float) -> None:
+        """Record an attempt about to be sent"""
+        self.requests += 1
+        if attempt > 1:
+            self.retries += 1
+        self.token_wait += token_wait
+        if self.url_template is None:
+            self.method = request.method
+            self.url_template = "/".join(
+                f"{{{self.arguments[segment]}}}" if segment in self.arguments else segment
+                for segment in request.url.path.split("/")
+            )
+
+    def record_response(self, response: httpx.Response) -> None:
+        self.status_code = response.status_code
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Set the recorded attributes, and the error status if the call failed"""
+        attributes: dict[str, Any] = {
+            "machineq.request_count": self.requests,
+            "machineq.token_wait_seconds": self.token_wait,
+            "http.request.resend_count": self.retries,
+        }
+        if self.method is not None:
+            attributes["http.request.method"] = self.method
+        if self.url_template is not None:
+            attributes["url.template"] = self.url_template
+        if self.status_code is not None:
+            attributes["http.response.status_code"] = self.status_code
+        if error is not None:
+            attributes["error.type"] = type(error).__qualname__
+            if isinstance(error, APIError) and error.code is not None:
+                attributes["machineq.error_code"] = error.code
+        self.span.set_attributes(attributes)
+        if error is not None and trace is not None:
+            self.span.record_exception(error)
+            self.span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+
+
+class Tracing:
+    """OpenTelemetry tracing of the API calls of a client.
+
+    Each public resource method call (e.g. `client.devices.get_payloads(...)`) gets a client span named
+    after it (`"devices.get_payloads"`), holding the HTTP method, URL template, status code, gRPC error code,
+    number of retries and time spent waiting for the access token. Spans are children of the current span,
+    and since the OpenTelemetry context follows coroutines, calls made from concurrent `AsyncClient` tasks
+    are attached to the span of the task that created them. Iterators (e.g. `iter_all`) are not traced.
+
+    Requires `opentelemetry-api` (`pip install machineq[otel]`). When it is not installed, tracing is a no-op.
+
+    ```python
+    client = AsyncClient(client_id, client_secret, tracing=Tracing())
+    ```
+    """
+
+    def __init__(self, tracer_provider: Any = None):  # noqa: ANN401
+        """Initialize tracing.
+
+        Args:
+            tracer_provider: OpenTelemetry tracer provider to use (default: the global one).
+        """
+        self.tracer = (
+            trace.get_tracer("machineq", __version__, tracer_provider=tracer_provider) if trace is not None else None
+        )
+
+    @contextmanager
+    def call(self, name: str, arguments: Mapping[str, Any]) -> Iterator[TracedCall | None]:
+        """Run an API call in a span, made current for the requests it sends"""
+        if self.tracer is None or trace is None:
+            yield None
+            return
+        with self.tracer.start_as_current_span(
+            name, kind=trace.SpanKind.CLIENT, record_exception=False, set_status_on_exception=False
+        ) as span:
+            traced = TracedCall(span, {v: k for k, v in arguments.items() if isinstance(v, str) and v})
+            token = _current_call.set(traced)
+            try:
+                yield traced
+            except BaseException as e:
+                traced.finish(e)
+                raise
+            else:
+                traced.finish()
+            finally:
+                _current_call.reset(token)
+
+
+def _resource_name(class_name: str) -> str:
+    """Client attribute of a resource class, e.g. `SyncRFRegions` -> `rf_regions`"""
+    name = re.sub(r"^(Sync|Async)", "", class_name)
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).lower()
+
+
+def traced(name: str, func: F) -> F:
+    """Wrap a resource method so that its calls are traced when the client has tracing enabled"""
+    signature = inspect.signature(func)
+
+    def arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Mapping[str, Any]:
+        try:
+            return signature.bind(*args, **kwargs).arguments
+        except TypeError:
+            return {}
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: BaseResource, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            tracing = self.client.tracing
+            if tracing is None:
+                return await func(self, *args, **kwargs)
+            with tracing.call(name, arguments((self, *args), kwargs)):
+                return await func(self, *args, **kwargs)
+
+        return async_wrapper  # ty:ignore[invalid-return-type]
+
+    @functools.wraps(func)
+    def wrapper(self: BaseResource, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        tracing = self.client.tracing
+        if tracing is None:
+            return func(self, *args, **kwargs)
+        with tracing.call(name, arguments((self, *args), kwargs)):
+            return func(self, *args, **kwargs)
+
+    return wrapper  # ty:ignore[invalid-return-type]
+
+
+def trace_resource_methods(cls: type) -> None:
+    """Wrap the public methods of a resource class with `traced`, except iterators"""
+    resource = _resource_name(cls.__name__)
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attr):
+            continue
+        if inspect.isgeneratorfunction(attr) or inspect.isasyncgenfunction(attr):
+            continue
+        setattr(cls, name, traced(f"{resource}.{name}", attr))
@@ -28,9 +28,8 @@ class SyncAccount(BaseResource["SyncClient"]):
             AccountResponse: The current user's account details.
         """
         url = self._build_url()
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return AccountResponse(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, AccountResponse)
 
     def get_permissions(self) -> AccountPermissionResponse:
         """Retrieve the current user's permissions.
@@ -39,9 +38,8 @@ class SyncAccount(BaseResource["SyncClient"]):
             AccountPermissionResponse: The current user's permission details.
         """
         url = self._build_url("permissions")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return AccountPermissionResponse(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, AccountPermissionResponse)
 
 
 class AsyncAccount(BaseResource["AsyncClient"]):
@@ -57,9 +55,8 @@ class AsyncAccount(BaseResource["AsyncClient"]):
             AccountResponse: The current user's account details.
         """
         url = self._build_url()
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return AccountResponse(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, AccountResponse)
 
     async def get_permissions(self) -> AccountPermissionResponse:
         """Retrieve the current user's permissions.
@@ -68,6 +65,5 @@ class AsyncAccount(BaseResource["AsyncClient"]):
             AccountPermissionResponse: The current user's permission details.
         """
         url = self._build_url("permissions")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return AccountPermissionResponse(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, AccountPermissionResponse)
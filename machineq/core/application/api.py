@@ -33,8 +33,7 @@ class SyncApplications(BaseResource["SyncClient"]):
         Returns:
             list[ApplicationInstance]: List of all application instances.
         """
-        data = super()._get_all_generic()
-        return ApplicationResponse(**data).applications
+        return super()._get_all_generic(ApplicationResponse).applications
 
     def get(self, application_id: str) -> ApplicationInstance:
         """Retrieve an application by its ID.
@@ -46,9 +45,8 @@ class SyncApplications(BaseResource["SyncClient"]):
             ApplicationInstance: The application instance matching the given ID.
         """
         url = self._build_url(f"{application_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return ApplicationInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, ApplicationInstance)
 
     def create(self, data: ApplicationCreate) -> ApplicationCreateResponse:
         """Create a new application.
@@ -60,13 +58,12 @@ class SyncApplications(BaseResource["SyncClient"]):
             str: The ID of the newly created application.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return ApplicationCreateResponse(**result)
+        return self._parse_model(response, ApplicationCreateResponse)
 
     def update(self, application_id: str, data: ApplicationUpdate) -> bool:
         """Update an application (full replacement).
@@ -79,13 +76,12 @@ class SyncApplications(BaseResource["SyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{application_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, application_id: str, data: ApplicationPatch) -> bool:
         """Partially update an application.
@@ -98,13 +94,12 @@ class SyncApplications(BaseResource["SyncClient"]):
             bool: True if the patch was successful, False otherwise.
         """
         url = self._build_url(f"{application_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, application_id: str) -> None:
         """Delete an application.
@@ -116,7 +111,7 @@ class SyncApplications(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{application_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
     def refresh_token(self, application_id: str) -> str:
@@ -129,13 +124,12 @@ class SyncApplications(BaseResource["SyncClient"]):
             str: The new client secret.
         """
         url = self._build_url(f"{application_id}/refreshToken")
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content="{}",
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return RefreshApplicationResponse(**data).client_secret
+        return self._parse_model(response, RefreshApplicationResponse).client_secret
 
 
 class AsyncApplications(BaseResource["AsyncClient"]):
@@ -150,8 +144,7 @@ class AsyncApplications(BaseResource["AsyncClient"]):
         Returns:
             list[ApplicationInstance]: List of all application instances.
         """
-        data = await super()._get_all_generic_async()
-        return ApplicationResponse(**data).applications
+        return (await super()._get_all_generic_async(ApplicationResponse)).applications
 
     async def get(self, application_id: str) -> ApplicationInstance:
         """Retrieve an application by its ID.
@@ -163,9 +156,8 @@ class AsyncApplications(BaseResource["AsyncClient"]):
             ApplicationInstance: The application instance matching the given ID.
         """
         url = self._build_url(f"{application_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return ApplicationInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, ApplicationInstance)
 
     async def create(self, data: ApplicationCreate) -> ApplicationCreateResponse:
         """Create a new application.
@@ -177,13 +169,12 @@ class AsyncApplications(BaseResource["AsyncClient"]):
             str: The ID of the newly created application.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return ApplicationCreateResponse(**result)
+        return self._parse_model(response, ApplicationCreateResponse)
 
     async def update(self, application_id: str, data: ApplicationUpdate) -> bool:
         """Update an application (full replacement).
@@ -196,13 +187,12 @@ class AsyncApplications(BaseResource["AsyncClient"]):
             bool: True if the update was successful.
         """
         url = self._build_url(f"{application_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, application_id: str, data: ApplicationPatch) -> bool:
         """Partially update an application.
@@ -215,13 +205,12 @@ class AsyncApplications(BaseResource["AsyncClient"]):
             bool: True if the patch was successful.
         """
         url = self._build_url(f"{application_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, application_id: str) -> None:
         """Delete an application.
@@ -233,7 +222,7 @@ class AsyncApplications(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{application_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
 
     async def refresh_token(self, application_id: str) -> str:
@@ -246,10 +235,9 @@ class AsyncApplications(BaseResource["AsyncClient"]):
             RefreshApplicationResponse: The new token and related information.
         """
         url = self._build_url(f"{application_id}/refreshToken")
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content="{}",
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return RefreshApplicationResponse(**data).client_secret
+        return self._parse_model(response, RefreshApplicationResponse).client_secret
@@ -0,0 +1,114 @@
+"""Helpers for bulk operations: bounded concurrent execution and resumable checkpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+R = TypeVar("R")
+M = TypeVar("M", bound=BaseModel)
+
+
+async def run_concurrently(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """Run `func` on every item with at most `concurrency` calls in flight.
+
+    Items are consumed lazily, so the input can be a generator over a large source,
+    and results are yielded in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")  # noqa: TRY003
+    pending: set[asyncio.Future[R]] = set()
+    done: set[asyncio.Future[R]] = set()
+    try:
+        for item in items:
+            pending.add(asyncio.ensure_future(func(item)))
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                while done:
+                    yield done.pop().result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            while done:
+                yield done.pop().result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # also retrieve the results that were not consumed because of an error or an early exit
+        await asyncio.gather(*pending, *done, return_exceptions=True)
+
+
+def run_in_threads(
+    items: Iterable[T],
+    func: Callable[[T], R],
+    concurrency: int,
+) -> Iterator[R]:
+    """Run `func` on every item in a thread pool with at most `concurrency` calls in flight.
+
+    This is the blocking counterpart of `run_concurrently`, for the sync client: items are consumed
+    lazily and results are yielded in completion order. Calls run in a copy of the caller's context,
+    so that their tracing spans are children of the caller's.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")  # noqa: TRY003
+
+    def call(context: contextvars.Context, item: T) -> R:
+        return context.run(func, item)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="machineq-bulk") as executor:
+        pending: set[Future[R]] = set()
+        try:
+            for item in items:
+                pending.add(executor.submit(call, contextvars.copy_context(), item))
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            # calls that have not started yet are dropped, running ones are waited for on exit
+            for future in pending:
+                future.cancel()
+
+
+class BulkCheckpoint:
+    """Append-only JSON lines file recording the outcome of each item of a bulk operation,
+    so that an interrupted run can be resumed without redoing the completed items."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+
+    def load(self, model: type[M]) -> list[M]:
+        """Return the results recorded so far. A truncated last line (e.g. after a crash) is ignored."""
+        if not self.path.exists():
+            return []
+        results = []
+        with self.path.open() as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    results.append(model.model_validate_json(line))
+                except ValueError:
+                    continue
+        return results
+
+    def append(self, result: BaseModel) -> None:
+        """Record the result of an item"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as f:
+            f.write(result.model_dump_json(by_alias=True) + "\n")
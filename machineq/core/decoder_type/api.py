@@ -27,8 +27,7 @@ class SyncDecoderTypes(BaseResource["SyncClient"]):
         Returns:
             list[DecoderTypeInstance]: List of all decoder type instances.
         """
-        data = super()._get_all_generic()
-        return DecoderTypeResponse(**data).decoder_types
+        return super()._get_all_generic(DecoderTypeResponse).decoder_types
 
     def get(self, decoder_id: str) -> DecoderTypeInstance:
         """Retrieve a decoder type by its ID.
@@ -40,9 +39,8 @@ class SyncDecoderTypes(BaseResource["SyncClient"]):
             DecoderTypeInstance: The decoder type instance matching the given ID.
         """
         url = self._build_url(f"{decoder_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DecoderTypeInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, DecoderTypeInstance)
 
 
 class AsyncDecoderTypes(BaseResource["AsyncClient"]):
@@ -57,8 +55,7 @@ class AsyncDecoderTypes(BaseResource["AsyncClient"]):
         Returns:
             list[DecoderTypeInstance]: List of all decoder type instances.
         """
-        data = await super()._get_all_generic_async()
-        return DecoderTypeResponse(**data).decoder_types
+        return (await super()._get_all_generic_async(DecoderTypeResponse)).decoder_types
 
     async def get(self, decoder_id: str) -> DecoderTypeInstance:
         """Retrieve a decoder type by its ID.
@@ -70,6 +67,5 @@ class AsyncDecoderTypes(BaseResource["AsyncClient"]):
             DecoderTypeInstance: The decoder type instance matching the given ID.
         """
         url = self._build_url(f"{decoder_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DecoderTypeInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, DecoderTypeInstance)
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+import httpx
 
 from machineq.client.base import BaseResource
+from machineq.client.exceptions import APIError
+from machineq.core.bulk import BulkCheckpoint, run_concurrently, run_in_threads
 from machineq.core.device import DevicePayload
+from machineq.core.device.harvest import AsyncPayloadHarvester, PayloadHarvester
 from machineq.core.device.models import (
+    CreateDevicesResponse,
+    DeleteDevicesResponse,
     DeviceCreate,
     DeviceCreateResponse,
     DeviceInstance,
@@ -19,7 +28,8 @@ from machineq.core.device.models import (
     DevicesHealthResponse,
     DeviceUpdate,
 )
-from machineq.core.shared.models import CommonOKResponse
+from machineq.core.device.watermarks import PayloadWatermarks
+from machineq.core.shared.models import CommonOKResponse, LazyList, projection
 from machineq.core.utils import ensure_utc_and_str
 
 if TYPE_CHECKING:
@@ -33,14 +43,38 @@ class SyncDevices(BaseResource["SyncClient"]):
     def __init__(self, client: SyncClient):
         super().__init__(client, "/devices")
 
-    def get_all(self) -> list[DeviceInstance]:
+    @overload
+    def get_all(self, lazy: Literal[False] = False) -> list[DeviceInstance]: ...
+
+    @overload
+    def get_all(self, lazy: Literal[True]) -> LazyList[DeviceInstance]: ...
+
+    def get_all(self, lazy: bool = False) -> list[DeviceInstance] | LazyList[DeviceInstance]:
         """List all devices.
 
+        Args:
+            lazy: Return a `LazyList` that validates each device on first access, instead of validating
+                all of them upfront. Saves time and memory on large fleets when only some devices are used.
+
         Returns:
             list[DeviceInstance]: List of all device instances.
         """
-        data = super()._get_all_generic()
-        return DeviceResponse(**data).devices
+        response = self._request("GET", self._build_url())
+        if lazy:
+            return LazyList(DeviceInstance, self._parse_response(response).get("Devices") or [])
+        return self._parse_model(response, DeviceResponse).devices
+
+    def iter_all(self) -> Iterator[DeviceInstance]:
+        """Iterate over all devices, validating each one as the response is downloaded.
+
+        Unlike `get_all`, neither the whole response nor the list of devices is held in memory, which keeps
+        memory usage flat on very large fleets. Responses are not cached.
+
+        Yields:
+            DeviceInstance: Devices in the order returned by the API.
+        """
+        for _, device in self._stream_items(self._build_url(), DeviceResponse, DeviceInstance):
+            yield device
 
     def get(self, deveui: str) -> DeviceInstance:
         """Retrieve a device by its DevEUI.
@@ -52,9 +86,8 @@ class SyncDevices(BaseResource["SyncClient"]):
             DeviceInstance: The device instance matching the given DevEUI.
         """
         url = self._build_url(f"{deveui}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DeviceInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, DeviceInstance)
 
     def create(self, data: DeviceCreate) -> str:
         """Create a new device.
@@ -66,13 +99,12 @@ class SyncDevices(BaseResource["SyncClient"]):
             str: The DevEUI of the newly created device.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return DeviceCreateResponse(**result).id
+        return self._parse_model(response, DeviceCreateResponse).id
 
     def update(self, deveui: str, data: DeviceUpdate) -> bool:
         """Update a device (full replacement).
@@ -85,13 +117,12 @@ class SyncDevices(BaseResource["SyncClient"]):
             DeviceInstance: The updated device instance.
         """
         url = self._build_url(f"{deveui}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, deveui: str, data: DevicePatch) -> bool:
         """Partially update a device.
@@ -104,13 +135,12 @@ class SyncDevices(BaseResource["SyncClient"]):
             DeviceInstance: The updated device instance.
         """
         url = self._build_url(f"{deveui}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, deveui: str) -> None:
         """Delete a device.
@@ -122,9 +152,58 @@ class SyncDevices(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{deveui}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
+    def delete_many(self, deveuis: Iterable[str], concurrency: int = 10) -> list[DeleteDevicesResponse]:
+        """Delete many devices concurrently, using a thread pool.
+
+        A failed deletion does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            deveuis: The EUIs of the devices to delete.
+            concurrency: Maximum number of deletions in flight.
+
+        Returns:
+            list[DeleteDevicesResponse]: The outcome for each device, in completion order.
+        """
+
+        def delete_one(deveui: str) -> DeleteDevicesResponse:
+            try:
+                self.delete(deveui)
+            except (APIError, httpx.HTTPError) as e:
+                return DeleteDevicesResponse(response=False, deveui=deveui, error=str(e))
+            return DeleteDevicesResponse(response=True, deveui=deveui, error="")
+
+        return list(run_in_threads(deveuis, delete_one, concurrency))
+
+    def patch_many(
+        self,
+        patches: Mapping[str, DevicePatch],
+        concurrency: int = 10,
+    ) -> list[DeleteDevicesResponse]:
+        """Partially update many devices concurrently, using a thread pool.
+
+        A failed update does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            patches: The partial data to apply, keyed by device EUI.
+            concurrency: Maximum number of updates in flight.
+
+        Returns:
+            list[DeleteDevicesResponse]: The outcome for each device, in completion order.
+        """
+
+        def patch_one(item: tuple[str, DevicePatch]) -> DeleteDevicesResponse:
+            deveui, data = item
+            try:
+                ok = self.patch(deveui, data)
+            except (APIError, httpx.HTTPError) as e:
+                return DeleteDevicesResponse(response=False, deveui=deveui, error=str(e))
+            return DeleteDevicesResponse(response=ok, deveui=deveui, error="")
+
+        return list(run_in_threads(patches.items(), patch_one, concurrency))
+
     def send_message(self, deveui: str, data: DeviceMessage) -> bool:
         """Send a downstream message to a device.For class A device the message will be put in a
         queue on the Network Server side and sent in the next downlink opportunity (after the next uplink).
@@ -138,13 +217,12 @@ class SyncDevices(BaseResource["SyncClient"]):
             bool: True if the message was queued. Exception otherwise.
         """
         url = self._build_url(f"{deveui}/message")
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return CommonOKResponse(**data).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def get_payloads(
         self,
@@ -170,24 +248,77 @@ class SyncDevices(BaseResource["SyncClient"]):
             params["EndTime"] = ensure_utc_and_str(end_time)
         if start_time is not None and end_time is not None and end_time < start_time:
             raise ValueError("The end time cannot come before start time")  # noqa: TRY003
-        response = self.client.http_client.get(
+        response = self._request(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return DevicePayloadResponse(**data).payloads
+        return self._parse_model(response, DevicePayloadResponse).payloads
+
+    def harvest_payloads(
+        self,
+        deveuis: Iterable[str] | None = None,
+        group_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        concurrency: int = 10,
+        watermarks: PayloadWatermarks | None = None,
+    ) -> PayloadHarvester:
+        """Retrieve the payloads of many devices within a time range, calling `get_payloads` from a thread pool.
+        See `PayloadHarvester`.
+
+        A device whose payloads cannot be retrieved does not stop the others, its error is recorded in the
+        `failures` of the harvester.
+
+        Args:
+            deveuis: The EUIs of the devices, consumed lazily. Exclusive with `group_id`.
+            group_id: The device group whose devices are harvested. Exclusive with `deveuis`.
+            start_time: Optional start time.
+            end_time: Optional end time.
+            concurrency: Maximum number of requests in flight.
+            watermarks: Optional high-water marks persisted across runs, to only retrieve the payloads
+                newer than those retrieved before (see `PayloadWatermarks`).
 
-    def get_health(self) -> DevicesHealthResponse:
+        Returns:
+            PayloadHarvester: Iterable of `(deveui, payload)` pairs, in device completion order.
+        """
+        return PayloadHarvester(self, deveuis, group_id, start_time, end_time, concurrency, watermarks)
+
+    @overload
+    def get_health(self, fields: None = None) -> DevicesHealthResponse: ...
+
+    @overload
+    def get_health(self, fields: Sequence[str]) -> dict[str, list[Any]]: ...
+
+    def get_health(self, fields: Sequence[str] | None = None) -> DevicesHealthResponse | dict[str, list[Any]]:
         """Retrieve devices grouped by health status.
 
+        Args:
+            fields: Optional `DeviceInstance` fields to keep, e.g. `("deveui", "name", "last_uplink")`.
+                The devices are then returned as compact named tuples holding only these fields,
+                and the other fields are not validated.
+
         Returns:
-            DevicesHealthResponse: Devices grouped by their health status.
+            DevicesHealthResponse: Devices grouped by their health status. With `fields`, a dict of
+                records per group, keyed by group name (e.g. `"good"`).
         """
         url = self._build_url("health")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DevicesHealthResponse(**data)
+        response = self._request("GET", url)
+        if fields is not None:
+            return projection(DeviceInstance, tuple(fields)).project_groups(
+                DevicesHealthResponse, self._parse_response(response)
+            )
+        return self._parse_model(response, DevicesHealthResponse)
+
+    def iter_health(self) -> Iterator[tuple[str, DeviceInstance]]:
+        """Iterate over devices grouped by health status, validating each one as the response is downloaded.
+        See `iter_all`.
+
+        Yields:
+            tuple[str, DeviceInstance]: Pairs of health status, as field name of `DevicesHealthResponse`
+                (e.g. `"offline"`), and device.
+        """
+        yield from self._stream_items(self._build_url("health"), DevicesHealthResponse, DeviceInstance)
 
     def get_health_count(self) -> DevicesHealthCountResponse:
         """Retrieve device count grouped by health status.
@@ -196,9 +327,8 @@ class SyncDevices(BaseResource["SyncClient"]):
             DevicesHealthCountResponse: Device counts grouped by health status.
         """
         url = self._build_url("healthcount")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DevicesHealthCountResponse(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, DevicesHealthCountResponse)
 
 
 class AsyncDevices(BaseResource["AsyncClient"]):
@@ -207,14 +337,38 @@ class AsyncDevices(BaseResource["AsyncClient"]):
     def __init__(self, client: AsyncClient):
         super().__init__(client, "/devices")
 
-    async def get_all(self) -> list[DeviceInstance]:
+    @overload
+    async def get_all(self, lazy: Literal[False] = False) -> list[DeviceInstance]: ...
+
+    @overload
+    async def get_all(self, lazy: Literal[True]) -> LazyList[DeviceInstance]: ...
+
+    async def get_all(self, lazy: bool = False) -> list[DeviceInstance] | LazyList[DeviceInstance]:
         """List all devices.
 
+        Args:
+            lazy: Return a `LazyList` that validates each device on first access, instead of validating
+                all of them upfront. Saves time and memory on large fleets when only some devices are used.
+
         Returns:
             list[DeviceInstance]: All device instances with response metadata.
         """
-        data = await super()._get_all_generic_async()
-        return DeviceResponse(**data).devices
+        response = await self._request_async("GET", self._build_url())
+        if lazy:
+            return LazyList(DeviceInstance, self._parse_response(response).get("Devices") or [])
+        return self._parse_model(response, DeviceResponse).devices
+
+    async def aiter_all(self) -> AsyncIterator[DeviceInstance]:
+        """Iterate over all devices, validating each one as the response is downloaded.
+
+        Unlike `get_all`, neither the whole response nor the list of devices is held in memory, which keeps
+        memory usage flat on very large fleets. Responses are not cached.
+
+        Yields:
+            DeviceInstance: Devices in the order returned by the API.
+        """
+        async for _, device in self._stream_items_async(self._build_url(), DeviceResponse, DeviceInstance):
+            yield device
 
     async def get(self, deveui: str) -> DeviceInstance:
         """Retrieve a device by its DevEUI.
@@ -226,9 +380,8 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             DeviceInstance: The device instance matching the given DevEUI.
         """
         url = self._build_url(f"{deveui}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DeviceInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, DeviceInstance)
 
     async def create(self, data: DeviceCreate) -> str:
         """Create a new device.
@@ -240,13 +393,58 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             str: The DevEUI of the newly created device.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return DeviceCreateResponse(**result).id
+        return self._parse_model(response, DeviceCreateResponse).id
+
+    async def create_many(
+        self,
+        devices: Iterable[DeviceCreate],
+        concurrency: int = 10,
+        checkpoint: str | os.PathLike[str] | None = None,
+    ) -> list[CreateDevicesResponse]:
+        """Create many devices concurrently.
+
+        The input is consumed lazily, so it can be a generator over a large source. A failed creation
+        does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            devices: The devices to create.
+            concurrency: Maximum number of creations in flight.
+            checkpoint: Optional path of a JSON lines file where each outcome is recorded as soon as it
+                is known. When the file already exists, devices recorded as created are skipped, so an
+                interrupted run can be resumed by calling this method again with the same arguments.
+
+        Returns:
+            list[CreateDevicesResponse]: The outcome for each device, in completion order. Devices
+                skipped thanks to the checkpoint are reported with their recorded outcome.
+        """
+        log = BulkCheckpoint(checkpoint) if checkpoint is not None else None
+        created = {r.deveui: r for r in log.load(CreateDevicesResponse) if r.response} if log else {}
+        results = []
+
+        def pending() -> Iterable[DeviceCreate]:
+            for device in devices:
+                if device.deveui in created:
+                    results.append(created[device.deveui])
+                else:
+                    yield device
+
+        async def create_one(device: DeviceCreate) -> CreateDevicesResponse:
+            try:
+                device_id = await self.create(device)
+            except (APIError, httpx.HTTPError) as e:
+                return CreateDevicesResponse(response=False, deveui=device.deveui, error=str(e), id="")
+            return CreateDevicesResponse(response=True, deveui=device.deveui, error="", id=device_id)
+
+        async for result in run_concurrently(pending(), create_one, concurrency):
+            if log is not None:
+                log.append(result)
+            results.append(result)
+        return results
 
     async def update(self, deveui: str, data: DeviceUpdate) -> bool:
         """Update a device (full replacement).
@@ -259,13 +457,12 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{deveui}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, deveui: str, data: DevicePatch) -> bool:
         """Partially update a device.
@@ -278,13 +475,12 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{deveui}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, deveui: str) -> None:
         """Delete a device.
@@ -296,9 +492,58 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{deveui}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
 
+    async def delete_many(self, deveuis: Iterable[str], concurrency: int = 10) -> list[DeleteDevicesResponse]:
+        """Delete many devices concurrently.
+
+        A failed deletion does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            deveuis: The EUIs of the devices to delete.
+            concurrency: Maximum number of deletions in flight.
+
+        Returns:
+            list[DeleteDevicesResponse]: The outcome for each device, in completion order.
+        """
+
+        async def delete_one(deveui: str) -> DeleteDevicesResponse:
+            try:
+                await self.delete(deveui)
+            except (APIError, httpx.HTTPError) as e:
+                return DeleteDevicesResponse(response=False, deveui=deveui, error=str(e))
+            return DeleteDevicesResponse(response=True, deveui=deveui, error="")
+
+        return [result async for result in run_concurrently(deveuis, delete_one, concurrency)]
+
+    async def patch_many(
+        self,
+        patches: Mapping[str, DevicePatch],
+        concurrency: int = 10,
+    ) -> list[DeleteDevicesResponse]:
+        """Partially update many devices concurrently.
+
+        A failed update does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            patches: The partial data to apply, keyed by device EUI.
+            concurrency: Maximum number of updates in flight.
+
+        Returns:
+            list[DeleteDevicesResponse]: The outcome for each device, in completion order.
+        """
+
+        async def patch_one(item: tuple[str, DevicePatch]) -> DeleteDevicesResponse:
+            deveui, data = item
+            try:
+                ok = await self.patch(deveui, data)
+            except (APIError, httpx.HTTPError) as e:
+                return DeleteDevicesResponse(response=False, deveui=deveui, error=str(e))
+            return DeleteDevicesResponse(response=ok, deveui=deveui, error="")
+
+        return [result async for result in run_concurrently(patches.items(), patch_one, concurrency)]
+
     async def send_message(self, deveui: str, data: DeviceMessage) -> bool:
         """Send a downstream message to a device.For class A device the message will be put in a
         queue on the Network Server side and sent in the next downlink opportunity (after the next uplink).
@@ -312,13 +557,12 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             bool: True if the message was queued. Exception otherwise.
         """
         url = self._build_url(f"{deveui}/message")
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return CommonOKResponse(**data).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def get_payloads(
         self,
@@ -344,24 +588,80 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             params["EndTime"] = ensure_utc_and_str(end_time)
         if start_time is not None and end_time is not None and end_time < start_time:
             raise ValueError("The end time cannot come before start time")  # noqa: TRY003
-        response = await self.client.http_client.get(
+        response = await self._request_async(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return DevicePayloadResponse(**data).payloads
+        return self._parse_model(response, DevicePayloadResponse).payloads
+
+    def harvest_payloads(
+        self,
+        deveuis: Iterable[str] | None = None,
+        group_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        concurrency: int = 10,
+        watermarks: PayloadWatermarks | None = None,
+    ) -> AsyncPayloadHarvester:
+        """Retrieve the payloads of many devices within a time range, calling `get_payloads` concurrently.
+        See `AsyncPayloadHarvester`.
+
+        A device whose payloads cannot be retrieved does not stop the others, its error is recorded in the
+        `failures` of the harvester.
 
-    async def get_health(self) -> DevicesHealthResponse:
+        Args:
+            deveuis: The EUIs of the devices, consumed lazily. Exclusive with `group_id`.
+            group_id: The device group whose devices are harvested. Exclusive with `deveuis`.
+            start_time: Optional start time.
+            end_time: Optional end time.
+            concurrency: Maximum number of requests in flight.
+            watermarks: Optional high-water marks persisted across runs, to only retrieve the payloads
+                newer than those retrieved before (see `PayloadWatermarks`).
+
+        Returns:
+            AsyncPayloadHarvester: Async iterable of `(deveui, payload)` pairs, in device completion order.
+        """
+        return AsyncPayloadHarvester(self, deveuis, group_id, start_time, end_time, concurrency, watermarks)
+
+    @overload
+    async def get_health(self, fields: None = None) -> DevicesHealthResponse: ...
+
+    @overload
+    async def get_health(self, fields: Sequence[str]) -> dict[str, list[Any]]: ...
+
+    async def get_health(self, fields: Sequence[str] | None = None) -> DevicesHealthResponse | dict[str, list[Any]]:
         """Retrieve devices grouped by health status.
 
+        Args:
+            fields: Optional `DeviceInstance` fields to keep, e.g. `("deveui", "name", "last_uplink")`.
+                The devices are then returned as compact named tuples holding only these fields,
+                and the other fields are not validated.
+
         Returns:
-            DevicesHealthResponse: Devices grouped by their health status.
+            DevicesHealthResponse: Devices grouped by their health status. With `fields`, a dict of
+                records per group, keyed by group name (e.g. `"good"`).
         """
         url = self._build_url("health")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DevicesHealthResponse(**data)
+        response = await self._request_async("GET", url)
+        if fields is not None:
+            return projection(DeviceInstance, tuple(fields)).project_groups(
+                DevicesHealthResponse, self._parse_response(response)
+            )
+        return self._parse_model(response, DevicesHealthResponse)
+
+    async def aiter_health(self) -> AsyncIterator[tuple[str, DeviceInstance]]:
+        """Iterate over devices grouped by health status, validating each one as the response is downloaded.
+        See `aiter_all`.
+
+        Yields:
+            tuple[str, DeviceInstance]: Pairs of health status, as field name of `DevicesHealthResponse`
+                (e.g. `"offline"`), and device.
+        """
+        async for status, device in self._stream_items_async(
+            self._build_url("health"), DevicesHealthResponse, DeviceInstance
+        ):
+            yield status, device
 
     async def get_health_count(self) -> DevicesHealthCountResponse:
         """Retrieve device count grouped by health status.
@@ -370,6 +670,5 @@ class AsyncDevices(BaseResource["AsyncClient"]):
             DevicesHealthCountResponse: Device counts grouped by health status.
         """
         url = self._build_url("healthcount")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DevicesHealthCountResponse(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, DevicesHealthCountResponse)
@@ -0,0 +1,219 @@
+"""Concurrent collection of the payloads of many devices."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from machineq.core.bulk import run_concurrently, run_in_threads
+from machineq.core.device.models import DevicePayload
+from machineq.core.device.watermarks import PayloadWatermarks
+from machineq.core.utils import ensure_utc
+
+if TYPE_CHECKING:
+    from machineq.core.device.api import AsyncDevices, SyncDevices
+
+
+class _Harvester:
+    """Options and progress shared by the sync and async harvesters"""
+
+    def __init__(
+        self,
+        deveuis: Iterable[str] | None,
+        group_id: str | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        concurrency: int,
+        watermarks: PayloadWatermarks | None,
+    ):
+        if (deveuis is None) == (group_id is None):
+            raise ValueError("Exactly one of deveuis and group_id must be provided")  # noqa: TRY003
+        # normalized once, so that they compare with the timezone-aware watermarks
+        start_time = ensure_utc(start_time) if start_time is not None else None
+        end_time = ensure_utc(end_time) if end_time is not None else None
+        if start_time is not None and end_time is not None and end_time < start_time:
+            raise ValueError("The end time cannot come before start time")  # noqa: TRY003
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")  # noqa: TRY003
+        self.deveuis = deveuis
+        self.group_id = group_id
+        self.start_time = start_time
+        self.end_time = end_time
+        self.concurrency = concurrency
+        self.watermarks = watermarks
+
+        self.devices_harvested = 0
+        """Number of devices whose payloads were retrieved so far"""
+        self.payloads_harvested = 0
+        """Number of payloads yielded so far"""
+        self.failures: dict[str, Exception] = {}
+        """Error of each device whose payloads could not be retrieved, keyed by DevEUI"""
+
+    def _reset(self) -> None:
+        self.devices_harvested = 0
+        self.payloads_harvested = 0
+        self.failures = {}
+
+    def _start_time(self, deveui: str) -> datetime | None:
+        if self.watermarks is None:
+            return self.start_time
+        return self.watermarks.start_time(deveui, self.start_time)
+
+    def _is_caught_up(self, start_time: datetime | None) -> bool:
+        """Whether the watermark of a device is past the end of the range, leaving nothing to request"""
+        return start_time is not None and self.end_time is not None and start_time > self.end_time
+
+    def _record(self, deveui: str, result: list[DevicePayload] | Exception) -> list[DevicePayload]:
+        """Record the outcome of a device, returning its new payloads (none if it failed)"""
+        if isinstance(result, Exception):
+            self.failures[deveui] = result
+            return []
+        if self.watermarks is not None:
+            result = [payload for payload in result if self.watermarks.is_new(deveui, payload)]
+        self.devices_harvested += 1
+        self.payloads_harvested += len(result)
+        return result
+
+    def _done(self, deveui: str, payloads: list[DevicePayload]) -> None:
+        """Advance the watermark of a device once all its payloads were yielded"""
+        if self.watermarks is not None:
+            self.watermarks.advance(deveui, payloads)
+
+
+class PayloadHarvester(_Harvester):
+    """Retrieve the payloads of many devices over a time range, with bounded parallelism.
+
+    `get_payloads` is called for each device from a thread pool, and `(deveui, payload)` pairs are
+    yielded as soon as each device completes, so devices come in completion order. A device whose
+    payloads cannot be retrieved does not stop the run: its error is recorded in `failures`.
+
+    Usually created through `SyncDevices.harvest_payloads`:
+
+    ```python
+    harvester = client.devices.harvest_payloads(deveuis, start_time=start, end_time=end, concurrency=20)
+    for deveui, payload in harvester:
+        ...
+    print(harvester.failures)
+    ```
+    """
+
+    def __init__(
+        self,
+        devices: SyncDevices,
+        deveuis: Iterable[str] | None = None,
+        group_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        concurrency: int = 10,
+        watermarks: PayloadWatermarks | None = None,
+    ):
+        """Initialize the harvester.
+
+        Args:
+            devices: Sync devices resource used to fetch the payloads.
+            deveuis: EUIs of the devices, consumed lazily. Exclusive with `group_id`.
+            group_id: Device group whose devices are harvested. Exclusive with `deveuis`.
+            start_time: Optional start time.
+            end_time: Optional end time.
+            concurrency: Maximum number of requests in flight.
+            watermarks: Optional high-water marks, to only retrieve the payloads newer than those of
+                previous runs. They are saved when the iteration is over.
+        """
+        super().__init__(deveuis, group_id, start_time, end_time, concurrency, watermarks)
+        self._devices = devices
+
+    def __iter__(self) -> Iterator[tuple[str, DevicePayload]]:
+        self._reset()
+        if self.group_id is not None:
+            deveuis: Iterable[str] = self._devices.client.device_groups.get(self.group_id).device_list
+        else:
+            deveuis = self.deveuis or ()
+        try:
+            for deveui, result in run_in_threads(deveuis, self._fetch, self.concurrency):
+                payloads = self._record(deveui, result)
+                for payload in payloads:
+                    yield deveui, payload
+                self._done(deveui, payloads)
+        finally:
+            if self.watermarks is not None:
+                self.watermarks.save()
+
+    def _fetch(self, deveui: str) -> tuple[str, list[DevicePayload] | Exception]:
+        start_time = self._start_time(deveui)
+        if self._is_caught_up(start_time):
+            return deveui, []
+        # any error (API, transport, or a response failing to validate) only fails this device
+        try:
+            return deveui, self._devices.get_payloads(deveui, start_time, self.end_time)
+        except Exception as e:
+            return deveui, e
+
+
+class AsyncPayloadHarvester(_Harvester):
+    """Retrieve the payloads of many devices over a time range, with bounded concurrency.
+
+    The async counterpart of `PayloadHarvester`. Usually created through `AsyncDevices.harvest_payloads`:
+
+    ```python
+    harvester = client.devices.harvest_payloads(group_id=group_id, start_time=start, end_time=end)
+    async for deveui, payload in harvester:
+        ...
+    print(harvester.failures)
+    ```
+    """
+
+    def __init__(
+        self,
+        devices: AsyncDevices,
+        deveuis: Iterable[str] | None = None,
+        group_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        concurrency: int = 10,
+        watermarks: PayloadWatermarks | None = None,
+    ):
+        """Initialize the harvester.
+
+        Args:
+            devices: Async devices resource used to fetch the payloads.
+            deveuis: EUIs of the devices, consumed lazily. Exclusive with `group_id`.
+            group_id: Device group whose devices are harvested. Exclusive with `deveuis`.
+            start_time: Optional start time.
+            end_time: Optional end time.
+            concurrency: Maximum number of requests in flight.
+            watermarks: Optional high-water marks, to only retrieve the payloads newer than those of
+                previous runs. They are saved when the iteration is over.
+        """
+        super().__init__(deveuis, group_id, start_time, end_time, concurrency, watermarks)
+        self._devices = devices
+
+    def __aiter__(self) -> AsyncIterator[tuple[str, DevicePayload]]:
+        return self._iter()
+
+    async def _iter(self) -> AsyncIterator[tuple[str, DevicePayload]]:
+        self._reset()
+        if self.group_id is not None:
+            group = await self._devices.client.device_groups.get(self.group_id)
+            deveuis: Iterable[str] = group.device_list
+        else:
+            deveuis = self.deveuis or ()
+        try:
+            async for deveui, result in run_concurrently(deveuis, self._fetch, self.concurrency):
+                payloads = self._record(deveui, result)
+                for payload in payloads:
+                    yield deveui, payload
+                self._done(deveui, payloads)
+        finally:
+            if self.watermarks is not None:
+                self.watermarks.save()
+
+    async def _fetch(self, deveui: str) -> tuple[str, list[DevicePayload] | Exception]:
+        start_time = self._start_time(deveui)
+        if self._is_caught_up(start_time):
+            return deveui, []
+        # any error (API, transport, or a response failing to validate) only fails this device
+        try:
+            return deveui, await self._devices.get_payloads(deveui, start_time, self.end_time)
+        except Exception as e:
+            return deveui, e
@@ -0,0 +1,107 @@
+"""High-water marks of device payloads, to retrieve only new payloads on each run of a sync job."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from machineq.core.device.models import DevicePayload
+from machineq.core.utils import ensure_utc
+
+
+def _fingerprint(payload: DevicePayload) -> str:
+    """Identify a payload among those sharing its timestamp"""
+    content = json.dumps([payload.data, payload.application_data], sort_keys=True, default=str)
+    return hashlib.sha1(content.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+class PayloadWatermarks:
+    """Time of the last payload retrieved for each device, persisted in a JSON file.
+
+    Payloads are requested from the high-water mark of their device onward, so the payloads sharing
+    the mark's timestamp come back on the next run. Their fingerprints are stored with the mark, and
+    they are skipped instead of being yielded twice.
+
+    Pass the watermarks to `harvest_payloads` to make each run retrieve only the new payloads:
+
+    ```python
+    watermarks = PayloadWatermarks("payloads-state.json")
+    for deveui, payload in client.devices.harvest_payloads(deveuis, watermarks=watermarks):
+        ...
+    ```
+
+    The file is written when the harvest is over, or interrupted, and replaced atomically. The marks of a
+    device only advance once all of its payloads were yielded, so an interrupted run may yield some payloads
+    again on the next run, but never misses any.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Initialize the watermarks, loading them from `path` if it exists.
+
+        Args:
+            path: Path of the JSON state file. It is created on the first save.
+        """
+        self.path = Path(path)
+        self._marks: dict[str, tuple[datetime, set[str]]] = {}
+        try:
+            with self.path.open() as f:
+                state: dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return
+        for deveui, entry in state.items():
+            self._marks[deveui] = (datetime.fromisoformat(entry["time"]), set(entry["seen"]))
+
+    def last_seen(self, deveui: str) -> datetime | None:
+        """Return the time of the last payload retrieved for a device, if any"""
+        mark = self._marks.get(deveui)
+        return mark[0] if mark is not None else None
+
+    def start_time(self, deveui: str, start_time: datetime | None = None) -> datetime | None:
+        """Return the start of the range to request for a device: its mark, unless `start_time` is later"""
+        mark = self.last_seen(deveui)
+        if start_time is None or (mark is not None and mark > ensure_utc(start_time)):
+            return mark
+        return start_time
+
+    def is_new(self, deveui: str, payload: DevicePayload) -> bool:
+        """Return whether a payload is past the mark of its device"""
+        mark = self._marks.get(deveui)
+        if mark is None:
+            return True
+        time = ensure_utc(payload.time)
+        return time > mark[0] or (time == mark[0] and _fingerprint(payload) not in mark[1])
+
+    def advance(self, deveui: str, payloads: Iterable[DevicePayload]) -> None:
+        """Move the mark of a device past payloads that were processed"""
+        time, seen = self._marks.get(deveui, (None, set()))
+        for payload in payloads:
+            payload_time = ensure_utc(payload.time)
+            if time is None or payload_time > time:
+                time, seen = payload_time, set()
+            if payload_time == time:
+                seen.add(_fingerprint(payload))
+        if time is not None:
+            self._marks[deveui] = (time, seen)
+
+    def save(self) -> None:
+        """Write the marks to the state file"""
+        state = {
+            deveui: {"time": time.isoformat(), "seen": sorted(seen)} for deveui, (time, seen) in self._marks.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
@@ -35,8 +35,7 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
         Returns:
             list[DeviceGroupInstance]: List of all device group instances.
         """
-        data = super()._get_all_generic()
-        return DeviceGroupResponse(**data).device_groups
+        return super()._get_all_generic(DeviceGroupResponse).device_groups
 
     def get(self, group_id: str) -> DeviceGroupInstance:
         """Retrieve a device group by its ID.
@@ -48,9 +47,8 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
             DeviceGroupInstance: The device group instance matching the given ID.
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DeviceGroupInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, DeviceGroupInstance)
 
     def create(self, data: DeviceGroupCreate) -> str:
         """Create a new device group.
@@ -62,13 +60,12 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
             str: The ID of the newly created device group.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return DeviceGroupCreateResponse(**result).id
+        return self._parse_model(response, DeviceGroupCreateResponse).id
 
     def update(self, group_id: str, data: DeviceGroupUpdate) -> bool:
         """Update a device group (full replacement).
@@ -81,13 +78,12 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
             DeviceGroupInstance: The updated device group instance.
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, group_id: str, data: DeviceGroupPatch) -> bool:
         """Partially update a device group.
@@ -100,13 +96,12 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
             DeviceGroupInstance: The updated device group instance.
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, group_id: str) -> None:
         """Delete a device group.
@@ -118,7 +113,7 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
     def get_recent(
@@ -150,13 +145,12 @@ class SyncDeviceGroups(BaseResource["SyncClient"]):
         if start_time is not None and end_time is not None and end_time < start_time:
             raise ValueError("The end time cannot come before start time")  # noqa: TRY003
 
-        response = self.client.http_client.get(
+        response = self._request(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return GetDeviceGroupRecentResponse(**data).device_list
+        return self._parse_model(response, GetDeviceGroupRecentResponse).device_list
 
 
 class AsyncDeviceGroups(BaseResource["AsyncClient"]):
@@ -171,8 +165,7 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
         Returns:
             list[DeviceGroupInstance]: List of all device group instances.
         """
-        data = await super()._get_all_generic_async()
-        return DeviceGroupResponse(**data).device_groups
+        return (await super()._get_all_generic_async(DeviceGroupResponse)).device_groups
 
     async def get(self, group_id: str) -> DeviceGroupInstance:
         """Retrieve a device group by its ID.
@@ -184,9 +177,8 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
             DeviceGroupInstance: The device group instance matching the given ID.
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return DeviceGroupInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, DeviceGroupInstance)
 
     async def create(self, data: DeviceGroupCreate) -> str:
         """Create a new device group.
@@ -198,13 +190,12 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
             str: The ID of the newly created device group.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return DeviceGroupCreateResponse(**result).id
+        return self._parse_model(response, DeviceGroupCreateResponse).id
 
     async def update(self, group_id: str, data: DeviceGroupUpdate) -> bool:
         """Update a device group (full replacement).
@@ -217,13 +208,12 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
             bool: True if the update was successful.
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, group_id: str, data: DeviceGroupPatch) -> bool:
         """Partially update a device group.
@@ -236,13 +226,12 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
             bool: True if the patch was successful.
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, group_id: str) -> None:
         """Delete a device group.
@@ -254,7 +243,7 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
 
     async def get_recent(
@@ -286,10 +275,9 @@ class AsyncDeviceGroups(BaseResource["AsyncClient"]):
             params["EndTime"] = ensure_utc_and_str(end_time)
         if start_time is not None and end_time is not None and end_time < start_time:
             raise ValueError("The end time cannot come before start time")  # noqa: TRY003
-        response = await self.client.http_client.get(
+        response = await self._request_async(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return GetDeviceGroupRecentResponse(**data).device_list
+        return self._parse_model(response, GetDeviceGroupRecentResponse).device_list
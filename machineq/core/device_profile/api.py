@@ -29,8 +29,7 @@ class SyncDeviceProfiles(BaseResource["SyncClient"]):
         Returns:
             list[DeviceProfileInstance]: List of all device profile instances.
         """
-        data = super()._get_all_generic()
-        return DeviceProfileResponse(**data).device_profiles
+        return super()._get_all_generic(DeviceProfileResponse).device_profiles
 
     def update_devices(
         self,
@@ -47,13 +46,12 @@ class SyncDeviceProfiles(BaseResource["SyncClient"]):
             DeviceProfileDevicesUpdateResponse: The response containing updated device associations.
         """
         url = self._build_url(f"{profile_id}/devices")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return DeviceProfileDevicesUpdateResponse(**result)
+        return self._parse_model(response, DeviceProfileDevicesUpdateResponse)
 
 
 class AsyncDeviceProfiles(BaseResource["AsyncClient"]):
@@ -68,8 +66,7 @@ class AsyncDeviceProfiles(BaseResource["AsyncClient"]):
         Returns:
             list[DeviceProfileInstance]: List of all device profile instances.
         """
-        data = await super()._get_all_generic_async()
-        return DeviceProfileResponse(**data).device_profiles
+        return (await super()._get_all_generic_async(DeviceProfileResponse)).device_profiles
 
     async def update_devices(
         self,
@@ -86,10 +83,9 @@ class AsyncDeviceProfiles(BaseResource["AsyncClient"]):
             DeviceProfileDevicesUpdateResponse: The response containing updated device associations.
         """
         url = self._build_url(f"{profile_id}/devices")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return DeviceProfileDevicesUpdateResponse(**result)
+        return self._parse_model(response, DeviceProfileDevicesUpdateResponse)
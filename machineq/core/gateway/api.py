@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+import httpx
 
 from machineq.client.base import BaseResource
+from machineq.client.exceptions import APIError
+from machineq.core.bulk import run_concurrently, run_in_threads
 from machineq.core.gateway import GatewayDevice
 from machineq.core.gateway.models import (
+    CreateGatewaysResponse,
     GatewayCreate,
     GatewayCreateResponse,
     GatewayDeviceResponse,
@@ -19,7 +25,7 @@ from machineq.core.gateway.models import (
     GatewayUpdate,
     MachineqapiGatewayResponse,
 )
-from machineq.core.shared.models import CommonOKResponse
+from machineq.core.shared.models import CommonOKResponse, LazyList, projection
 
 if TYPE_CHECKING:
     from machineq.client.async_ import AsyncClient
@@ -32,14 +38,38 @@ class SyncGateways(BaseResource["SyncClient"]):
     def __init__(self, client: SyncClient):
         super().__init__(client, "/gateways")
 
-    def get_all(self) -> list[GatewayInstance]:
+    @overload
+    def get_all(self, lazy: Literal[False] = False) -> list[GatewayInstance]: ...
+
+    @overload
+    def get_all(self, lazy: Literal[True]) -> LazyList[GatewayInstance]: ...
+
+    def get_all(self, lazy: bool = False) -> list[GatewayInstance] | LazyList[GatewayInstance]:
         """List all gateways.
 
+        Args:
+            lazy: Return a `LazyList` that validates each gateway on first access, instead of validating
+                all of them upfront. Saves time and memory on large fleets when only some gateways are used.
+
         Returns:
             list[GatewayInstance]: List of all gateway instances.
         """
-        data = super()._get_all_generic()
-        return MachineqapiGatewayResponse(**data).gateways
+        response = self._request("GET", self._build_url())
+        if lazy:
+            return LazyList(GatewayInstance, self._parse_response(response).get("Gateways") or [])
+        return self._parse_model(response, MachineqapiGatewayResponse).gateways
+
+    def iter_all(self) -> Iterator[GatewayInstance]:
+        """Iterate over all gateways, validating each one as the response is downloaded.
+
+        Unlike `get_all`, neither the whole response nor the list of gateways is held in memory.
+        Responses are not cached.
+
+        Yields:
+            GatewayInstance: Gateways in the order returned by the API.
+        """
+        for _, gateway in self._stream_items(self._build_url(), MachineqapiGatewayResponse, GatewayInstance):
+            yield gateway
 
     def get(self, gateway_id: str) -> GatewayInstance:
         """Retrieve a gateway by ID or Node ID.
@@ -51,9 +81,8 @@ class SyncGateways(BaseResource["SyncClient"]):
             GatewayInstance: The gateway instance matching the given ID.
         """
         url = self._build_url(f"{gateway_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewayInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, GatewayInstance)
 
     def create(self, data: GatewayCreate) -> str:
         """Create a new gateway.
@@ -65,13 +94,12 @@ class SyncGateways(BaseResource["SyncClient"]):
             str: The ID of the newly created gateway.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return GatewayCreateResponse(**result).id
+        return self._parse_model(response, GatewayCreateResponse).id
 
     def update(self, gateway_id: str, data: GatewayUpdate) -> bool:
         """Update a gateway (full replacement).
@@ -84,13 +112,12 @@ class SyncGateways(BaseResource["SyncClient"]):
             GatewayInstance: The updated gateway instance.
         """
         url = self._build_url(f"{gateway_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, gateway_id: str, data: GatewayPatch) -> bool:
         """Partially update a gateway.
@@ -103,13 +130,12 @@ class SyncGateways(BaseResource["SyncClient"]):
             GatewayInstance: The updated gateway instance.
         """
         url = self._build_url(f"{gateway_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, gateway_id: str) -> None:
         """Delete a gateway.
@@ -121,9 +147,60 @@ class SyncGateways(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{gateway_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
+    def delete_many(self, gateway_ids: Iterable[str], concurrency: int = 10) -> list[CreateGatewaysResponse]:
+        """Delete many gateways concurrently, using a thread pool.
+
+        A failed deletion does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            gateway_ids: The unique identifiers of the gateways to delete.
+            concurrency: Maximum number of deletions in flight.
+
+        Returns:
+            list[CreateGatewaysResponse]: The outcome for each gateway, in completion order.
+                The gateway ID is reported in `id`, `mac_address` is left empty.
+        """
+
+        def delete_one(gateway_id: str) -> CreateGatewaysResponse:
+            try:
+                self.delete(gateway_id)
+            except (APIError, httpx.HTTPError) as e:
+                return CreateGatewaysResponse(response=False, mac_address="", error=str(e), id=gateway_id)
+            return CreateGatewaysResponse(response=True, mac_address="", error="", id=gateway_id)
+
+        return list(run_in_threads(gateway_ids, delete_one, concurrency))
+
+    def patch_many(
+        self,
+        patches: Mapping[str, GatewayPatch],
+        concurrency: int = 10,
+    ) -> list[CreateGatewaysResponse]:
+        """Partially update many gateways concurrently, using a thread pool.
+
+        A failed update does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            patches: The partial data to apply, keyed by gateway ID.
+            concurrency: Maximum number of updates in flight.
+
+        Returns:
+            list[CreateGatewaysResponse]: The outcome for each gateway, in completion order.
+                The gateway ID is reported in `id`, `mac_address` is left empty.
+        """
+
+        def patch_one(item: tuple[str, GatewayPatch]) -> CreateGatewaysResponse:
+            gateway_id, data = item
+            try:
+                ok = self.patch(gateway_id, data)
+            except (APIError, httpx.HTTPError) as e:
+                return CreateGatewaysResponse(response=False, mac_address="", error=str(e), id=gateway_id)
+            return CreateGatewaysResponse(response=ok, mac_address="", error="", id=gateway_id)
+
+        return list(run_in_threads(patches.items(), patch_one, concurrency))
+
     def get_devices(
         self,
         gateway_id: str,
@@ -143,13 +220,12 @@ class SyncGateways(BaseResource["SyncClient"]):
         if days is not None:
             params["Days"] = days
 
-        response = self.client.http_client.get(
+        response = self._request(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return GatewayDeviceResponse(**data).devices
+        return self._parse_model(response, GatewayDeviceResponse).devices
 
     def get_statistics(self, gateway_id: str) -> GatewayStatistics:
         """Retrieve gateway statistics.
@@ -161,9 +237,8 @@ class SyncGateways(BaseResource["SyncClient"]):
             GatewayStatistics: Statistics for the gateway.
         """
         url = self._build_url(f"{gateway_id}/statistics")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewayStatistics(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, GatewayStatistics)
 
     def get_events(
         self,
@@ -188,35 +263,66 @@ class SyncGateways(BaseResource["SyncClient"]):
         if end_time:
             params["EndTime"] = end_time
 
-        response = self.client.http_client.get(
+        response = self._request(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return GatewayEventsResponse(**data)
+        return self._parse_model(response, GatewayEventsResponse)
+
+    @overload
+    def get_connection_status(self, fields: None = None) -> GatewaysConnectionResponse: ...
+
+    @overload
+    def get_connection_status(self, fields: Sequence[str]) -> dict[str, list[Any]]: ...
 
-    def get_connection_status(self) -> GatewaysConnectionResponse:
+    def get_connection_status(
+        self, fields: Sequence[str] | None = None
+    ) -> GatewaysConnectionResponse | dict[str, list[Any]]:
         """Retrieve gateways grouped by connection status.
 
+        Args:
+            fields: Optional `GatewayInstance` fields to keep, e.g. `("id", "name", "node_id")`.
+                The gateways are then returned as compact named tuples holding only these fields,
+                and the other fields are not validated.
+
         Returns:
-            GatewaysConnectionResponse: Gateways grouped by their connection status.
+            GatewaysConnectionResponse: Gateways grouped by their connection status. With `fields`, a dict of
+                records per group, keyed by group name (e.g. `"never_connected"`).
         """
         url = self._build_url("connection")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewaysConnectionResponse(**data)
+        response = self._request("GET", url)
+        if fields is not None:
+            return projection(GatewayInstance, tuple(fields)).project_groups(
+                GatewaysConnectionResponse, self._parse_response(response)
+            )
+        return self._parse_model(response, GatewaysConnectionResponse)
 
-    def get_health(self) -> GatewaysHealthResponse:
+    @overload
+    def get_health(self, fields: None = None) -> GatewaysHealthResponse: ...
+
+    @overload
+    def get_health(self, fields: Sequence[str]) -> dict[str, list[Any]]: ...
+
+    def get_health(self, fields: Sequence[str] | None = None) -> GatewaysHealthResponse | dict[str, list[Any]]:
         """Retrieve gateways grouped by health status.
 
+        Args:
+            fields: Optional `GatewayInstance` fields to keep, e.g. `("id", "name", "node_id")`.
+                The gateways are then returned as compact named tuples holding only these fields,
+                and the other fields are not validated.
+
         Returns:
-            GatewaysHealthResponse: Gateways grouped by their health status.
+            GatewaysHealthResponse: Gateways grouped by their health status. With `fields`, a dict of
+                records per group, keyed by group name (e.g. `"initializing"`).
         """
         url = self._build_url("health")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewaysHealthResponse(**data)
+        response = self._request("GET", url)
+        if fields is not None:
+            return projection(GatewayInstance, tuple(fields)).project_groups(
+                GatewaysHealthResponse, self._parse_response(response)
+            )
+        return self._parse_model(response, GatewaysHealthResponse)
 
 
 class AsyncGateways(BaseResource["AsyncClient"]):
@@ -225,14 +331,40 @@ class AsyncGateways(BaseResource["AsyncClient"]):
     def __init__(self, client: AsyncClient):
         super().__init__(client, "/gateways")
 
-    async def get_all(self) -> list[GatewayInstance]:
+    @overload
+    async def get_all(self, lazy: Literal[False] = False) -> list[GatewayInstance]: ...
+
+    @overload
+    async def get_all(self, lazy: Literal[True]) -> LazyList[GatewayInstance]: ...
+
+    async def get_all(self, lazy: bool = False) -> list[GatewayInstance] | LazyList[GatewayInstance]:
         """List all gateways.
 
+        Args:
+            lazy: Return a `LazyList` that validates each gateway on first access, instead of validating
+                all of them upfront. Saves time and memory on large fleets when only some gateways are used.
+
         Returns:
             list[GatewayInstance]: List of all gateway instances.
         """
-        data = await super()._get_all_generic_async()
-        return MachineqapiGatewayResponse(**data).gateways
+        response = await self._request_async("GET", self._build_url())
+        if lazy:
+            return LazyList(GatewayInstance, self._parse_response(response).get("Gateways") or [])
+        return self._parse_model(response, MachineqapiGatewayResponse).gateways
+
+    async def aiter_all(self) -> AsyncIterator[GatewayInstance]:
+        """Iterate over all gateways, validating each one as the response is downloaded.
+
+        Unlike `get_all`, neither the whole response nor the list of gateways is held in memory.
+        Responses are not cached.
+
+        Yields:
+            GatewayInstance: Gateways in the order returned by the API.
+        """
+        async for _, gateway in self._stream_items_async(
+            self._build_url(), MachineqapiGatewayResponse, GatewayInstance
+        ):
+            yield gateway
 
     async def get(self, gateway_id: str) -> GatewayInstance:
         """Retrieve a gateway by ID or Node ID.
@@ -244,9 +376,8 @@ class AsyncGateways(BaseResource["AsyncClient"]):
             GatewayInstance: The gateway instance matching the given ID.
         """
         url = self._build_url(f"{gateway_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewayInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, GatewayInstance)
 
     async def create(self, data: GatewayCreate) -> str:
         """Create a new gateway.
@@ -258,13 +389,12 @@ class AsyncGateways(BaseResource["AsyncClient"]):
             str: The ID of the newly created gateway.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return GatewayCreateResponse(**result).id
+        return self._parse_model(response, GatewayCreateResponse).id
 
     async def update(self, gateway_id: str, data: GatewayUpdate) -> bool:
         """Update a gateway (full replacement).
@@ -277,13 +407,12 @@ class AsyncGateways(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{gateway_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, gateway_id: str, data: GatewayPatch) -> bool:
         """Partially update a gateway.
@@ -296,13 +425,12 @@ class AsyncGateways(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{gateway_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, gateway_id: str) -> None:
         """Delete a gateway.
@@ -314,9 +442,60 @@ class AsyncGateways(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{gateway_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
 
+    async def delete_many(self, gateway_ids: Iterable[str], concurrency: int = 10) -> list[CreateGatewaysResponse]:
+        """Delete many gateways concurrently.
+
+        A failed deletion does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            gateway_ids: The unique identifiers of the gateways to delete.
+            concurrency: Maximum number of deletions in flight.
+
+        Returns:
+            list[CreateGatewaysResponse]: The outcome for each gateway, in completion order.
+                The gateway ID is reported in `id`, `mac_address` is left empty.
+        """
+
+        async def delete_one(gateway_id: str) -> CreateGatewaysResponse:
+            try:
+                await self.delete(gateway_id)
+            except (APIError, httpx.HTTPError) as e:
+                return CreateGatewaysResponse(response=False, mac_address="", error=str(e), id=gateway_id)
+            return CreateGatewaysResponse(response=True, mac_address="", error="", id=gateway_id)
+
+        return [result async for result in run_concurrently(gateway_ids, delete_one, concurrency)]
+
+    async def patch_many(
+        self,
+        patches: Mapping[str, GatewayPatch],
+        concurrency: int = 10,
+    ) -> list[CreateGatewaysResponse]:
+        """Partially update many gateways concurrently.
+
+        A failed update does not stop the others, it is reported with `response=False` and the error message.
+
+        Args:
+            patches: The partial data to apply, keyed by gateway ID.
+            concurrency: Maximum number of updates in flight.
+
+        Returns:
+            list[CreateGatewaysResponse]: The outcome for each gateway, in completion order.
+                The gateway ID is reported in `id`, `mac_address` is left empty.
+        """
+
+        async def patch_one(item: tuple[str, GatewayPatch]) -> CreateGatewaysResponse:
+            gateway_id, data = item
+            try:
+                ok = await self.patch(gateway_id, data)
+            except (APIError, httpx.HTTPError) as e:
+                return CreateGatewaysResponse(response=False, mac_address="", error=str(e), id=gateway_id)
+            return CreateGatewaysResponse(response=ok, mac_address="", error="", id=gateway_id)
+
+        return [result async for result in run_concurrently(patches.items(), patch_one, concurrency)]
+
     async def get_devices(
         self,
         gateway_id: str,
@@ -336,13 +515,12 @@ class AsyncGateways(BaseResource["AsyncClient"]):
         if days is not None:
             params["Days"] = days
 
-        response = await self.client.http_client.get(
+        response = await self._request_async(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return GatewayDeviceResponse(**data).devices
+        return self._parse_model(response, GatewayDeviceResponse).devices
 
     async def get_statistics(self, gateway_id: str) -> GatewayStatistics:
         """Retrieve gateway statistics.
@@ -354,9 +532,8 @@ class AsyncGateways(BaseResource["AsyncClient"]):
             GatewayStatistics: Statistics for the gateway.
         """
         url = self._build_url(f"{gateway_id}/statistics")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewayStatistics(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, GatewayStatistics)
 
     async def get_events(
         self,
@@ -381,32 +558,63 @@ class AsyncGateways(BaseResource["AsyncClient"]):
         if end_time:
             params["EndTime"] = end_time
 
-        response = await self.client.http_client.get(
+        response = await self._request_async(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return GatewayEventsResponse(**data)
+        return self._parse_model(response, GatewayEventsResponse)
 
-    async def get_connection_status(self) -> GatewaysConnectionResponse:
+    @overload
+    async def get_connection_status(self, fields: None = None) -> GatewaysConnectionResponse: ...
+
+    @overload
+    async def get_connection_status(self, fields: Sequence[str]) -> dict[str, list[Any]]: ...
+
+    async def get_connection_status(
+        self, fields: Sequence[str] | None = None
+    ) -> GatewaysConnectionResponse | dict[str, list[Any]]:
         """Retrieve gateways grouped by connection status.
 
+        Args:
+            fields: Optional `GatewayInstance` fields to keep, e.g. `("id", "name", "node_id")`.
+                The gateways are then returned as compact named tuples holding only these fields,
+                and the other fields are not validated.
+
         Returns:
-            GatewaysConnectionResponse: Gateways grouped by their connection status.
+            GatewaysConnectionResponse: Gateways grouped by their connection status. With `fields`, a dict of
+                records per group, keyed by group name (e.g. `"never_connected"`).
         """
         url = self._build_url("connection")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewaysConnectionResponse(**data)
+        response = await self._request_async("GET", url)
+        if fields is not None:
+            return projection(GatewayInstance, tuple(fields)).project_groups(
+                GatewaysConnectionResponse, self._parse_response(response)
+            )
+        return self._parse_model(response, GatewaysConnectionResponse)
 
-    async def get_health(self) -> GatewaysHealthResponse:
+    @overload
+    async def get_health(self, fields: None = None) -> GatewaysHealthResponse: ...
+
+    @overload
+    async def get_health(self, fields: Sequence[str]) -> dict[str, list[Any]]: ...
+
+    async def get_health(self, fields: Sequence[str] | None = None) -> GatewaysHealthResponse | dict[str, list[Any]]:
         """Retrieve gateways grouped by health status.
 
+        Args:
+            fields: Optional `GatewayInstance` fields to keep, e.g. `("id", "name", "node_id")`.
+                The gateways are then returned as compact named tuples holding only these fields,
+                and the other fields are not validated.
+
         Returns:
-            GatewaysHealthResponse: Gateways grouped by their health status.
+            GatewaysHealthResponse: Gateways grouped by their health status. With `fields`, a dict of
+                records per group, keyed by group name (e.g. `"initializing"`).
         """
         url = self._build_url("health")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewaysHealthResponse(**data)
+        response = await self._request_async("GET", url)
+        if fields is not None:
+            return projection(GatewayInstance, tuple(fields)).project_groups(
+                GatewaysHealthResponse, self._parse_response(response)
+            )
+        return self._parse_model(response, GatewaysHealthResponse)
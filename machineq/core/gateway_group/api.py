@@ -32,8 +32,7 @@ class SyncGatewayGroups(BaseResource["SyncClient"]):
         Returns:
             list[GatewayGroupInstance]: List of all gateway group instances.
         """
-        data = super()._get_all_generic()
-        return GatewayGroupResponse(**data).gateway_groups
+        return super()._get_all_generic(GatewayGroupResponse).gateway_groups
 
     def get(self, group_id: str) -> GatewayGroupInstance:
         """Retrieve a gateway group by its ID.
@@ -45,9 +44,8 @@ class SyncGatewayGroups(BaseResource["SyncClient"]):
             GatewayGroupInstance: The gateway group instance matching the given ID.
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewayGroupInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, GatewayGroupInstance)
 
     def create(self, data: GatewayGroupCreate) -> str:
         """Create a new gateway group.
@@ -59,13 +57,12 @@ class SyncGatewayGroups(BaseResource["SyncClient"]):
             str: The ID of the newly created gateway group.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return GatewayGroupCreateResponse(**result).id
+        return self._parse_model(response, GatewayGroupCreateResponse).id
 
     def update(self, group_id: str, data: GatewayGroupUpdate) -> bool:
         """Update a gateway group (full replacement).
@@ -78,13 +75,12 @@ class SyncGatewayGroups(BaseResource["SyncClient"]):
             GatewayGroupInstance: The updated gateway group instance.
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, group_id: str, data: GatewayGroupPatch) -> bool:
         """Partially update a gateway group.
@@ -97,13 +93,12 @@ class SyncGatewayGroups(BaseResource["SyncClient"]):
             GatewayGroupInstance: The updated gateway group instance.
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, group_id: str) -> None:
         """Delete a gateway group.
@@ -115,7 +110,7 @@ class SyncGatewayGroups(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{group_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
 
@@ -131,8 +126,7 @@ class AsyncGatewayGroups(BaseResource["AsyncClient"]):
         Returns:
             list[GatewayGroupInstance]: List of all gateway group instances.
         """
-        data = await super()._get_all_generic_async()
-        return GatewayGroupResponse(**data).gateway_groups
+        return (await super()._get_all_generic_async(GatewayGroupResponse)).gateway_groups
 
     async def get(self, group_id: str) -> GatewayGroupInstance:
         """Retrieve a gateway group by its ID.
@@ -144,9 +138,8 @@ class AsyncGatewayGroups(BaseResource["AsyncClient"]):
             GatewayGroupInstance: The gateway group instance matching the given ID.
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GatewayGroupInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, GatewayGroupInstance)
 
     async def create(self, data: GatewayGroupCreate) -> str:
         """Create a new gateway group.
@@ -158,13 +151,12 @@ class AsyncGatewayGroups(BaseResource["AsyncClient"]):
             str: The ID of the newly created gateway group.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return GatewayGroupCreateResponse(**result).id
+        return self._parse_model(response, GatewayGroupCreateResponse).id
 
     async def update(self, group_id: str, data: GatewayGroupUpdate) -> bool:
         """Update a gateway group (full replacement).
@@ -177,13 +169,12 @@ class AsyncGatewayGroups(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, group_id: str, data: GatewayGroupPatch) -> bool:
         """Partially update a gateway group.
@@ -196,13 +187,12 @@ class AsyncGatewayGroups(BaseResource["AsyncClient"]):
             bool: True if the patch was successful, False otherwise.
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, group_id: str) -> None:
         """Delete a gateway group.
@@ -214,5 +204,5 @@ class AsyncGatewayGroups(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{group_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
@@ -27,8 +27,7 @@ class SyncGatewayProfiles(BaseResource["SyncClient"]):
         Returns:
             list[GatewayProfileInstance]: List of all gateway profile instances.
         """
-        data = super()._get_all_generic()
-        return GatewayProfileResponse(**data).gateway_profiles
+        return super()._get_all_generic(GatewayProfileResponse).gateway_profiles
 
 
 class AsyncGatewayProfiles(BaseResource["AsyncClient"]):
@@ -43,5 +42,4 @@ class AsyncGatewayProfiles(BaseResource["AsyncClient"]):
         Returns:
             list[GatewayProfileInstance]: List of all gateway profile instances.
         """
-        data = await super()._get_all_generic_async()
-        return GatewayProfileResponse(**data).gateway_profiles
+        return (await super()._get_all_generic_async(GatewayProfileResponse)).gateway_profiles
@@ -2,26 +2,73 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from machineq.client.base import BaseResource
 from machineq.core.logs import AckFilter, ActivationFilter, LateFilter, LogInstance, MessageTypeFilter, StreamFilter
+from machineq.core.logs.columns import LogColumns
+from machineq.core.logs.export import DEFAULT_MIN_SHARD_DURATION, DEFAULT_SHARD_DURATION, LogExporter
 from machineq.core.logs.models import LogResponse
 from machineq.core.utils import ensure_utc_and_str
 
 if TYPE_CHECKING:
+    import pyarrow as pa  # ty:ignore[unresolved-import]
+
     from machineq.client.async_ import AsyncClient
     from machineq.client.sync import SyncClient
 
 
+DEFAULT_START_PAGE = 1
+
+
+# ruff: noqa: C901
+def _build_params(
+    deveui: str | None = None,
+    gateway_id: str | None = None,
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+    page: int | None = None,
+    stream: StreamFilter | None = None,
+    message_type: MessageTypeFilter | None = None,
+    late: LateFilter | None = None,
+    activation: ActivationFilter | None = None,
+    ack: AckFilter | None = None,
+) -> dict[str, Any]:
+    """Build the query parameters shared by the logs endpoints."""
+    params: dict[str, Any] = {}
+    if deveui:
+        params["DevEUI"] = deveui
+    if gateway_id:
+        params["GatewayID"] = gateway_id
+    if start_time:
+        params["StartTime"] = ensure_utc_and_str(start_time)
+    if end_time:
+        params["EndTime"] = ensure_utc_and_str(end_time)
+    if page is not None:
+        params["Page"] = page
+    if stream:
+        params["LogFrameFilter.Stream"] = stream
+    if message_type:
+        params["LogFrameFilter.MessageType"] = message_type
+    if late:
+        params["LogFrameFilter.Late"] = late
+    if activation:
+        params["LogFrameFilter.Activation"] = activation
+    if ack:
+        params["LogFrameFilter.Ack"] = ack
+    return params
+
+
 class SyncLogs(BaseResource["SyncClient"]):
     """Logs resource for device and gateway message logs."""
 
     def __init__(self, client: SyncClient):
         super().__init__(client, "/logs")
 
-    # ruff: noqa: C901
     def get_all(
         self,
         deveui: str | None = None,
@@ -53,35 +100,194 @@ class SyncLogs(BaseResource["SyncClient"]):
             LogResponse: Filtered logs matching the specified criteria.
         """
         url = self._build_url()
-        params = {}
-        if deveui:
-            params["DevEUI"] = deveui
-        if gateway_id:
-            params["GatewayID"] = gateway_id
-        if start_time:
-            params["StartTime"] = ensure_utc_and_str(start_time)
-        if end_time:
-            params["EndTime"] = ensure_utc_and_str(end_time)
-        if page is not None:
-            params["Page"] = page
-        if stream:
-            params["LogFrameFilter.Stream"] = stream
-        if message_type:
-            params["LogFrameFilter.MessageType"] = message_type
-        if late:
-            params["LogFrameFilter.Late"] = late
-        if activation:
-            params["LogFrameFilter.Activation"] = activation
-        if ack:
-            params["LogFrameFilter.Ack"] = ack
-
-        response = self.client.http_client.get(
+        params = _build_params(
+            deveui=deveui,
+            gateway_id=gateway_id,
+            start_time=start_time,
+            end_time=end_time,
+            page=page,
+            stream=stream,
+            message_type=message_type,
+            late=late,
+            activation=activation,
+            ack=ack,
+        )
+
+        response = self._request(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return LogResponse(**data).logs
+        return self._parse_model(response, LogResponse).logs
+
+    def iter_all(
+        self,
+        deveui: str | None = None,
+        gateway_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+        start_page: int = DEFAULT_START_PAGE,
+        streaming: bool = False,
+    ) -> Iterator[LogInstance]:
+        """Iterate over all logs matching the filters, fetching pages until an empty one is returned.
+        Only the current page is held in memory, regardless of how many logs the time window holds.
+
+        Args:
+            deveui: Optional device EUI to filter by.
+            gateway_id: Optional gateway ID to filter by.
+            start_time: Optional ISO 8601 formatted start time.
+            end_time: Optional ISO 8601 formatted end time.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+            start_page: Page to start from.
+            streaming: Validate each log as its page is downloaded, so that only the current log is held
+                in memory instead of the current page. Pages are then not cached.
+
+        Yields:
+            LogInstance: Logs matching the specified criteria, in the order returned by the API.
+        """
+        url = self._build_url()
+        page = start_page
+        while True:
+            params = _build_params(
+                deveui=deveui,
+                gateway_id=gateway_id,
+                start_time=start_time,
+                end_time=end_time,
+                page=page,
+                stream=stream,
+                message_type=message_type,
+                late=late,
+                activation=activation,
+                ack=ack,
+            )
+            if streaming:
+                logs: Iterable[LogInstance] = (
+                    log for _, log in self._stream_items(url, LogResponse, LogInstance, params=params)
+                )
+            else:
+                logs = self._parse_model(self._request("GET", url, params=params), LogResponse).logs
+            empty = True
+            for log in logs:
+                empty = False
+                yield log
+            if empty:
+                return
+            page += 1
+
+    def to_columns(
+        self,
+        deveui: str | None = None,
+        gateway_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+        columns: Sequence[str] | None = None,
+        start_page: int = DEFAULT_START_PAGE,
+    ) -> LogColumns:
+        """Fetch all logs matching the filters into typed columns, fetching pages until an empty one is returned.
+
+        Pages are decoded straight into compact numeric buffers without building `LogInstance` models,
+        so millions of logs fit in memory and are ready for vectorized analytics with NumPy or Arrow.
+
+        Args:
+            deveui: Optional device EUI to filter by.
+            gateway_id: Optional gateway ID to filter by.
+            start_time: Optional ISO 8601 formatted start time.
+            end_time: Optional ISO 8601 formatted end time.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+            columns: Names of the columns to keep (see `LOG_COLUMNS`). All of them by default.
+            start_page: Page to start from.
+
+        Returns:
+            LogColumns: The logs, in the order returned by the API.
+        """
+        result = LogColumns(columns)
+        url = self._build_url()
+        page = start_page
+        while True:
+            params = _build_params(
+                deveui=deveui,
+                gateway_id=gateway_id,
+                start_time=start_time,
+                end_time=end_time,
+                page=page,
+                stream=stream,
+                message_type=message_type,
+                late=late,
+                activation=activation,
+                ack=ack,
+            )
+            response = self._request("GET", url, params=params)
+            logs = (self._parse_response(response) or {}).get("Logs")
+            if not logs:
+                return result
+            result.extend(logs)
+            page += 1
+
+    def to_arrow(
+        self,
+        deveui: str | None = None,
+        gateway_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+        columns: Sequence[str] | None = None,
+        start_page: int = DEFAULT_START_PAGE,
+    ) -> pa.Table:
+        """Fetch all logs matching the filters into an Arrow table. Requires `pyarrow`.
+        See `to_columns` for the details.
+
+        Args:
+            deveui: Optional device EUI to filter by.
+            gateway_id: Optional gateway ID to filter by.
+            start_time: Optional ISO 8601 formatted start time.
+            end_time: Optional ISO 8601 formatted end time.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+            columns: Names of the columns to keep (see `LOG_COLUMNS`). All of them by default.
+            start_page: Page to start from.
+
+        Returns:
+            pyarrow.Table: The logs, in the order returned by the API.
+        """
+        columns_ = self.to_columns(
+            deveui=deveui,
+            gateway_id=gateway_id,
+            start_time=start_time,
+            end_time=end_time,
+            stream=stream,
+            message_type=message_type,
+            late=late,
+            activation=activation,
+            ack=ack,
+            columns=columns,
+            start_page=start_page,
+        )
+        return columns_.to_arrow()
 
 
 class AsyncLogs(BaseResource["AsyncClient"]):
@@ -90,7 +296,6 @@ class AsyncLogs(BaseResource["AsyncClient"]):
     def __init__(self, client: AsyncClient):
         super().__init__(client, "/logs")
 
-    # ruff: noqa: C901
     async def get_all(
         self,
         deveui: str | None = None,
@@ -122,32 +327,296 @@ class AsyncLogs(BaseResource["AsyncClient"]):
             list[LogInstance]: Filtered logs matching the specified criteria.
         """
         url = self._build_url()
-        params = {}
-        if deveui:
-            params["DevEUI"] = deveui
-        if gateway_id:
-            params["GatewayID"] = gateway_id
-        if start_time:
-            params["StartTime"] = ensure_utc_and_str(start_time)
-        if end_time:
-            params["EndTime"] = ensure_utc_and_str(end_time)
-        if page is not None:
-            params["Page"] = page
-        if stream:
-            params["LogFrameFilter.Stream"] = stream
-        if message_type:
-            params["LogFrameFilter.MessageType"] = message_type
-        if late:
-            params["LogFrameFilter.Late"] = late
-        if activation:
-            params["LogFrameFilter.Activation"] = activation
-        if ack:
-            params["LogFrameFilter.Ack"] = ack
-
-        response = await self.client.http_client.get(
+        params = _build_params(
+            deveui=deveui,
+            gateway_id=gateway_id,
+            start_time=start_time,
+            end_time=end_time,
+            page=page,
+            stream=stream,
+            message_type=message_type,
+            late=late,
+            activation=activation,
+            ack=ack,
+        )
+
+        response = await self._request_async(
+            "GET",
             url,
             params=params,
-            headers=self._build_headers(),
         )
-        data = self._parse_response(response)
-        return LogResponse(**data).logs
+        return self._parse_model(response, LogResponse).logs
+
+    async def aiter_all(
+        self,
+        deveui: str | None = None,
+        gateway_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+        start_page: int = DEFAULT_START_PAGE,
+        prefetch: int = 1,
+        streaming: bool = False,
+    ) -> AsyncIterator[LogInstance]:
+        """Iterate over all logs matching the filters, fetching pages until an empty one is returned.
+        Only the current page is held in memory, regardless of how many logs the time window holds.
+
+        With `prefetch` > 1, up to that many page requests are kept in flight while the caller consumes
+        earlier pages. Logs are still yielded in page order, and a new request is only issued when a page
+        is handed to the caller, so at most `prefetch` pages are buffered. A page shorter than the largest
+        page seen so far is treated as the last one, and the requests still in flight are cancelled.
+
+        Args:
+            deveui: Optional device EUI to filter by.
+            gateway_id: Optional gateway ID to filter by.
+            start_time: Optional ISO 8601 formatted start time.
+            end_time: Optional ISO 8601 formatted end time.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+            start_page: Page to start from.
+            prefetch: Number of page requests to keep in flight.
+            streaming: Validate each log as its page is downloaded, so that only the current log is held
+                in memory instead of the current page. Pages are then not cached. Cannot be combined
+                with `prefetch`.
+
+        Yields:
+            LogInstance: Logs matching the specified criteria, in the order returned by the API.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")  # noqa: TRY003
+        if streaming and prefetch > 1:
+            raise ValueError("streaming cannot be combined with prefetch")  # noqa: TRY003
+        if streaming:
+            page = start_page
+            while True:
+                params = _build_params(
+                    deveui=deveui,
+                    gateway_id=gateway_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    page=page,
+                    stream=stream,
+                    message_type=message_type,
+                    late=late,
+                    activation=activation,
+                    ack=ack,
+                )
+                empty = True
+                async for _, log in self._stream_items_async(
+                    self._build_url(), LogResponse, LogInstance, params=params
+                ):
+                    empty = False
+                    yield log
+                if empty:
+                    return
+                page += 1
+
+        next_page = start_page
+        in_flight: deque[asyncio.Task[list[LogInstance]]] = deque()
+
+        def schedule_next_page() -> None:
+            nonlocal next_page
+            request = self.get_all(
+                deveui=deveui,
+                gateway_id=gateway_id,
+                start_time=start_time,
+                end_time=end_time,
+                page=next_page,
+                stream=stream,
+                message_type=message_type,
+                late=late,
+                activation=activation,
+                ack=ack,
+            )
+            in_flight.append(asyncio.ensure_future(request))
+            next_page += 1
+
+        page_size = 0
+        try:
+            for _ in range(prefetch):
+                schedule_next_page()
+            while in_flight:
+                logs = await in_flight.popleft()
+                last_page = not logs or len(logs) < page_size
+                if not last_page:
+                    # refill the window before handing the page over, so that requests
+                    # progress while the caller processes it
+                    schedule_next_page()
+                for log in logs:
+                    yield log
+                if last_page:
+                    return
+                page_size = max(page_size, len(logs))
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def to_columns(
+        self,
+        deveui: str | None = None,
+        gateway_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+        columns: Sequence[str] | None = None,
+        start_page: int = DEFAULT_START_PAGE,
+    ) -> LogColumns:
+        """Fetch all logs matching the filters into typed columns, fetching pages until an empty one is returned.
+
+        Pages are decoded straight into compact numeric buffers without building `LogInstance` models,
+        so millions of logs fit in memory and are ready for vectorized analytics with NumPy or Arrow.
+
+        Args:
+            deveui: Optional device EUI to filter by.
+            gateway_id: Optional gateway ID to filter by.
+            start_time: Optional ISO 8601 formatted start time.
+            end_time: Optional ISO 8601 formatted end time.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+            columns: Names of the columns to keep (see `LOG_COLUMNS`). All of them by default.
+            start_page: Page to start from.
+
+        Returns:
+            LogColumns: The logs, in the order returned by the API.
+        """
+        result = LogColumns(columns)
+        url = self._build_url()
+        page = start_page
+        while True:
+            params = _build_params(
+                deveui=deveui,
+                gateway_id=gateway_id,
+                start_time=start_time,
+                end_time=end_time,
+                page=page,
+                stream=stream,
+                message_type=message_type,
+                late=late,
+                activation=activation,
+                ack=ack,
+            )
+            response = await self._request_async("GET", url, params=params)
+            logs = (self._parse_response(response) or {}).get("Logs")
+            if not logs:
+                return result
+            result.extend(logs)
+            page += 1
+
+    async def to_arrow(
+        self,
+        deveui: str | None = None,
+        gateway_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+        columns: Sequence[str] | None = None,
+        start_page: int = DEFAULT_START_PAGE,
+    ) -> pa.Table:
+        """Fetch all logs matching the filters into an Arrow table. Requires `pyarrow`.
+        See `to_columns` for the details.
+
+        Args:
+            deveui: Optional device EUI to filter by.
+            gateway_id: Optional gateway ID to filter by.
+            start_time: Optional ISO 8601 formatted start time.
+            end_time: Optional ISO 8601 formatted end time.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+            columns: Names of the columns to keep (see `LOG_COLUMNS`). All of them by default.
+            start_page: Page to start from.
+
+        Returns:
+            pyarrow.Table: The logs, in the order returned by the API.
+        """
+        columns_ = await self.to_columns(
+            deveui=deveui,
+            gateway_id=gateway_id,
+            start_time=start_time,
+            end_time=end_time,
+            stream=stream,
+            message_type=message_type,
+            late=late,
+            activation=activation,
+            ack=ack,
+            columns=columns,
+            start_page=start_page,
+        )
+        return columns_.to_arrow()
+
+    def export(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        deveuis: Sequence[str] | None = None,
+        gateway_ids: Sequence[str] | None = None,
+        shard_duration: timedelta = DEFAULT_SHARD_DURATION,
+        min_shard_duration: timedelta = DEFAULT_MIN_SHARD_DURATION,
+        concurrency: int = 8,
+        page_size: int | None = None,
+        stream: StreamFilter | None = None,
+        message_type: MessageTypeFilter | None = None,
+        late: LateFilter | None = None,
+        activation: ActivationFilter | None = None,
+        ack: AckFilter | None = None,
+    ) -> LogExporter:
+        """Export all logs of a time range, fetching time-window shards concurrently.
+        See `LogExporter` for how the range is sharded.
+
+        Args:
+            start_time: Start of the time range.
+            end_time: End of the time range.
+            deveuis: Optional device EUIs, each one is fetched as a separate shard.
+            gateway_ids: Optional gateway IDs, each one is fetched as a separate shard.
+            shard_duration: Initial duration of the time windows.
+            min_shard_duration: Dense windows are not bisected below this duration.
+            concurrency: Maximum number of requests in flight.
+            page_size: Page size of the API, learned from the responses if not provided.
+            stream: Optional stream filter for log frames.
+            message_type: Optional message type filter.
+            late: Optional late flag filter.
+            activation: Optional activation flag filter.
+            ack: Optional acknowledgment flag filter.
+
+        Returns:
+            LogExporter: Async iterable of the logs, in timestamp order.
+        """
+        return LogExporter(
+            self,
+            start_time,
+            end_time,
+            deveuis=deveuis,
+            gateway_ids=gateway_ids,
+            shard_duration=shard_duration,
+            min_shard_duration=min_shard_duration,
+            concurrency=concurrency,
+            page_size=page_size,
+            filters={
+                "stream": stream,
+                "message_type": message_type,
+                "late": late,
+                "activation": activation,
+                "ack": ack,
+            },
+        )
@@ -0,0 +1,221 @@
+"""Columnar decoding of log pages, for vectorized analytics with NumPy or Arrow."""
+
+from __future__ import annotations
+
+import enum
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from machineq.core.logs.models import LogInstance
+
+if TYPE_CHECKING:
+    import numpy as np  # ty:ignore[unresolved-import]
+    import pyarrow as pa  # ty:ignore[unresolved-import]
+
+
+class ColumnKind(str, enum.Enum):
+    TIMESTAMP = "timestamp"
+    """UTC timestamp, stored as int64 nanoseconds since the epoch"""
+    FLOAT = "float"
+    """float64, missing or invalid values are NaN"""
+    INT = "int"
+    """int64 with a validity mask"""
+    BOOL = "bool"
+    """bool with a validity mask, parsed from `true`/`false` or `1`/`0`"""
+    STRING = "string"
+    """Python strings"""
+
+
+LOG_COLUMNS: dict[str, ColumnKind] = {
+    "timestamp": ColumnKind.TIMESTAMP,
+    "deveui": ColumnKind.STRING,
+    "dev_addr": ColumnKind.STRING,
+    "gateway_id": ColumnKind.STRING,
+    "message_type": ColumnKind.STRING,
+    "fport": ColumnKind.INT,
+    "f_cnt": ColumnKind.INT,
+    "primary_gateway_rssi": ColumnKind.FLOAT,
+    "primary_gateway_snr": ColumnKind.FLOAT,
+    "primary_gateway_e_s_p": ColumnKind.FLOAT,
+    "spreading_factor": ColumnKind.INT,
+    "airtime": ColumnKind.FLOAT,
+    "sub_band": ColumnKind.INT,
+    "channel": ColumnKind.INT,
+    "gateway_count": ColumnKind.INT,
+    "late": ColumnKind.BOOL,
+    "gateway_latitude": ColumnKind.FLOAT,
+    "gateway_longitude": ColumnKind.FLOAT,
+    "device_latitude": ColumnKind.FLOAT,
+    "device_longitude": ColumnKind.FLOAT,
+    "payload_hex": ColumnKind.STRING,
+}
+"""Columns available for export, keyed by `LogInstance` field name, with their storage kind"""
+
+_TYPECODES = {ColumnKind.FLOAT: "d", ColumnKind.BOOL: "b"}
+"""`array` type code of the numeric columns, int64 for the others"""
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAT = -(2**63)
+"""Missing timestamp, read as NaT by NumPy"""
+_datetime_adapter = TypeAdapter(datetime)
+_BOOLS = {"true": True, "false": False, "1": True, "0": False}
+
+
+def _timestamp_ns(value: Any) -> int:  # noqa: ANN401
+    if not value:
+        return _NAT
+    try:
+        # fast path, fromisoformat only accepts a trailing Z since Python 3.11
+        dt = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except (TypeError, ValueError):
+        try:
+            dt = _datetime_adapter.validate_python(value)
+        except ValueError:
+            return _NAT
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+class LogColumns:
+    """Logs decoded into typed columns, straight from the JSON pages without building `LogInstance` models.
+
+    Numeric columns are kept in compact `array.array` buffers (8 bytes per value) and handed to NumPy or
+    Arrow without copying where possible. Usually created through `logs.to_columns`:
+
+    ```python
+    columns = client.logs.to_columns(start_time=start, end_time=end)
+    frame = columns.to_arrow().to_pandas()
+    ```
+    """
+
+    def __init__(self, columns: Sequence[str] | None = None):
+        """Initialize empty columns.
+
+        Args:
+            columns: Names of the columns to keep (see `LOG_COLUMNS`). All of them by default.
+        """
+        names = tuple(columns) if columns is not None else tuple(LOG_COLUMNS)
+        unknown = [name for name in names if name not in LOG_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown log columns: {', '.join(unknown)}")  # noqa: TRY003
+        self.names = names
+        self.kinds = {name: LOG_COLUMNS[name] for name in names}
+        self._aliases = {name: LogInstance.model_fields[name].alias or name for name in names}
+        self._values: dict[str, array | list[str | None]] = {}
+        self._valid: dict[str, bytearray] = {}
+        for name, kind in self.kinds.items():
+            if kind is ColumnKind.STRING:
+                self._values[name] = []
+            else:
+                self._values[name] = array(_TYPECODES.get(kind, "q"))
+                self._valid[name] = bytearray()
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def extend(self, logs: Iterable[dict[str, Any]]) -> None:
+        """Append logs given as raw JSON objects, as returned by the API"""
+        logs = list(logs)
+        for name, kind in self.kinds.items():
+            alias = self._aliases[name]
+            raw = [log.get(alias) for log in logs]
+            values = self._values[name]
+            if kind is ColumnKind.STRING:
+                values.extend(raw)
+                continue
+            valid = self._valid[name]
+            for value in raw:
+                if kind is ColumnKind.TIMESTAMP:
+                    parsed = _timestamp_ns(value)
+                    ok = parsed != _NAT
+                elif kind is ColumnKind.BOOL:
+                    flag = _BOOLS.get(str(value).lower())
+                    parsed, ok = int(bool(flag)), flag is not None
+                else:
+                    parsed, ok = self._parse_number(kind, value)
+                values.append(parsed)  # ty:ignore[invalid-argument-type]
+                valid.append(ok)
+        self._length += len(logs)
+
+    @staticmethod
+    def _parse_number(kind: ColumnKind, value: Any) -> tuple[float | int, bool]:  # noqa: ANN401
+        try:
+            return (float(value) if kind is ColumnKind.FLOAT else int(value)), True
+        except (TypeError, ValueError):
+            return (float("nan") if kind is ColumnKind.FLOAT else 0), False
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """Return the columns as NumPy arrays. Requires `numpy`.
+
+        Timestamps are `datetime64[ns]` (UTC, NaT when missing), floats are `float64` (NaN when missing),
+        integers are `int64` and booleans `bool`, or `float64` with NaN if some values are missing, and strings are
+        object arrays.
+        """
+        try:
+            import numpy as np  # ty:ignore[unresolved-import]
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise ImportError("to_numpy requires numpy, install it with `pip install machineq[numpy]`") from e  # noqa: TRY003
+
+        result = {}
+        for name, kind in self.kinds.items():
+            values = self._values[name]
+            if kind is ColumnKind.STRING:
+                result[name] = np.array(values, dtype=object)
+            elif kind is ColumnKind.TIMESTAMP:
+                result[name] = np.frombuffer(values, dtype=np.int64).view("datetime64[ns]")
+            elif kind is ColumnKind.FLOAT:
+                result[name] = np.frombuffer(values, dtype=np.float64)
+            else:
+                ints = np.frombuffer(values, dtype=np.bool_ if kind is ColumnKind.BOOL else np.int64)
+                valid = np.frombuffer(self._valid[name], dtype=np.bool_)
+                if valid.all():
+                    result[name] = ints
+                else:
+                    result[name] = np.where(valid, ints, np.nan)
+        return result
+
+    def to_arrow(self) -> pa.Table:
+        """Return the columns as an Arrow table. Requires `pyarrow`.
+
+        Numeric buffers are shared with the table without copying, except booleans which are bit-packed.
+        Missing values are nulls, except in float columns where they stay NaN.
+        """
+        try:
+            import pyarrow as pa  # ty:ignore[unresolved-import]
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise ImportError("to_arrow requires pyarrow, install it with `pip install machineq[arrow]`") from e  # noqa: TRY003
+
+        types = {
+            ColumnKind.TIMESTAMP: pa.timestamp("ns", tz="UTC"),
+            ColumnKind.FLOAT: pa.float64(),
+            ColumnKind.INT: pa.int64(),
+            ColumnKind.BOOL: pa.bool_(),
+        }
+        arrays = []
+        for name, kind in self.kinds.items():
+            values = self._values[name]
+            if kind is ColumnKind.STRING:
+                arrays.append(pa.array(values, type=pa.string()))
+                continue
+            valid = self._valid[name]
+            null_count = 0 if kind is ColumnKind.FLOAT else len(valid) - valid.count(1)
+            bitmap = _pack_bits(pa, valid) if null_count else None
+            data = _pack_bits(pa, values) if kind is ColumnKind.BOOL else pa.py_buffer(values)  # ty:ignore[invalid-argument-type]
+            arrays.append(pa.Array.from_buffers(types[kind], len(values), [bitmap, data], null_count=null_count))
+        return pa.Table.from_arrays(arrays, names=list(self.names))
+
+
+def _pack_bits(pa: Any, mask: bytearray | array) -> pa.Buffer:  # noqa: ANN401
+    """Pack a byte-per-value mask of 0 and 1 into an Arrow (LSB first) bitmap, with NumPy if installed"""
+    try:
+        import numpy as np  # ty:ignore[unresolved-import]
+    except ImportError:
+        # Arrow bit-packs the booleans cast from bytes
+        values = pa.Array.from_buffers(pa.uint8(), len(mask), [None, pa.py_buffer(mask)])
+        return values.cast(pa.bool_()).buffers()[1]
+    return pa.py_buffer(np.packbits(np.frombuffer(mask, dtype=np.uint8), bitorder="little"))
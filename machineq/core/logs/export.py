@@ -0,0 +1,190 @@
+"""Time-window sharded log export for the async client."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from machineq.core.logs.models import LogInstance
+from machineq.core.utils import ensure_utc
+
+if TYPE_CHECKING:
+    from machineq.core.logs.api import AsyncLogs
+
+DEFAULT_SHARD_DURATION = timedelta(hours=1)
+DEFAULT_MIN_SHARD_DURATION = timedelta(minutes=1)
+
+
+class LogExporter:
+    """Export all logs of a time range by fetching time-window shards concurrently.
+
+    The range is split into windows of `shard_duration`, and each window is optionally split further
+    per DevEUI and/or gateway ID. Shards whose first page comes back full are bisected until they are
+    shorter than `min_shard_duration`, after which they are paginated. At most `concurrency` requests
+    are in flight and at most `concurrency` windows are buffered. Logs are yielded in timestamp order.
+
+    Usually created through `AsyncLogs.export`:
+
+    ```python
+    async for log in client.logs.export(start_time, end_time, concurrency=16):
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        logs: AsyncLogs,
+        start_time: datetime,
+        end_time: datetime,
+        deveuis: Sequence[str] | None = None,
+        gateway_ids: Sequence[str] | None = None,
+        shard_duration: timedelta = DEFAULT_SHARD_DURATION,
+        min_shard_duration: timedelta = DEFAULT_MIN_SHARD_DURATION,
+        concurrency: int = 8,
+        page_size: int | None = None,
+        filters: dict[str, Any] | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            logs: Async logs resource used to fetch the pages.
+            start_time: Start of the time range.
+            end_time: End of the time range.
+            deveuis: Optional device EUIs, each one is fetched as a separate shard.
+            gateway_ids: Optional gateway IDs, each one is fetched as a separate shard.
+            shard_duration: Initial duration of the time windows.
+            min_shard_duration: Dense windows are not bisected below this duration.
+            concurrency: Maximum number of requests in flight.
+            page_size: Page size of the API. If not provided, the largest page seen so far is used
+                to decide whether a page is full, and shards are paginated rather than bisected
+                until a page was seen.
+            filters: Extra keyword arguments passed to `AsyncLogs.get_all` (e.g. `stream`).
+        """
+        self.start_time = ensure_utc(start_time)
+        self.end_time = ensure_utc(end_time)
+        if self.end_time < self.start_time:
+            raise ValueError("The end time cannot come before start time")  # noqa: TRY003
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")  # noqa: TRY003
+        if shard_duration <= timedelta(0):
+            raise ValueError("shard_duration must be positive")  # noqa: TRY003
+        self.shard_duration = shard_duration
+        self.min_shard_duration = min_shard_duration
+        self.concurrency = concurrency
+        self.filters = filters or {}
+        self._logs = logs
+        self._keys = list(itertools.product(deveuis or [None], gateway_ids or [None]))
+        self._page_size = page_size or 0
+        self._learn_page_size = page_size is None
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        self.pages_fetched = 0
+        """Number of page requests issued so far"""
+        self.shards_split = 0
+        """Number of times a dense shard was bisected"""
+
+    def _windows(self) -> list[tuple[datetime, datetime]]:
+        windows = []
+        start = self.start_time
+        while True:
+            end = min(start + self.shard_duration, self.end_time)
+            windows.append((start, end))
+            if end >= self.end_time:
+                return windows
+            start = end
+
+    def __aiter__(self) -> AsyncIterator[LogInstance]:
+        return self._iter()
+
+    async def _iter(self) -> AsyncIterator[LogInstance]:
+        windows = iter(self._windows())
+        in_flight: deque[asyncio.Task[list[LogInstance]]] = deque()
+
+        def schedule_next_window() -> None:
+            window = next(windows, None)
+            if window is not None:
+                in_flight.append(asyncio.ensure_future(self._fetch_window(*window)))
+
+        try:
+            for _ in range(self.concurrency):
+                schedule_next_window()
+            while in_flight:
+                logs = await in_flight.popleft()
+                schedule_next_window()
+                for log in logs:
+                    yield log
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _fetch_window(self, start: datetime, end: datetime) -> list[LogInstance]:
+        """Fetch every shard of a window and merge them in timestamp order"""
+        shards = await asyncio.gather(
+            *(self._fetch_shard(start, end, deveui, gateway_id) for deveui, gateway_id in self._keys)
+        )
+        return list(heapq.merge(*shards, key=lambda log: log.timestamp))
+
+    async def _fetch_shard(
+        self,
+        start: datetime,
+        end: datetime,
+        deveui: str | None,
+        gateway_id: str | None,
+    ) -> list[LogInstance]:
+        """Fetch a shard sorted by timestamp, bisecting it if it is dense"""
+        page = 1
+        logs = await self._get_page(start, end, deveui, gateway_id, page)
+        # until the page size is known, a non-empty first page may or may not be full: paginate it
+        # rather than bisecting a window that could be sparse
+        page_size_known = self._page_size > 0
+        full = self._is_full(logs)
+        if full and page_size_known and end - start > self.min_shard_duration:
+            self.shards_split += 1
+            middle = start + (end - start) / 2
+            left, right = await asyncio.gather(
+                self._fetch_shard(start, middle, deveui, gateway_id),
+                self._fetch_shard(middle, end, deveui, gateway_id),
+            )
+            return left + right
+        while full:
+            page += 1
+            next_page = await self._get_page(start, end, deveui, gateway_id, page)
+            logs.extend(next_page)
+            full = self._is_full(next_page)
+        # the time boundaries may be inclusive on the API side, keep each log in a single window
+        is_last = end >= self.end_time
+        logs = [log for log in logs if start <= log.timestamp < end or (is_last and log.timestamp == end)]
+        logs.sort(key=lambda log: log.timestamp)
+        return logs
+
+    def _is_full(self, logs: list[LogInstance]) -> bool:
+        """Whether a page may be followed by another one, compared with the page size known before it"""
+        full = bool(logs) and len(logs) >= self._page_size
+        if self._learn_page_size:
+            self._page_size = max(self._page_size, len(logs))
+        return full
+
+    async def _get_page(
+        self,
+        start: datetime,
+        end: datetime,
+        deveui: str | None,
+        gateway_id: str | None,
+        page: int,
+    ) -> list[LogInstance]:
+        async with self._semaphore:
+            self.pages_fetched += 1
+            return await self._logs.get_all(
+                deveui=deveui,
+                gateway_id=gateway_id,
+                start_time=start,
+                end_time=end,
+                page=page,
+                **self.filters,
+            )
@@ -41,8 +41,7 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
         Returns:
             list[MulticastGroup]: List of all multicast group instances.
         """
-        data = super()._get_all_generic()
-        return GetMulticastGroupsResponse(**data).multicast_groups
+        return super()._get_all_generic(GetMulticastGroupsResponse).multicast_groups
 
     def get(self, multicast_deveui: str) -> MulticastGroup:
         """Retrieve a multicast group by its MulticastDevEUI.
@@ -54,9 +53,8 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
             MulticastGroup: The multicast group instance matching the given DevEUI.
         """
         url = self._build_url(f"{multicast_deveui}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GetMulticastGroupResponse(**data).multicast_group
+        response = self._request("GET", url)
+        return self._parse_model(response, GetMulticastGroupResponse).multicast_group
 
     def create(self, data: CreateMulticastGroupRequest) -> bool:
         """Create a new multicast group.
@@ -68,13 +66,12 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
             bool: True if the creation was successful, False otherwise.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def update(
         self,
@@ -91,13 +88,12 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{multicast_deveui}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, multicast_deveui: str) -> bool:
         """Delete a multicast group.
@@ -109,9 +105,8 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
             bool: True if the deletion was successful, False otherwise.
         """
         url = self._build_url(f"{multicast_deveui}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return CommonOKResponse(**data).response
+        response = self._request("DELETE", url)
+        return self._parse_model(response, CommonOKResponse).response
 
     def add_gateways(
         self,
@@ -129,13 +124,12 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
         """
         url = self._build_url(f"{multicast_deveui}/gateways/associate")
         data = AddGatewaysWithMulticastGroupRequest(gateways=node_ids)
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return AddGatewaysWithMulticastGroupResponse(**result)
+        return self._parse_model(response, AddGatewaysWithMulticastGroupResponse)
 
     def remove_gateways(
         self,
@@ -153,13 +147,12 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
         """
         url = self._build_url(f"{multicast_deveui}/gateways/deassociate")
         data = RemoveGatewaysFromMulticastGroupRequest(gateways=node_ids)
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return RemoveGatewaysFromMulticastGroupResponse(**result)
+        return self._parse_model(response, RemoveGatewaysFromMulticastGroupResponse)
 
     def get_all_gateways(
         self,
@@ -174,9 +167,8 @@ class SyncMulticastGroups(BaseResource["SyncClient"]):
             list[str]: NodeIDs in the multicast group.
         """
         url = self._build_url(f"{multicast_deveui}/gateways")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GetGatewaysByMulticastGroupResponse(**data).gateways
+        response = self._request("GET", url)
+        return self._parse_model(response, GetGatewaysByMulticastGroupResponse).gateways
 
 
 class AsyncMulticastGroups(BaseResource["AsyncClient"]):
@@ -191,8 +183,7 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
         Returns:
             list[MulticastGroup]: List of all multicast group instances.
         """
-        data = await super()._get_all_generic_async()
-        return GetMulticastGroupsResponse(**data).multicast_groups
+        return (await super()._get_all_generic_async(GetMulticastGroupsResponse)).multicast_groups
 
     async def get(self, multicast_deveui: str) -> MulticastGroup:
         """Retrieve a multicast group by its MulticastDevEUI.
@@ -204,9 +195,8 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
             MulticastGroup: The multicast group instance matching the given DevEUI.
         """
         url = self._build_url(f"{multicast_deveui}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GetMulticastGroupResponse(**data).multicast_group
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, GetMulticastGroupResponse).multicast_group
 
     async def create(self, data: CreateMulticastGroupRequest) -> bool:
         """Create a new multicast group.
@@ -218,13 +208,12 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
             bool: True if the creation was successful, False otherwise.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def update(
         self,
@@ -241,13 +230,12 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{multicast_deveui}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, multicast_deveui: str) -> bool:
         """Delete a multicast group.
@@ -259,9 +247,8 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
             bool: True if the deletion was successful, False otherwise.
         """
         url = self._build_url(f"{multicast_deveui}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return CommonOKResponse(**data).response
+        response = await self._request_async("DELETE", url)
+        return self._parse_model(response, CommonOKResponse).response
 
     async def add_gateways(
         self,
@@ -279,13 +266,12 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
         """
         url = self._build_url(f"{multicast_deveui}/gateways/associate")
         data = AddGatewaysWithMulticastGroupRequest(gateways=node_ids)
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return AddGatewaysWithMulticastGroupResponse(**result)
+        return self._parse_model(response, AddGatewaysWithMulticastGroupResponse)
 
     async def remove_gateways(
         self,
@@ -303,13 +289,12 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
         """
         url = self._build_url(f"{multicast_deveui}/gateways/deassociate")
         data = RemoveGatewaysFromMulticastGroupRequest(gateways=node_ids)
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return RemoveGatewaysFromMulticastGroupResponse(**result)
+        return self._parse_model(response, RemoveGatewaysFromMulticastGroupResponse)
 
     async def get_all_gateways(
         self,
@@ -324,6 +309,5 @@ class AsyncMulticastGroups(BaseResource["AsyncClient"]):
             list[str]: NodeIDs in the multicast group.
         """
         url = self._build_url(f"{multicast_deveui}/gateways")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return GetGatewaysByMulticastGroupResponse(**data).gateways
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, GetGatewaysByMulticastGroupResponse).gateways
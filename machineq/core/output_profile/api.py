@@ -34,8 +34,7 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
         Returns:
             list[OutputProfileInstance]: List of all output profile instances.
         """
-        data = super()._get_all_generic()
-        return OutputProfileResponse(**data).output_profiles
+        return super()._get_all_generic(OutputProfileResponse).output_profiles
 
     def get(self, profile_id: str) -> OutputProfileInstance:
         """Retrieve an output profile by its ID.
@@ -47,9 +46,8 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             OutputProfileInstance: The output profile instance matching the given ID.
         """
         url = self._build_url(f"{profile_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return OutputProfileInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, OutputProfileInstance)
 
     def create(self, data: OutputProfileCreate) -> str:
         """Create a new output profile.
@@ -61,13 +59,12 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             str: The ID of the newly created output profile.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return OutputProfileCreateResponse(**result).id
+        return self._parse_model(response, OutputProfileCreateResponse).id
 
     def update(
         self,
@@ -84,13 +81,12 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             OutputProfileInstance: The updated output profile instance.
         """
         url = self._build_url(f"{profile_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(
         self,
@@ -107,13 +103,12 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             OutputProfileInstance: The updated output profile instance.
         """
         url = self._build_url(f"{profile_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, profile_id: str) -> None:
         """Delete an output profile.
@@ -125,7 +120,7 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{profile_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
     def update_devices(
@@ -143,13 +138,12 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             OutputProfileDevicesUpdateResponse: The response containing updated device associations.
         """
         url = self._build_url(f"{profile_id}/devices")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return OutputProfileDevicesUpdateResponse(**result)
+        return self._parse_model(response, OutputProfileDevicesUpdateResponse)
 
     def add_devices(
         self,
@@ -166,13 +160,12 @@ class SyncOutputProfiles(BaseResource["SyncClient"]):
             OutputProfileDevicesUpdateResponse: The response containing updated device associations.
         """
         url = self._build_url(f"{profile_id}/devices")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return OutputProfileDevicesUpdateResponse(**result)
+        return self._parse_model(response, OutputProfileDevicesUpdateResponse)
 
 
 class AsyncOutputProfiles(BaseResource["AsyncClient"]):
@@ -187,8 +180,7 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
         Returns:
             list[OutputProfileInstance]: List of all output profile instances.
         """
-        data = await super()._get_all_generic_async()
-        return OutputProfileResponse(**data).output_profiles
+        return (await super()._get_all_generic_async(OutputProfileResponse)).output_profiles
 
     async def get(self, profile_id: str) -> OutputProfileInstance:
         """Retrieve an output profile by its ID.
@@ -200,9 +192,8 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             OutputProfileInstance: The output profile instance matching the given ID.
         """
         url = self._build_url(f"{profile_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return OutputProfileInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, OutputProfileInstance)
 
     async def create(self, data: OutputProfileCreate) -> str:
         """Create a new output profile.
@@ -214,13 +205,12 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             str: The ID of the newly created output profile.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return OutputProfileCreateResponse(**result).id
+        return self._parse_model(response, OutputProfileCreateResponse).id
 
     async def update(
         self,
@@ -237,13 +227,12 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{profile_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(
         self,
@@ -260,13 +249,12 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             bool: True if the patch was successful, False otherwise.
         """
         url = self._build_url(f"{profile_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, profile_id: str) -> None:
         """Delete an output profile.
@@ -278,7 +266,7 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{profile_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
 
     async def update_devices(
@@ -296,13 +284,12 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             OutputProfileDevicesUpdateResponse: The response containing updated device associations.
         """
         url = self._build_url(f"{profile_id}/devices")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return OutputProfileDevicesUpdateResponse(**result)
+        return self._parse_model(response, OutputProfileDevicesUpdateResponse)
 
     async def add_devices(
         self,
@@ -319,10 +306,9 @@ class AsyncOutputProfiles(BaseResource["AsyncClient"]):
             OutputProfileDevicesUpdateResponse: The response containing updated device associations.
         """
         url = self._build_url(f"{profile_id}/devices")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return OutputProfileDevicesUpdateResponse(**result)
+        return self._parse_model(response, OutputProfileDevicesUpdateResponse)
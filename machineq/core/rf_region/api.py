@@ -27,8 +27,7 @@ class SyncRFRegions(BaseResource["SyncClient"]):
         Returns:
             list[RFRegionInstance]: List of all RF region instances.
         """
-        data = super()._get_all_generic()
-        return ListRFRegionsResponse(**data).rf_regions
+        return super()._get_all_generic(ListRFRegionsResponse).rf_regions
 
 
 class AsyncRFRegions(BaseResource["AsyncClient"]):
@@ -44,6 +43,5 @@ class AsyncRFRegions(BaseResource["AsyncClient"]):
             list[RFRegionInstance]: List of all RF region instances.
         """
         url = self._build_url()
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return ListRFRegionsResponse(**data).rf_regions
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, ListRFRegionsResponse).rf_regions
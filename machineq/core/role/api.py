@@ -28,53 +28,48 @@ class SyncRoles(BaseResource["SyncClient"]):
 
     def get_all(self) -> list[RoleInstance]:
         """List all roles."""
-        data = super()._get_all_generic()
-        return RoleResponse(**data).roles
+        return super()._get_all_generic(RoleResponse).roles
 
     def get(self, role_id: str) -> RoleInstance:
         """Get role by ID."""
         url = self._build_url(f"{role_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return RoleInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, RoleInstance)
 
     def create(self, data: RoleCreate) -> str:
         """Create a new role."""
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return RoleCreateResponse(**result).id
+        return self._parse_model(response, RoleCreateResponse).id
 
     def update(self, role_id: str, data: RoleUpdate) -> bool:
         """Update role (full replacement)."""
         url = self._build_url(f"{role_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, role_id: str, data: RolePatch) -> bool:
         """Partially update role."""
         url = self._build_url(f"{role_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, role_id: str) -> None:
         """Delete role."""
         url = self._build_url(f"{role_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
 
@@ -86,8 +81,7 @@ class AsyncRoles(BaseResource["AsyncClient"]):
 
     async def get_all(self) -> list[RoleInstance]:
         """List all roles."""
-        data = await super()._get_all_generic_async()
-        return RoleResponse(**data).roles
+        return (await super()._get_all_generic_async(RoleResponse)).roles
 
     async def get(self, role_id: str) -> RoleInstance:
         """Get role by ID.
@@ -98,9 +92,8 @@ class AsyncRoles(BaseResource["AsyncClient"]):
         Returns: The role instance corresponding to the provided ID.
         """
         url = self._build_url(f"{role_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return RoleInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, RoleInstance)
 
     async def create(self, data: RoleCreate) -> str:
         """Create a new role.
@@ -110,13 +103,12 @@ class AsyncRoles(BaseResource["AsyncClient"]):
         Returns: The ID of the created role.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return RoleCreateResponse(**result).id
+        return self._parse_model(response, RoleCreateResponse).id
 
     async def update(self, role_id: str, data: RoleUpdate) -> bool:
         """Fully update a role.
@@ -129,13 +121,12 @@ class AsyncRoles(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{role_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, role_id: str, data: RolePatch) -> bool:
         """
@@ -149,13 +140,12 @@ class AsyncRoles(BaseResource["AsyncClient"]):
             bool: True if the patch was successful, False otherwise.
         """
         url = self._build_url(f"{role_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, role_id: str) -> None:
         """Delete role by ID.
@@ -164,5 +154,5 @@ class AsyncRoles(BaseResource["AsyncClient"]):
             role_id (str): The unique identifier of the role to delete.
         """
         url = self._build_url(f"{role_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
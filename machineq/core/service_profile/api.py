@@ -23,8 +23,7 @@ class SyncServiceProfiles(BaseResource["SyncClient"]):
 
     def get_all(self) -> list[ServiceProfileInstance]:
         """List all service profiles."""
-        data = super()._get_all_generic()
-        return ServiceProfilesResponse(**data).service_profiles
+        return super()._get_all_generic(ServiceProfilesResponse).service_profiles
 
 
 class AsyncServiceProfiles(BaseResource["AsyncClient"]):
@@ -35,5 +34,4 @@ class AsyncServiceProfiles(BaseResource["AsyncClient"]):
 
     async def get_all(self) -> list[ServiceProfileInstance]:
         """List all service profiles."""
-        data = await super()._get_all_generic_async()
-        return ServiceProfilesResponse(**data).service_profiles
+        return (await super()._get_all_generic_async(ServiceProfilesResponse)).service_profiles
@@ -1,4 +1,11 @@
-from pydantic import BaseModel, ConfigDict
+from __future__ import annotations
+
+import functools
+from collections import namedtuple
+from collections.abc import Iterator, Sequence
+from typing import Any, Generic, TypeVar, overload
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from pydantic.alias_generators import to_pascal
 
 
@@ -30,3 +37,127 @@ class BaseModelWithConfig(BaseModel):
 # many APIs in case of success return just {"Response": true}
 class CommonOKResponse(BaseModelWithConfig):
     response: bool
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class LazyList(Sequence[M], Generic[M]):
+    """Read-only list of models that keeps the raw JSON objects and validates each item on first access.
+
+    `len` and `raw` never validate anything, and indexing or iterating only validates the items
+    reached. Validated items replace their raw object, so each one is validated at most once.
+    Use `list(lazy)` to validate everything at once. Since validation is deferred, an invalid item
+    only raises `pydantic.ValidationError` when it is accessed.
+    """
+
+    def __init__(self, model: type[M], items: list[dict[str, Any]]):
+        """Initialize the list.
+
+        Args:
+            model: Model of the items.
+            items: Raw JSON objects, as returned by the API.
+        """
+        self.model = model
+        self._items: list[dict[str, Any] | M] = list(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _validate(self, index: int) -> M:
+        item = self._items[index]
+        if isinstance(item, dict):
+            item = self.model.model_validate(item)
+            self._items[index] = item
+        return item
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazyList[M]: ...
+
+    def __getitem__(self, index: int | slice) -> M | LazyList[M]:
+        if isinstance(index, slice):
+            sliced = LazyList(self.model, [])
+            sliced._items = self._items[index]
+            return sliced
+        return self._validate(index)
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(len(self._items)):
+            yield self._validate(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        validated = sum(1 for item in self._items if not isinstance(item, dict))
+        return f"LazyList[{self.model.__name__}](len={len(self)}, validated={validated})"
+
+    def raw(self, index: int) -> dict[str, Any]:
+        """Return an item as JSON, keyed by API field names (e.g. `"DevEUI"`), without validating it"""
+        item = self._items[index]
+        if isinstance(item, dict):
+            return item
+        return item.model_dump(mode="json", by_alias=True)
+
+
+class ModelProjection:
+    """Builds compact records holding only some fields of a model, straight from the JSON objects.
+
+    The records are named tuples, so they have no per-instance `__dict__`. Only the projected fields
+    are validated, each against its type in the model, and nested objects that are not projected
+    are skipped entirely. Missing fields are set to None. Use `projection` to get a cached instance.
+    """
+
+    def __init__(self, model: type[BaseModel], fields: Sequence[str]):
+        """Initialize the projection.
+
+        Args:
+            model: Model to project, e.g. `DeviceInstance`.
+            fields: Names of the model fields to keep, e.g. `("deveui", "name", "last_uplink")`.
+        """
+        unknown = [name for name in fields if name not in model.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown fields for {model.__name__}: {', '.join(unknown)}")  # noqa: TRY003
+        if not fields:
+            raise ValueError("At least one field is required")  # noqa: TRY003
+        self.model = model
+        self.fields = tuple(fields)
+        self.record = namedtuple(f"{model.__name__}Record", self.fields)
+        """Named tuple type of the records"""
+        self._aliases = [model.model_fields[name].alias or name for name in self.fields]
+        self._adapters = [TypeAdapter(model.model_fields[name].annotation) for name in self.fields]
+
+    def __call__(self, item: dict[str, Any]) -> tuple[Any, ...]:
+        """Build the record of a JSON object, keyed by API field names"""
+        return self.record(
+            *(
+                None if (value := item.get(alias)) is None else adapter.validate_python(value)
+                for alias, adapter in zip(self._aliases, self._adapters, strict=True)
+            )
+        )
+
+    def project_groups(self, container: type[BaseModel], data: dict[str, Any]) -> dict[str, list[Any]]:
+        """Project a JSON response grouping lists of items, e.g. devices by health status.
+
+        Args:
+            container: Model of the response, e.g. `DevicesHealthResponse`.
+            data: The JSON response.
+
+        Returns:
+            The records of each group, keyed by field name of `container` (e.g. `"offline"`).
+        """
+        return {
+            name: [self(item) for item in data.get(info.alias or name) or []]
+            for name, info in container.model_fields.items()
+        }
+
+
+@functools.lru_cache(maxsize=64)
+def projection(model: type[BaseModel], fields: tuple[str, ...]) -> ModelProjection:
+    """Return the projection of `model` on `fields`, reusing it across calls"""
+    return ModelProjection(model, fields)
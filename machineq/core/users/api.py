@@ -32,8 +32,7 @@ class SyncUsers(BaseResource["SyncClient"]):
         Returns:
             list[UserInstance]: List of all user instances.
         """
-        data = super()._get_all_generic()
-        return UserResponse(**data).users
+        return super()._get_all_generic(UserResponse).users
 
     def get(self, user_id: str) -> UserInstance:
         """Retrieve a user by their ID.
@@ -45,9 +44,8 @@ class SyncUsers(BaseResource["SyncClient"]):
             UserInstance: The user instance matching the given ID.
         """
         url = self._build_url(f"{user_id}")
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return UserInstance(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, UserInstance)
 
     def create(self, data: UserCreate) -> str:
         """Create a new user.
@@ -59,13 +57,12 @@ class SyncUsers(BaseResource["SyncClient"]):
             str: The ID of the newly created user.
         """
         url = self._build_url()
-        response = self.client.http_client.post(
+        response = self._request(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return UserCreateResponse(**result).id
+        return self._parse_model(response, UserCreateResponse).id
 
     def update(self, user_id: str, data: UserUpdate) -> bool:
         """Update a user (full replacement).
@@ -78,13 +75,12 @@ class SyncUsers(BaseResource["SyncClient"]):
             UserInstance: The updated user instance.
         """
         url = self._build_url(f"{user_id}")
-        response = self.client.http_client.put(
+        response = self._request(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def patch(self, user_id: str, data: UserPatch) -> bool:
         """Partially update a user.
@@ -97,13 +93,12 @@ class SyncUsers(BaseResource["SyncClient"]):
             UserInstance: The updated user instance.
         """
         url = self._build_url(f"{user_id}")
-        response = self.client.http_client.patch(
+        response = self._request(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     def delete(self, user_id: str) -> None:
         """Delete a user.
@@ -115,7 +110,7 @@ class SyncUsers(BaseResource["SyncClient"]):
             None
         """
         url = self._build_url(f"{user_id}")
-        response = self.client.http_client.delete(url, headers=self._build_headers())
+        response = self._request("DELETE", url)
         self._parse_response(response)
 
 
@@ -131,8 +126,7 @@ class AsyncUsers(BaseResource["AsyncClient"]):
         Returns:
             list[UserInstance]: List of all user instances.
         """
-        data = await super()._get_all_generic_async()
-        return UserResponse(**data).users
+        return (await super()._get_all_generic_async(UserResponse)).users
 
     async def get(self, user_id: str) -> UserInstance:
         """Retrieve a user by their ID.
@@ -144,9 +138,8 @@ class AsyncUsers(BaseResource["AsyncClient"]):
             UserInstance: The user instance matching the given ID.
         """
         url = self._build_url(f"{user_id}")
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return UserInstance(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, UserInstance)
 
     async def create(self, data: UserCreate) -> str:
         """Create a new user.
@@ -158,13 +151,12 @@ class AsyncUsers(BaseResource["AsyncClient"]):
             str: The ID of the newly created user.
         """
         url = self._build_url()
-        response = await self.client.http_client.post(
+        response = await self._request_async(
+            "POST",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return UserCreateResponse(**result).id
+        return self._parse_model(response, UserCreateResponse).id
 
     async def update(self, user_id: str, data: UserUpdate) -> bool:
         """Update a user (full replacement).
@@ -177,13 +169,12 @@ class AsyncUsers(BaseResource["AsyncClient"]):
             bool: True if the update was successful, False otherwise.
         """
         url = self._build_url(f"{user_id}")
-        response = await self.client.http_client.put(
+        response = await self._request_async(
+            "PUT",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def patch(self, user_id: str, data: UserPatch) -> bool:
         """Partially update a user.
@@ -196,13 +187,12 @@ class AsyncUsers(BaseResource["AsyncClient"]):
             bool: True if the patch was successful, False otherwise.
         """
         url = self._build_url(f"{user_id}")
-        response = await self.client.http_client.patch(
+        response = await self._request_async(
+            "PATCH",
             url,
             content=self._serialize_request_data(data),
-            headers=self._build_headers(),
         )
-        result = self._parse_response(response)
-        return CommonOKResponse(**result).response
+        return self._parse_model(response, CommonOKResponse).response
 
     async def delete(self, user_id: str) -> None:
         """Delete a user.
@@ -214,5 +204,5 @@ class AsyncUsers(BaseResource["AsyncClient"]):
             None
         """
         url = self._build_url(f"{user_id}")
-        response = await self.client.http_client.delete(url, headers=self._build_headers())
+        response = await self._request_async("DELETE", url)
         self._parse_response(response)
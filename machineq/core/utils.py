@@ -2,7 +2,7 @@ import warnings
 from datetime import datetime, timezone
 
 
-def ensure_utc_and_str(dt: datetime) -> str:
+def ensure_utc(dt: datetime) -> datetime:
     """Ensure a datetime is timezone-aware in timezone.utc.
     If the user provides a naive datetime, issue a warning and try our best to convert from local
     timezone to timezone.utc. If the user provides a timezone-aware datetime, convert it to timezone.utc if it's not already.
@@ -14,10 +14,15 @@ def ensure_utc_and_str(dt: datetime) -> str:
             "Naive datetime provided. Assuming local timezone and converting to timezone.utc. "
             "Please provide timezone-aware datetimes in the future.",
             UserWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
         dt = dt.astimezone(timezone.utc)
     else:
         # Timezone-aware datetime, convert to timezone.utc if it's not already
         dt = dt.astimezone(timezone.utc)
-    return dt.isoformat().replace("+00:00", "Z")
+    return dt
+
+
+def ensure_utc_and_str(dt: datetime) -> str:
+    """Same as `ensure_utc`, formatted as an ISO 8601 string with a `Z` suffix."""
+    return ensure_utc(dt).isoformat().replace("+00:00", "Z")
@@ -21,9 +21,8 @@ class SyncVersion(BaseResource["SyncClient"]):
     def get(self) -> VersionResponse:
         """Get API version."""
         url = self._build_url()
-        response = self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return VersionResponse(**data)
+        response = self._request("GET", url)
+        return self._parse_model(response, VersionResponse)
 
 
 class AsyncVersion(BaseResource["AsyncClient"]):
@@ -35,6 +34,5 @@ class AsyncVersion(BaseResource["AsyncClient"]):
     async def get(self) -> VersionResponse:
         """Get API version."""
         url = self._build_url()
-        response = await self.client.http_client.get(url, headers=self._build_headers())
-        data = self._parse_response(response)
-        return VersionResponse(**data)
+        response = await self._request_async("GET", url)
+        return self._parse_model(response, VersionResponse)
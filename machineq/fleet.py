@@ -0,0 +1,281 @@
+"""In-memory registry of the fleet, with hash indexes for constant time lookups."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from machineq.core.device.models import DeviceInstance, DevicePatch
+from machineq.core.device_group.models import DeviceGroupInstance, DeviceGroupPatch
+from machineq.core.gateway.models import GatewayInstance, GatewayPatch
+from machineq.core.multicast_group.models import MulticastGroup
+
+if TYPE_CHECKING:
+    from machineq.client.async_ import AsyncClient
+    from machineq.client.sync import SyncClient
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class _Table(Generic[M]):
+    """Models keyed by one of their fields, with a hash index on some other fields"""
+
+    def __init__(self, key: str, indexed: tuple[str, ...]):
+        self.key = key
+        self.items: dict[str, M] = {}
+        self.indexes: dict[str, defaultdict[str, set[str]]] = {name: defaultdict(set) for name in indexed}
+
+    def upsert(self, item: M) -> None:
+        key = getattr(item, self.key)
+        self.remove(key)
+        self.items[key] = item
+        for name, index in self.indexes.items():
+            index[getattr(item, name)].add(key)
+
+    def remove(self, key: str) -> M | None:
+        item = self.items.pop(key, None)
+        if item is not None:
+            for name, index in self.indexes.items():
+                keys = index[getattr(item, name)]
+                keys.discard(key)
+                if not keys:
+                    del index[getattr(item, name)]
+        return item
+
+    def patch(self, key: str, patch: BaseModel) -> M | None:
+        """Apply the fields set in a patch model, ignoring those the items do not have"""
+        item = self.items.get(key)
+        if item is None:
+            return None
+        fields = type(item).model_fields
+        update = {name: value for name, value in patch if value is not None and name in fields}
+        patched = item.model_copy(update=update)
+        self.upsert(patched)
+        return patched
+
+    def find(self, name: str, value: str) -> set[str]:
+        return self.indexes[name].get(value, set())
+
+
+class FleetIndex:
+    """Devices, gateways, device groups and multicast groups held in memory, with hash indexes.
+
+    Devices are indexed by DevEUI and by service, device and output profile and decoder type, gateways by ID,
+    node ID and MAC address, device groups by member, and multicast groups by multicast DevEUI. Lookups are
+    dict accesses instead of scans of the `get_all` lists.
+
+    The index is kept in sync with the changes made through the API by calling `upsert_*` with the
+    created or fetched items, `patch_*` with the patches that were applied and `remove_*` after deletions,
+    so it never has to be rebuilt. It is not thread-safe.
+
+    ```python
+    fleet = FleetIndex.from_client(client)
+    client.devices.patch(deveui, patch)
+    fleet.patch_device(deveui, patch)
+    sensors = fleet.find_devices(device_profile=profile_id, group_id=group_id)
+    ```
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[DeviceInstance] = (),
+        gateways: Iterable[GatewayInstance] = (),
+        device_groups: Iterable[DeviceGroupInstance] = (),
+        multicast_groups: Iterable[MulticastGroup] = (),
+    ):
+        """Build the index.
+
+        Args:
+            devices: Devices, e.g. from `devices.get_all()`.
+            gateways: Gateways, e.g. from `gateways.get_all()`.
+            device_groups: Device groups, e.g. from `device_groups.get_all()`.
+            multicast_groups: Multicast groups, e.g. from `multicast_groups.get_all()`.
+        """
+        self._devices: _Table[DeviceInstance] = _Table(
+            "deveui", ("service_profile", "device_profile", "output_profile", "decoder_type")
+        )
+        self._gateways: _Table[GatewayInstance] = _Table("id", ("node_id", "mac_address"))
+        self._multicast_groups: _Table[MulticastGroup] = _Table("multicast_deveui", ())
+        self._device_groups: dict[str, DeviceGroupInstance] = {}
+        self._groups_by_member: defaultdict[str, set[str]] = defaultdict(set)
+        for device in devices:
+            self.upsert_device(device)
+        for gateway in gateways:
+            self.upsert_gateway(gateway)
+        for group in device_groups:
+            self.upsert_device_group(group)
+        for multicast_group in multicast_groups:
+            self.upsert_multicast_group(multicast_group)
+
+    @classmethod
+    def from_client(cls, client: SyncClient) -> FleetIndex:
+        """Build the index from the listings of a sync client"""
+        return cls(
+            client.devices.get_all(),
+            client.gateways.get_all(),
+            client.device_groups.get_all(),
+            client.multicast_groups.get_all(),
+        )
+
+    @classmethod
+    async def from_client_async(cls, client: AsyncClient) -> FleetIndex:
+        """Build the index from the listings of an async client, fetched concurrently"""
+        devices, gateways, device_groups, multicast_groups = await asyncio.gather(
+            client.devices.get_all(),
+            client.gateways.get_all(),
+            client.device_groups.get_all(),
+            client.multicast_groups.get_all(),
+        )
+        return cls(devices, gateways, device_groups, multicast_groups)
+
+    # devices
+
+    @property
+    def devices(self) -> list[DeviceInstance]:
+        return list(self._devices.items.values())
+
+    def device(self, deveui: str) -> DeviceInstance | None:
+        return self._devices.items.get(deveui)
+
+    def find_devices(
+        self,
+        service_profile: str | None = None,
+        device_profile: str | None = None,
+        output_profile: str | None = None,
+        decoder_type: str | None = None,
+        group_id: str | None = None,
+    ) -> list[DeviceInstance]:
+        """Return the devices matching all the given criteria"""
+        criteria = {
+            "service_profile": service_profile,
+            "device_profile": device_profile,
+            "output_profile": output_profile,
+            "decoder_type": decoder_type,
+        }
+        matches = [self._devices.find(name, value) for name, value in criteria.items() if value is not None]
+        if group_id is not None:
+            matches.append(self.group_members(group_id))
+        if not matches:
+            return self.devices
+        # intersect starting from the smallest set
+        matches.sort(key=len)
+        deveuis = matches[0].intersection(*matches[1:])
+        return [self._devices.items[deveui] for deveui in deveuis if deveui in self._devices.items]
+
+    def upsert_device(self, device: DeviceInstance) -> None:
+        """Add a device, or replace the one with the same DevEUI"""
+        self._devices.upsert(device)
+
+    def patch_device(self, deveui: str, patch: DevicePatch) -> DeviceInstance | None:
+        """Apply a patch sent with `devices.patch` to the indexed device.
+
+        Returns:
+            DeviceInstance | None: The patched device, or None if it is not indexed.
+        """
+        device = self._devices.patch(deveui, patch)
+        if device is not None and patch.remove_output_profile:
+            device = device.model_copy(update={"output_profile": ""})
+            self._devices.upsert(device)
+        return device
+
+    def remove_device(self, deveui: str) -> DeviceInstance | None:
+        """Remove a deleted device, returning it if it was indexed"""
+        return self._devices.remove(deveui)
+
+    # gateways
+
+    @property
+    def gateways(self) -> list[GatewayInstance]:
+        return list(self._gateways.items.values())
+
+    def gateway(self, gateway_id: str) -> GatewayInstance | None:
+        return self._gateways.items.get(gateway_id)
+
+    def gateway_by_node_id(self, node_id: str) -> GatewayInstance | None:
+        return self._first(self._gateways, self._gateways.find("node_id", node_id))
+
+    def gateway_by_mac_address(self, mac_address: str) -> GatewayInstance | None:
+        return self._first(self._gateways, self._gateways.find("mac_address", mac_address))
+
+    def upsert_gateway(self, gateway: GatewayInstance) -> None:
+        """Add a gateway, or replace the one with the same ID"""
+        self._gateways.upsert(gateway)
+
+    def patch_gateway(self, gateway_id: str, patch: GatewayPatch) -> GatewayInstance | None:
+        """Apply a patch sent with `gateways.patch` to the indexed gateway, returning it if it is indexed"""
+        return self._gateways.patch(gateway_id, patch)
+
+    def remove_gateway(self, gateway_id: str) -> GatewayInstance | None:
+        """Remove a deleted gateway, returning it if it was indexed"""
+        return self._gateways.remove(gateway_id)
+
+    @staticmethod
+    def _first(table: _Table[M], keys: set[str]) -> M | None:
+        return table.items[next(iter(keys))] if keys else None
+
+    # device groups
+
+    @property
+    def device_groups(self) -> list[DeviceGroupInstance]:
+        return list(self._device_groups.values())
+
+    def device_group(self, group_id: str) -> DeviceGroupInstance | None:
+        return self._device_groups.get(group_id)
+
+    def group_members(self, group_id: str) -> set[str]:
+        """Return the DevEUIs of the members of a device group"""
+        group = self._device_groups.get(group_id)
+        return set(group.device_list) if group is not None else set()
+
+    def groups_of(self, deveui: str) -> set[str]:
+        """Return the IDs of the device groups holding a device"""
+        return set(self._groups_by_member.get(deveui, ()))
+
+    def upsert_device_group(self, group: DeviceGroupInstance) -> None:
+        """Add a device group, or replace the one with the same ID"""
+        self.remove_device_group(group.id)
+        self._device_groups[group.id] = group
+        for deveui in group.device_list:
+            self._groups_by_member[deveui].add(group.id)
+
+    def patch_device_group(self, group_id: str, patch: DeviceGroupPatch) -> DeviceGroupInstance | None:
+        """Apply a patch sent with `device_groups.patch` to the indexed group, returning it if it is indexed"""
+        group = self._device_groups.get(group_id)
+        if group is None:
+            return None
+        update = {name: value for name, value in patch if value is not None}
+        group = group.model_copy(update=update)
+        self.upsert_device_group(group)
+        return group
+
+    def remove_device_group(self, group_id: str) -> DeviceGroupInstance | None:
+        """Remove a deleted device group, returning it if it was indexed"""
+        group = self._device_groups.pop(group_id, None)
+        if group is not None:
+            for deveui in group.device_list:
+                groups = self._groups_by_member[deveui]
+                groups.discard(group_id)
+                if not groups:
+                    del self._groups_by_member[deveui]
+        return group
+
+    # multicast groups
+
+    @property
+    def multicast_groups(self) -> list[MulticastGroup]:
+        return list(self._multicast_groups.items.values())
+
+    def multicast_group(self, multicast_deveui: str) -> MulticastGroup | None:
+        return self._multicast_groups.items.get(multicast_deveui)
+
+    def upsert_multicast_group(self, group: MulticastGroup) -> None:
+        """Add a multicast group, or replace the one with the same multicast DevEUI"""
+        self._multicast_groups.upsert(group)
+
+    def remove_multicast_group(self, multicast_deveui: str) -> MulticastGroup | None:
+        """Remove a deleted multicast group, returning it if it was indexed"""
+        return self._multicast_groups.remove(multicast_deveui)
@@ -0,0 +1,299 @@
+"""Local SQLite mirror of the fleet inventory (devices, device groups and gateways), refreshed with deltas."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from machineq.core.device.models import DeviceInstance
+from machineq.core.device_group.models import DeviceGroupInstance
+from machineq.core.gateway.models import GatewayInstance
+from machineq.core.shared.models import LazyList
+from machineq.core.utils import ensure_utc
+
+if TYPE_CHECKING:
+    from machineq.client.async_ import AsyncClient
+    from machineq.client.sync import SyncClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS devices (
+    deveui TEXT PRIMARY KEY,
+    name TEXT,
+    device_profile TEXT,
+    output_profile TEXT,
+    service_profile TEXT,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS devices_device_profile ON devices (device_profile);
+CREATE INDEX IF NOT EXISTS devices_output_profile ON devices (output_profile);
+CREATE TABLE IF NOT EXISTS gateways (
+    id TEXT PRIMARY KEY,
+    node_id TEXT,
+    name TEXT,
+    gateway_profile TEXT,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS gateways_node_id ON gateways (node_id);
+CREATE TABLE IF NOT EXISTS device_groups (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS device_group_members (
+    group_id TEXT NOT NULL REFERENCES device_groups (id) ON DELETE CASCADE,
+    deveui TEXT NOT NULL,
+    PRIMARY KEY (group_id, deveui)
+);
+CREATE INDEX IF NOT EXISTS device_group_members_deveui ON device_group_members (deveui);
+"""
+_SCHEMA_VERSION = 2
+"""Stored in `PRAGMA user_version`. Mirrors of another version are emptied and refilled by the next refresh"""
+_DROP_SCHEMA = """
+DROP TABLE IF EXISTS device_group_members;
+DROP TABLE IF EXISTS device_groups;
+DROP TABLE IF EXISTS gateways;
+DROP TABLE IF EXISTS devices;
+"""
+
+
+def _alias(model: type[Any], name: str) -> str:
+    return model.model_fields[name].alias or name
+
+
+_DEVICE_COLUMNS = ("deveui", "name", "device_profile", "output_profile", "service_profile", "updated_at")
+_GATEWAY_COLUMNS = ("id", "node_id", "name", "gateway_profile", "updated_at")
+_DEVICE_ALIASES = tuple(_alias(DeviceInstance, name) for name in _DEVICE_COLUMNS)
+_GATEWAY_ALIASES = tuple(_alias(GatewayInstance, name) for name in _GATEWAY_COLUMNS)
+
+
+@dataclass
+class InventoryChanges:
+    """Keys of the items of a resource that a refresh added, removed and changed"""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class InventoryMirror:
+    """Local SQLite copy of the devices, device groups and gateways of an account.
+
+    A refresh lists the three resources and only writes the differences with the mirror: new and removed
+    items, and items whose `updated_at` changed (for device groups, which have no `updated_at`, a change
+    of name or members). Lookups are then indexed local queries, by DevEUI, gateway node ID, device or
+    output profile and group. Devices and gateways are stored as their raw JSON, and only validated
+    when they are read.
+
+    Statistics and `last_uplink` do not bump `updated_at`, so their mirrored values are those of the last
+    time the item changed. Use the API for live values.
+
+    ```python
+    with InventoryMirror("inventory.db") as mirror:
+        changes = mirror.refresh(client)
+        print(changes["devices"].added)
+        devices = mirror.devices(device_profile=profile_id)
+    ```
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:"):
+        """Open the mirror, creating its tables if needed.
+
+        Args:
+            path: Path of the SQLite database, in memory by default.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            self._connection.executescript(_DROP_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> InventoryMirror:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def refresh(self, client: SyncClient) -> dict[str, InventoryChanges]:
+        """List the inventory with a sync client and apply the differences to the mirror.
+
+        Returns:
+            dict[str, InventoryChanges]: Changes applied, keyed by resource (`"devices"`, `"device_groups"`
+                and `"gateways"`).
+        """
+        return self.apply(
+            client.devices.get_all(lazy=True),
+            client.device_groups.get_all(),
+            client.gateways.get_all(lazy=True),
+        )
+
+    async def refresh_async(self, client: AsyncClient) -> dict[str, InventoryChanges]:
+        """List the inventory concurrently with an async client and apply the differences to the mirror.
+        See `refresh`."""
+        devices, groups, gateways = await asyncio.gather(
+            client.devices.get_all(lazy=True),
+            client.device_groups.get_all(),
+            client.gateways.get_all(lazy=True),
+        )
+        return self.apply(devices, groups, gateways)
+
+    def apply(
+        self,
+        devices: Sequence[DeviceInstance],
+        groups: Iterable[DeviceGroupInstance],
+        gateways: Sequence[GatewayInstance],
+    ) -> dict[str, InventoryChanges]:
+        """Make the mirror hold exactly the given items, writing only the differences, in a single transaction.
+        Lazy lists are not validated."""
+        with self._connection:
+            return {
+                "devices": self._apply_items("devices", _DEVICE_COLUMNS, _DEVICE_ALIASES, _raw_items(devices)),
+                "device_groups": self._apply_groups(groups),
+                "gateways": self._apply_items("gateways", _GATEWAY_COLUMNS, _GATEWAY_ALIASES, _raw_items(gateways)),
+            }
+
+    def _apply_items(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        aliases: tuple[str, ...],
+        items: Iterable[dict[str, Any]],
+    ) -> InventoryChanges:
+        """Diff raw items against a table on `updated_at`, the first column being the key and the last `updated_at`"""
+        key = columns[0]
+        stored = dict(self._connection.execute(f"SELECT {key}, updated_at FROM {table}"))  # noqa: S608
+        changes = InventoryChanges()
+        rows = []
+        for item in items:
+            # nulls are kept, so that they are stored as NULL rather than as the text "None"
+            values = tuple(_column_value(item.get(alias)) for alias in aliases[:-1])
+            item_key, updated_at = str(item[aliases[0]]), _normalize_time(item[aliases[-1]])
+            previous = stored.pop(item_key, None)
+            if previous is None:
+                changes.added.append(item_key)
+            elif previous != updated_at:
+                changes.changed.append(item_key)
+            else:
+                continue
+            rows.append((*values, updated_at, json.dumps(item)))
+        placeholders = ", ".join("?" * (len(columns) + 1))
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}, data) VALUES ({placeholders})",  # noqa: S608
+            rows,
+        )
+        changes.removed = list(stored)
+        self._connection.executemany(f"DELETE FROM {table} WHERE {key} = ?", ((k,) for k in stored))  # noqa: S608
+        return changes
+
+    def _apply_groups(self, groups: Iterable[DeviceGroupInstance]) -> InventoryChanges:
+        stored = dict(self._connection.execute("SELECT id, fingerprint FROM device_groups"))
+        changes = InventoryChanges()
+        for group in groups:
+            members = sorted(set(group.device_list))
+            fingerprint = hashlib.sha1(json.dumps([group.name, members]).encode(), usedforsecurity=False).hexdigest()
+            previous = stored.pop(group.id, None)
+            if previous is None:
+                changes.added.append(group.id)
+            elif previous != fingerprint:
+                changes.changed.append(group.id)
+            else:
+                continue
+            self._connection.execute(
+                "INSERT OR REPLACE INTO device_groups (id, name, fingerprint) VALUES (?, ?, ?)",
+                (group.id, group.name, fingerprint),
+            )
+            self._connection.execute("DELETE FROM device_group_members WHERE group_id = ?", (group.id,))
+            self._connection.executemany(
+                "INSERT INTO device_group_members (group_id, deveui) VALUES (?, ?)",
+                ((group.id, deveui) for deveui in members),
+            )
+        changes.removed = list(stored)
+        self._connection.executemany("DELETE FROM device_groups WHERE id = ?", ((k,) for k in stored))
+        return changes
+
+    def device(self, deveui: str) -> DeviceInstance | None:
+        """Return a mirrored device by DevEUI"""
+        row = self._connection.execute("SELECT data FROM devices WHERE deveui = ?", (deveui,)).fetchone()
+        return DeviceInstance.model_validate_json(row[0]) if row is not None else None
+
+    def devices(
+        self,
+        device_profile: str | None = None,
+        output_profile: str | None = None,
+        group_id: str | None = None,
+    ) -> list[DeviceInstance]:
+        """Return the mirrored devices, optionally filtered by device profile, output profile and group"""
+        query = "SELECT devices.data FROM devices"
+        conditions = []
+        params = []
+        if group_id is not None:
+            query += " JOIN device_group_members USING (deveui)"
+            conditions.append("device_group_members.group_id = ?")
+            params.append(group_id)
+        if device_profile is not None:
+            conditions.append("devices.device_profile = ?")
+            params.append(device_profile)
+        if output_profile is not None:
+            conditions.append("devices.output_profile = ?")
+            params.append(output_profile)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return [DeviceInstance.model_validate_json(data) for (data,) in self._connection.execute(query, params)]
+
+    def groups_of(self, deveui: str) -> list[str]:
+        """Return the IDs of the device groups holding a device"""
+        rows = self._connection.execute("SELECT group_id FROM device_group_members WHERE deveui = ?", (deveui,))
+        return [group_id for (group_id,) in rows]
+
+    def group_members(self, group_id: str) -> list[str]:
+        """Return the DevEUIs of the members of a device group"""
+        rows = self._connection.execute("SELECT deveui FROM device_group_members WHERE group_id = ?", (group_id,))
+        return [deveui for (deveui,) in rows]
+
+    def gateway(self, gateway_id: str) -> GatewayInstance | None:
+        """Return a mirrored gateway by ID"""
+        row = self._connection.execute("SELECT data FROM gateways WHERE id = ?", (gateway_id,)).fetchone()
+        return GatewayInstance.model_validate_json(row[0]) if row is not None else None
+
+    def gateway_by_node_id(self, node_id: str) -> GatewayInstance | None:
+        """Return a mirrored gateway by node ID"""
+        row = self._connection.execute("SELECT data FROM gateways WHERE node_id = ?", (node_id,)).fetchone()
+        return GatewayInstance.model_validate_json(row[0]) if row is not None else None
+
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _normalize_time(value: Any) -> str:  # noqa: ANN401
+    """Single form of the times of raw items and of dumped models, for comparisons as text"""
+    return ensure_utc(_datetime_adapter.validate_python(value)).isoformat()
+
+
+def _column_value(value: Any) -> str | None:  # noqa: ANN401
+    return None if value is None else str(value)
+
+
+def _raw_items(items: Sequence[Any]) -> Iterable[dict[str, Any]]:
+    """JSON objects of models, straight from the response for lazy lists"""
+    if isinstance(items, LazyList):
+        return (items.raw(index) for index in range(len(items)))
+    return (item.model_dump(mode="json", by_alias=True) for item in items)
@@ -0,0 +1,145 @@
+"""Token stores that let several `MqAuth` instances, possibly in different processes, share one access token."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Protocol
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # ty:ignore[invalid-assignment]
+
+
+@dataclass(frozen=True)
+class StoredToken:
+    """Access token as persisted in a `TokenStore`."""
+
+    access_token: str
+    expires_at: float
+    """Expiration time as a POSIX timestamp"""
+    expires_in: int
+    """Lifetime of the token in seconds, as returned by the identity endpoint"""
+
+
+class TokenStore(Protocol):
+    """Storage for access tokens, keyed by client and environment.
+
+    `MqAuth` holds `lock(key)` while it checks the store and, if needed, renews the token,
+    so that only one of the instances sharing the store calls the identity endpoint."""
+
+    def load(self, key: str) -> StoredToken | None:
+        """Return the stored token for `key`, if any."""
+        ...
+
+    def save(self, key: str, token: StoredToken) -> None:
+        """Store the token for `key`. Callers must hold `lock(key)`."""
+        ...
+
+    def lock(self, key: str) -> AbstractContextManager[None]:
+        """Return a context manager that serializes renewals for `key`."""
+        ...
+
+
+class MemoryTokenStore:
+    """Token store shared by the `MqAuth` instances of a single process."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, StoredToken] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def load(self, key: str) -> StoredToken | None:
+        return self._tokens.get(key)
+
+    def save(self, key: str, token: StoredToken) -> None:
+        self._tokens[key] = token
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            yield
+
+
+class FileTokenStore:
+    """Token store backed by a JSON file, shared by all processes on a host.
+
+    Renewals are serialized per key with an `fcntl` lock on a sibling `.<hash of the key>.lock` file,
+    so that clients sharing the file do not wait for each other. Writes are serialized with a lock on
+    the sibling `.lock` file, and the token file is replaced atomically so that readers never see a
+    partial write. All the files are only readable by the current user. Requires a POSIX system."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Initialize the store.
+
+        Args:
+            path: path of the JSON file holding the tokens. It is created on the first save.
+        """
+        if fcntl is None:
+            raise RuntimeError("FileTokenStore requires fcntl, which is not available on this platform")  # noqa: TRY003
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            with self.path.open() as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def load(self, key: str) -> StoredToken | None:
+        entry = self._read().get(key)
+        if entry is None:
+            return None
+        try:
+            return StoredToken(**entry)
+        except TypeError:
+            # written by an incompatible version, treat as missing
+            return None
+
+    def save(self, key: str, token: StoredToken) -> None:
+        # the renewal locks are per key, the file is rewritten under a lock shared by all keys
+        with self._flock(self.lock_path):
+            tokens = self._read()
+            tokens[key] = asdict(token)
+            # mkstemp creates the file with 0600 permissions
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(tokens, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+
+    def _key_lock_path(self, key: str) -> Path:
+        """Return the path of the file locked while the token of `key` is renewed"""
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()[:16]
+        return self.path.with_name(f"{self.path.name}.{digest}.lock")
+
+    def lock(self, key: str) -> AbstractContextManager[None]:
+        return self._flock(self._key_lock_path(key))
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _flock(path: Path) -> Iterator[None]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # closing the descriptor releases the lock
+            os.close(fd)
@@ -25,7 +25,20 @@ def sync_to_async(func: Callable) -> CoroutineType:
 def wrap_sync_nested(obj: T) -> AsyncClient[T]:
     """Wrap sync methods on nested objects (e.g., .gateways) to return awaitables."""
     for attr_name in dir(obj):
-        if attr_name.startswith("_") or attr_name in ["auth", "http_client"]:
+        if attr_name.startswith("_") or attr_name in [
+            "auth",
+            "http_client",
+            "retry_policy",
+            "retry_stats",
+            "rate_limiter",
+            "cache",
+            "revalidation_cache",
+            "coalescer",
+            "json_codec",
+            "connection_config",
+            "instrumentation",
+            "tracing",
+        ]:
             continue
         attr = getattr(obj, attr_name)
         # Only wrap if it's an object with methods (like gateways, devices)
@@ -6,7 +6,7 @@ from typing import Protocol
 import pytest
 from dotenv import load_dotenv
 
-from machineq import MqAuth
+from machineq import AsyncMqAuth, MqAuth
 from machineq.client import AsyncClient, SyncClient
 from machineq.core.device_profile import DeviceProfileInstance
 from machineq.core.service_profile import ServiceProfileInstance
@@ -48,7 +48,12 @@ def async_client(auth_instance: MqAuth) -> AsyncClient:
     https://docs.aiohttp.org/en/stable/http_request_lifecycle.html#aiohttp-request-lifecycle
     """
     c = AsyncClient("", "")
-    c.auth = auth_instance
+    c.auth = AsyncMqAuth(
+        auth_instance.client_id,
+        auth_instance.client_secret,
+        client=c.http_client,
+    )
+    c.auth.set_token(auth_instance.token, auth_instance.expires_at)
     return c
 
 
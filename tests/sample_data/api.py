@@ -0,0 +1,38 @@
+"""Fake MachineQ API served through a mock transport, for offline tests."""
+
+from collections.abc import Callable, Coroutine
+
+import httpx
+
+VERSION = {"Semantic": "1.2.3", "Major": "1", "Minor": "2", "Patch": "3", "BuildTime": "now"}
+TOKEN = {"access_token": "token", "expires_in": 3600}
+
+Handler = Callable[[httpx.Request], httpx.Response] | Callable[[httpx.Request], Coroutine[None, None, httpx.Response]]
+
+
+def version(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=VERSION)
+
+
+class FakeApi(httpx.MockTransport):
+    """Mock transport answering the token requests itself, and the API requests with `respond`.
+
+    `respond` may be async, for the async clients. Every request is recorded in `requests`, token
+    requests included.
+    """
+
+    def __init__(self, respond: Handler = version) -> None:
+        super().__init__(respond)
+        self.requests: list[httpx.Request] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if "identity" in request.url.host:
+            return httpx.Response(200, json=TOKEN)
+        return super().handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if "identity" in request.url.host:
+            return httpx.Response(200, json=TOKEN)
+        return await super().handle_async_request(request)
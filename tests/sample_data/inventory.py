@@ -0,0 +1,57 @@
+"""Raw API objects of devices and gateways, for offline tests."""
+
+from typing import Any
+
+UPDATED = "2026-01-01T00:00:00Z"
+
+
+def device(deveui: str, profile: str = "dp1", updated_at: str = UPDATED) -> dict[str, Any]:
+    return {
+        "Name": deveui,
+        "DevEUI": deveui,
+        "ActivationType": "OTAA",
+        "ServiceProfile": "sp",
+        "DeviceProfile": profile,
+        "DecoderType": "dt",
+        "OutputProfile": "op",
+        "PrivateData": False,
+        "CreatedAt": UPDATED,
+        "UpdatedAt": updated_at,
+        "UpdatedBy": "user",
+        "LastUplink": None,
+        "Statistics": {
+            "HealthState": "good",
+            "SpreadingFactor": 7,
+            "AverageRSSI": -100.0,
+            "AverageESP": -101.0,
+            "AverageSNR": 5.0,
+            "PacketErrorRate": 0.0,
+            "BatteryLevel": 100,
+            "AverageWeeklyPackets": 10,
+        },
+        "PayloadDecoder": "UNKNOWN",
+    }
+
+
+def gateway(gateway_id: str, node_id: str) -> dict[str, Any]:
+    return {
+        "Id": gateway_id,
+        "GatewayProfile": "gp",
+        "MacAddress": "00",
+        "NodeId": node_id,
+        "Name": gateway_id,
+        "AntennaGain": "0",
+        "LocationType": "INDOOR",
+        "GPSEnabled": False,
+        "Coordinates": {"X": "0", "Y": "0"},
+        "CellularEnabled": False,
+        "Imei": "",
+        "Iccid": "",
+        "CreatedAt": UPDATED,
+        "UpdatedAt": UPDATED,
+        "UpdatedBy": "user",
+        "Manufacturer": "MULTITECH",
+        "Model": "m",
+        "Statistics": None,
+        "RfRegion": "US915",
+    }
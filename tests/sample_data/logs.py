@@ -0,0 +1,44 @@
+"""Raw API objects of logs, for offline tests."""
+
+from datetime import datetime
+from typing import Any
+
+
+def log(timestamp: datetime, deveui: str = "0011223344556677", late: str = "false") -> dict[str, Any]:
+    return {
+        "Timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+        "DevEUI": deveui,
+        "DevAddr": "01ab23cd",
+        "Fport": "2",
+        "FCnt": "42",
+        "MessageType": "4",
+        "MessageTypeText": "Unconfirmed Data Up",
+        "PayloadHex": "0a0b0c",
+        "MICHex": "1a2b3c4d",
+        "PrimaryGatewayRSSI": "-97.0",
+        "PrimaryGatewaySNR": "8.25",
+        "PrimaryGatewayESP": "-97.6",
+        "SpreadingFactor": "7",
+        "Airtime": "0.056576",
+        "SubBand": "2",
+        "Channel": "9",
+        "GatewayID": "gw1",
+        "GatewayLatitide": "40.0",
+        "GatewayLongitude": "-75.0",
+        "GatewayCount": "1",
+        "GatewayList": [],
+        "DeviceLatitude": "",
+        "DeviceLongitude": "",
+        "DeviceLocationRadius": "",
+        "MacCommands": "",
+        "DecodedMacCommands": [],
+        "ADRbit": "1",
+        "ADRAckReq": "0",
+        "AckRequested": "0",
+        "ACKbit": "0",
+        "FPending": "0",
+        "Late": late,
+        "DevNonce": "",
+        "JoinEUI": "",
+        "GatewayNodeID": "node1",
+    }
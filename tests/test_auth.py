@@ -0,0 +1,145 @@
+"""Tests for authentication providers."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from sample_data.api import FakeApi
+
+from machineq import AsyncClient, AsyncMqAuth, FileTokenStore, MemoryTokenStore, MqAuth, StoredToken, SyncClient
+
+
+class TestMqAuth:
+    """Sync auth provider tests."""
+
+    def test_concurrent_refresh_is_single_flight(self, auth_instance: MqAuth):
+        """Test that threads sharing an expired auth trigger exactly one token request."""
+        token_requests = 0
+
+        def count_requests(request: httpx.Request) -> None:
+            nonlocal token_requests
+            token_requests += 1
+
+        with httpx.Client(event_hooks={"request": [count_requests]}) as http_client:
+            auth = MqAuth(auth_instance.client_id, auth_instance.client_secret, client=http_client)
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                tokens = list(executor.map(lambda _: auth.token, range(50)))
+
+        assert token_requests == 1
+        assert len(set(tokens)) == 1
+
+    def test_background_renewal_is_scheduled(self, auth_instance: MqAuth):
+        """Test that the opt-in renewal mode schedules a background refresh."""
+        auth = MqAuth(auth_instance.client_id, auth_instance.client_secret, renew_fraction=0.8)
+        try:
+            assert auth.token
+            assert auth._renew_timer is not None
+            assert auth._renew_timer.is_alive()
+        finally:
+            auth.close()
+        assert auth._renew_timer is None
+
+    def test_invalid_renew_fraction(self):
+        """Test that the renewal fraction is validated."""
+        with pytest.raises(ValueError, match="renew_fraction"):
+            MqAuth("client_id", "client_secret", renew_fraction=1.5)
+
+
+class TestTokenStore:
+    """Shared token store tests."""
+
+    def test_memory_store_shares_token(self, auth_instance: MqAuth):
+        """Test that auth instances sharing a store reuse one token."""
+        store = MemoryTokenStore()
+        first = MqAuth(auth_instance.client_id, auth_instance.client_secret, token_store=store)
+        second = MqAuth(auth_instance.client_id, auth_instance.client_secret, token_store=store)
+        assert first.token == second.token
+
+    def test_file_store_shares_token(self, auth_instance: MqAuth, tmp_path: Path):
+        """Test that a new auth instance picks up the token persisted by another one."""
+        path = tmp_path / "tokens.json"
+        first = MqAuth(auth_instance.client_id, auth_instance.client_secret, token_store=FileTokenStore(path))
+        token = first.token
+        assert path.exists()
+
+        token_requests = 0
+
+        def count_requests(request: httpx.Request) -> None:
+            nonlocal token_requests
+            token_requests += 1
+
+        with httpx.Client(event_hooks={"request": [count_requests]}) as http_client:
+            second = MqAuth(
+                auth_instance.client_id,
+                auth_instance.client_secret,
+                client=http_client,
+                token_store=FileTokenStore(path),
+            )
+            assert second.token == token
+        assert token_requests == 0
+
+    def test_file_store_locks_per_key(self, tmp_path: Path):
+        """Test that renewals of different keys do not wait for each other, and that both tokens are kept."""
+        store = FileTokenStore(tmp_path / "tokens.json")
+        token = StoredToken(access_token="token", expires_at=0.0, expires_in=3600)  # noqa: S106
+
+        def renew_second() -> None:
+            with store.lock("second"):
+                store.save("second", token)
+
+        with ThreadPoolExecutor(max_workers=1) as executor, store.lock("first"):
+            executor.submit(renew_second).result(timeout=5)
+            store.save("first", token)
+        assert store.load("first") == store.load("second") == token
+
+    @pytest.mark.asyncio
+    async def test_async_store_shares_token(self, tmp_path: Path):
+        """Test that async and sync clients sharing a file store make a single identity call."""
+        api = FakeApi()
+        store = FileTokenStore(tmp_path / "tokens.json")
+        clients = [AsyncClient("id", "secret", transport=api, token_store=store) for _ in range(3)]
+        tokens = await asyncio.gather(*(client.auth.get_token() for client in clients))
+        sync_client = SyncClient("id", "secret", transport=api, token_store=store)
+        assert set(tokens) == {sync_client.auth.token}
+        assert sum("identity" in request.url.host for request in api.requests) == 1
+
+
+@pytest.mark.asyncio
+class TestAsyncMqAuth:
+    """Async auth provider tests."""
+
+    async def test_get_token(self, auth_instance: MqAuth):
+        """Test that an expired token is renewed."""
+        async with httpx.AsyncClient() as http_client:
+            auth = AsyncMqAuth(auth_instance.client_id, auth_instance.client_secret, client=http_client)
+            token = await auth.get_token()
+            assert token
+            assert auth.expires_at > datetime.now()
+
+    async def test_concurrent_refresh_is_single_flight(self, auth_instance: MqAuth):
+        """Test that a burst of coroutines triggers exactly one token request."""
+        token_requests = 0
+
+        async def count_requests(request: httpx.Request) -> None:
+            nonlocal token_requests
+            token_requests += 1
+
+        async with httpx.AsyncClient(event_hooks={"request": [count_requests]}) as http_client:
+            auth = AsyncMqAuth(auth_instance.client_id, auth_instance.client_secret, client=http_client)
+            tokens = await asyncio.gather(*(auth.get_token() for _ in range(50)))
+
+        assert token_requests == 1
+        assert len(set(tokens)) == 1
+
+    async def test_deprecated_token(self):
+        """Test that the blocking `token` accessor still returns a token, with a deprecation warning."""
+        store = MemoryTokenStore()
+        sync_client = SyncClient("id", "secret", transport=FakeApi(), token_store=store)
+        token = sync_client.auth.token
+        auth = AsyncMqAuth("id", "secret", token_store=store)
+        with pytest.warns(DeprecationWarning):
+            # the token is taken from the store, without calling the identity endpoint
+            assert auth.token == token
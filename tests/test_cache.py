@@ -0,0 +1,145 @@
+"""Tests for the response cache."""
+
+import time
+
+import httpx
+import pytest
+from sample_data.api import FakeApi
+from sample_data.inventory import device
+
+from machineq import ResponseCache, RevalidationCache, SyncClient
+from machineq.core.version.models import VersionResponse
+
+URL = "https://api.machineq.net/v1/roles"
+
+
+def ok(body: str = "[]") -> httpx.Response:
+    return httpx.Response(200, content=body)
+
+
+class TestResponseCache:
+    """Response cache tests."""
+
+    def test_hit_after_store(self):
+        """Test that a stored GET response is served until it expires."""
+        cache = ResponseCache(ttls={"/roles": 0.05})
+        assert cache.lookup("/roles", "GET", URL) is None
+        response = ok()
+        cache.store("/roles", "GET", URL, None, response)
+        assert cache.lookup("/roles", "GET", URL) is response
+        assert (cache.hits, cache.misses) == (1, 1)
+        time.sleep(0.06)
+        assert cache.lookup("/roles", "GET", URL) is None
+
+    def test_params_are_part_of_the_key(self):
+        """Test that requests with different query parameters are cached separately."""
+        cache = ResponseCache(ttls={"/roles": 60})
+        cache.store("/roles", "GET", URL, {"Page": 1}, ok())
+        assert cache.lookup("/roles", "GET", URL, {"Page": 2}) is None
+        assert cache.lookup("/roles", "GET", URL, {"Page": 1}) is not None
+
+    def test_uncached_families_and_errors(self):
+        """Test that families without a TTL and unsuccessful responses are not cached."""
+        cache = ResponseCache(ttls={"/roles": 60})
+        cache.store("/devices", "GET", URL, None, ok())
+        cache.store("/roles", "GET", URL, None, httpx.Response(404))
+        assert len(cache) == 0
+
+    def test_mutation_invalidates_family(self):
+        """Test that a non-GET request drops the cached responses of its family only."""
+        cache = ResponseCache(ttls={"/roles": 60, "/rfregions": 60})
+        cache.store("/roles", "GET", URL, None, ok())
+        cache.store("/rfregions", "GET", URL, None, ok())
+        cache.store("/roles", "DELETE", f"{URL}/1", None, httpx.Response(200))
+        assert cache.lookup("/roles", "GET", URL) is None
+        assert cache.lookup("/rfregions", "GET", URL) is not None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used response is evicted first."""
+        cache = ResponseCache(ttls={"/roles": 60}, max_entries=2)
+        for i in range(2):
+            cache.store("/roles", "GET", f"{URL}/{i}", None, ok())
+        cache.lookup("/roles", "GET", f"{URL}/0")
+        cache.store("/roles", "GET", f"{URL}/2", None, ok())
+        assert cache.lookup("/roles", "GET", f"{URL}/0") is not None
+        assert cache.lookup("/roles", "GET", f"{URL}/1") is None
+
+    def test_invalid_size(self):
+        """Test that the size is validated."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResponseCache(max_entries=0)
+
+
+class TestRevalidationCache:
+    """Conditional request cache tests."""
+
+    def test_sends_validators(self):
+        """Test that a response with validators is kept and revalidated on the next request."""
+        cache = RevalidationCache()
+        request = cache.prepare("GET", URL)
+        assert request is not None
+        assert request.headers == {}
+        response = httpx.Response(200, content="{}", headers={"ETag": '"v1"', "Last-Modified": "yesterday"})
+        assert cache.complete(request, response) is response
+
+        request = cache.prepare("GET", URL)
+        assert request is not None
+        assert request.headers == {"If-None-Match": '"v1"', "If-Modified-Since": "yesterday"}
+        assert cache.complete(request, httpx.Response(304)) is response
+        assert (cache.hits, cache.misses, cache.revalidations) == (1, 1, 1)
+
+    def test_reuses_parsed_model(self):
+        """Test that the model parsed from a kept response is reused."""
+        cache = RevalidationCache()
+        request = cache.prepare("GET", URL)
+        assert request is not None
+        response = cache.complete(request, httpx.Response(200, content="{}", headers={"ETag": '"v1"'}))
+        assert cache.parsed(response, VersionResponse) is None
+        model = VersionResponse.model_construct()
+        cache.keep_parsed(response, model)
+        assert cache.parsed(response, VersionResponse) is model
+
+    def test_ignores_responses_without_validators(self):
+        """Test that responses without validators and non-GET requests are not kept."""
+        cache = RevalidationCache()
+        assert cache.prepare("DELETE", URL) is None
+        request = cache.prepare("GET", URL)
+        assert request is not None
+        cache.complete(request, ok())
+        assert len(cache) == 0
+
+
+def test_revalidated_listing_is_copied():
+    """Test that a listing reused from the revalidation cache is not shared with the previous caller."""
+    role = {"Id": "r1", "Name": "role", "Device": None, "User": None, "Gateway": None, "Users": [], "Applications": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"Roles": [role]}, headers={"ETag": '"v1"'})
+
+    client = SyncClient("id", "secret", transport=FakeApi(handler), revalidation_cache=RevalidationCache())
+    roles = client.roles.get_all()
+    roles.clear()
+    assert [r.id for r in client.roles.get_all()] == ["r1"]
+    assert client.revalidation_cache is not None
+    assert client.revalidation_cache.revalidations == 1
+
+
+def test_revalidated_model_is_copied():
+    """Test that every caller of a revalidated response gets its own model, the first one included."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=device("a1"), headers={"ETag": '"v1"'})
+
+    client = SyncClient("id", "secret", transport=FakeApi(handler), revalidation_cache=RevalidationCache())
+    first = client.devices.get("a1")
+    first.name = "renamed"
+    second = client.devices.get("a1")
+    assert second.name == "a1"
+    second.statistics.battery_level = 0
+    assert client.devices.get("a1").statistics.battery_level == 100
+    assert client.revalidation_cache is not None
+    assert client.revalidation_cache.revalidations == 2
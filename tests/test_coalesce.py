@@ -0,0 +1,89 @@
+"""Tests for the coalescing of identical concurrent GET requests."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from sample_data.api import FakeApi
+from sample_data.inventory import device
+
+from machineq import AsyncClient, SyncClient
+from machineq.client import NotFound
+
+
+class SlowApi:
+    """Count device requests, answering them after a delay"""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.requests: list[str] = []
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        deveui = request.url.path.rsplit("/", 1)[-1]
+        self.requests.append(deveui)
+        if deveui == "missing":
+            return httpx.Response(404, json={"code": 5, "message": "not found"})
+        return httpx.Response(200, json=device(deveui))
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self.respond(request)
+
+
+@pytest.mark.asyncio
+async def test_async_coalescing():
+    """Test that identical concurrent GETs share one request, and different ones do not."""
+    api = SlowApi()
+    client = AsyncClient("id", "secret", transport=FakeApi(api.handle_async), coalesce_requests=True)
+    results = await asyncio.gather(*(client.devices.get(deveui) for deveui in ["a1"] * 10 + ["a2"]))
+    assert [d.deveui for d in results] == ["a1"] * 10 + ["a2"]
+    assert sorted(api.requests) == ["a1", "a2"]
+    assert client.coalescer is not None
+    assert client.coalescer.coalesced == 9
+
+    # errors reach every caller, and nothing is cached once the request is over
+    outcomes = await asyncio.gather(*(client.devices.get("missing") for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(outcome, NotFound) for outcome in outcomes)
+    await client.devices.get("a1")
+    assert api.requests.count("a1") == 2
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_leader():
+    """Test that cancelling the caller that sent the request does not cancel it for the others."""
+    api = SlowApi()
+    client = AsyncClient("id", "secret", transport=FakeApi(api.handle_async), coalesce_requests=True)
+    leader = asyncio.ensure_future(client.devices.get("a1"))
+    await asyncio.sleep(0.01)
+    follower = asyncio.ensure_future(client.devices.get("a1"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    assert (await follower).deveui == "a1"
+    assert api.requests == ["a1"]
+
+
+def test_sync_coalescing():
+    """Test that identical GETs from several threads share one request."""
+    api = SlowApi()
+    barrier = threading.Barrier(5)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        threading.Event().wait(api.delay)
+        return api.respond(request)
+
+    client = SyncClient("id", "secret", transport=FakeApi(handle), coalesce_requests=True)
+    assert client.auth.token
+    results = []
+
+    def get() -> None:
+        barrier.wait()
+        results.append(client.devices.get("a1"))
+
+    threads = [threading.Thread(target=get) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 5
+    assert api.requests == ["a1"]
@@ -0,0 +1,31 @@
+"""Tests for the JSON codecs."""
+
+import json
+
+import pytest
+
+from machineq.client import JsonCodec, OrjsonCodec
+from machineq.client.codec import default_codec
+
+
+@pytest.mark.parametrize("codec_class", [JsonCodec, OrjsonCodec])
+def test_round_trip(codec_class: type[JsonCodec]):
+    """Test that the codecs decode what they encode, and raise JSONDecodeError on invalid JSON."""
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    codec = codec_class()
+    data = {"DevEUI": "0011223344556677", "Tags": ["a", "b"], "Count": 1, "Ok": True, "None": None}
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumps(data).encode()) == data
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
+
+
+def test_default_codec():
+    """Test that orjson is used when it is installed."""
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        assert type(default_codec()) is JsonCodec
+    else:
+        assert isinstance(default_codec(), OrjsonCodec)
@@ -0,0 +1,35 @@
+"""Tests for the connection settings of the clients."""
+
+import httpx
+import pytest
+from sample_data.api import FakeApi
+
+from machineq import AsyncClient, ConnectionConfig, SyncClient
+
+
+def test_config_conversion():
+    """Test that the settings are converted to httpx limits and timeouts."""
+    config = ConnectionConfig(max_connections=50, max_keepalive_connections=10, read_timeout=60.0, pool_timeout=None)
+    assert config.limits == httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=5.0)
+    assert config.timeout == httpx.Timeout(connect=5.0, read=60.0, write=5.0, pool=None)
+    with pytest.raises(ValueError, match="max_connections"):
+        ConnectionConfig(max_connections=0)
+
+
+def test_sync_client_transport():
+    """Test that the sync client sends token and API requests through the injected transport."""
+    api = FakeApi()
+    config = ConnectionConfig(read_timeout=42.0)
+    with SyncClient("id", "secret", connection_config=config, transport=api) as client:
+        assert client.auth.client is client.http_client
+        assert client.http_client.timeout.read == 42.0
+        assert client.version.get().semantic == "1.2.3"
+    assert len(api.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_transport():
+    """Test that the async client sends token and API requests through the injected transport."""
+    async with AsyncClient("id", "secret", transport=FakeApi()) as client:
+        assert client.auth.client is client.http_client
+        assert (await client.version.get()).semantic == "1.2.3"
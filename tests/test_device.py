@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 from async_test_client import AsyncTestClient
@@ -38,6 +39,25 @@ class TestDevices:
         """Test listing all devices."""
         await devices_api.get_all()
 
+    async def test_get_all_lazy(self, devices_api: AsyncDevices):
+        """Test that the lazy listing holds the same devices as the eager one."""
+        devices = await devices_api.get_all()
+        lazy = await devices_api.get_all(lazy=True)
+        assert len(lazy) == len(devices)
+        if devices:
+            assert lazy.raw(0)["DevEUI"] == devices[0].deveui
+            assert lazy[0] == devices[0]
+        assert lazy == devices
+
+    async def test_iter_all(self, devices_api: AsyncDevices):
+        """Test that streaming the listing yields the same devices as the eager one."""
+        devices = await devices_api.get_all()
+        if isinstance(devices_api, AsyncDevices):
+            streamed = [device async for device in devices_api.aiter_all()]
+        else:
+            streamed = list(await devices_api.iter_all())
+        assert streamed == devices
+
     async def test_get_existing_device(self, devices_api: AsyncDevices):
         """Test retrieving a specific device."""
         devices = await devices_api.get_all()
@@ -124,6 +144,27 @@ class TestDevices:
         finally:
             await devices_api.delete(deveui)
 
+    async def test_get_health_projection(self, devices_api: AsyncDevices):
+        """Test that the projected health groups hold the same devices as the full response."""
+        full = await devices_api.get_health()
+        projected = await devices_api.get_health(fields=("deveui", "name", "last_uplink"))
+        assert set(projected) == {"good", "fair", "poor", "offline"}
+        for group, devices in projected.items():
+            assert [d.deveui for d in devices] == [d.deveui for d in getattr(full, group)]
+            assert [d.last_uplink for d in devices] == [d.last_uplink for d in getattr(full, group)]
+        with pytest.raises(ValueError, match="Unknown fields"):
+            await devices_api.get_health(fields=("not_a_field",))
+
+    async def test_iter_health(self, devices_api: AsyncDevices):
+        """Test that streaming the health groups yields the same devices as the full response."""
+        full = await devices_api.get_health()
+        if isinstance(devices_api, AsyncDevices):
+            streamed = [item async for item in devices_api.aiter_health()]
+        else:
+            streamed = list(await devices_api.iter_health())
+        for group in ("good", "fair", "poor", "offline"):
+            assert [d.deveui for g, d in streamed if g == group] == [d.deveui for d in getattr(full, group)]
+
     async def test_get_health_count(self, devices_api: AsyncDevices):
         """Test getting device health count."""
         await devices_api.get_health_count()
@@ -189,3 +230,100 @@ class TestDevices:
             await devices_api.delete(created_deveui)
             if output_profile:
                 await client.output_profiles.delete(output_profile)
+
+    async def test_create_many(
+        self,
+        devices_api: AsyncDevices,
+        get_service_profile: ProfileGetter,
+        get_device_profile: ProfileGetter,
+        tmp_path: Path,
+    ):
+        """Test bulk creation, resuming from a checkpoint and reporting failures."""
+        if not isinstance(devices_api, AsyncDevices):
+            pytest.skip("bulk creation is only available on the async client")
+        devices = [
+            DeviceCreate(
+                name=random_name(),
+                deveui=random_deveui(),
+                activation_type=ActivationType.OTAA,
+                service_profile=get_service_profile(),
+                device_profile=get_device_profile(),
+                application_eui=random_hex(16),
+                application_key=random_hex(32),
+            )
+            for _ in range(3)
+        ]
+        checkpoint = tmp_path / "create.jsonl"
+        try:
+            results = await devices_api.create_many(devices[:2], concurrency=2, checkpoint=checkpoint)
+            assert sorted(r.deveui for r in results) == sorted(d.deveui for d in devices[:2])
+            assert all(r.response for r in results)
+
+            # the first two devices are skipped, creating them again would fail
+            results = await devices_api.create_many(devices, concurrency=2, checkpoint=checkpoint)
+            assert len(results) == 3
+            assert all(r.response for r in results)
+
+            # without checkpoint, existing devices are reported as failures
+            results = await devices_api.create_many(devices[:1])
+            assert not results[0].response
+            assert results[0].error
+        finally:
+            results = await devices_api.delete_many(device.deveui for device in devices)
+            assert all(r.response for r in results)
+
+    async def test_patch_and_delete_many(
+        self,
+        devices_api: AsyncDevices,
+        get_service_profile: ProfileGetter,
+        get_device_profile: ProfileGetter,
+    ):
+        """Test patching and deleting devices in bulk, with a failing item in each batch."""
+        deveuis = [random_deveui() for _ in range(2)]
+        for deveui in deveuis:
+            await devices_api.create(
+                DeviceCreate(
+                    name=random_name(),
+                    deveui=deveui,
+                    activation_type=ActivationType.OTAA,
+                    service_profile=get_service_profile(),
+                    device_profile=get_device_profile(),
+                    application_eui=random_hex(16),
+                    application_key=random_hex(32),
+                )
+            )
+        missing = random_deveui()
+
+        try:
+            patches = {deveui: DevicePatch(name=random_name()) for deveui in [*deveuis, missing]}
+            results = {r.deveui: r for r in await devices_api.patch_many(patches, concurrency=2)}
+            assert all(results[deveui].response for deveui in deveuis)
+            assert not results[missing].response
+            for deveui in deveuis:
+                fetched = await devices_api.get(deveui)
+                assert fetched.name == patches[deveui].name
+        finally:
+            results = {r.deveui: r for r in await devices_api.delete_many([*deveuis, missing])}
+        assert all(results[deveui].response for deveui in deveuis)
+        assert not results[missing].response
+        assert results[missing].error
+
+    async def test_harvest_payloads(self, devices_api: AsyncDevices):
+        """Test harvesting the payloads of several devices, with a failing device."""
+        devices = await devices_api.get_all()
+        deveuis = [device.deveui for device in devices[:3]]
+        missing = random_deveui()
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(days=1)
+        if isinstance(devices_api, AsyncDevices):
+            harvester = devices_api.harvest_payloads([*deveuis, missing], start_time=start, end_time=end)
+            pairs = [pair async for pair in harvester]
+        else:
+            harvester = await devices_api.harvest_payloads([*deveuis, missing], start_time=start, end_time=end)
+            pairs = list(harvester)
+        assert list(harvester.failures) == [missing]
+        assert harvester.devices_harvested == len(deveuis)
+        assert harvester.payloads_harvested == len(pairs)
+        for deveui in deveuis:
+            payloads = await devices_api.get_payloads(deveui, start, end)
+            assert [payload for eui, payload in pairs if eui == deveui] == payloads
@@ -0,0 +1,78 @@
+"""Tests for the in-memory fleet index."""
+
+from sample_data.inventory import device, gateway
+
+from machineq import FleetIndex
+from machineq.core.device.models import DeviceInstance, DevicePatch
+from machineq.core.device_group.models import DeviceGroupInstance, DeviceGroupPatch
+from machineq.core.gateway.models import GatewayInstance, GatewayPatch
+from machineq.core.multicast_group.models import MulticastGroup
+
+
+def make_index() -> FleetIndex:
+    return FleetIndex(
+        devices=[DeviceInstance.model_validate(device(deveui)) for deveui in ("a1", "a2", "a3")],
+        gateways=[GatewayInstance.model_validate(gateway("gw1", "node1"))],
+        device_groups=[DeviceGroupInstance(id="g1", name="group", device_list=["a1", "a2"], devices=[])],
+        multicast_groups=[
+            MulticastGroup(
+                name="mc",
+                multicast_deveui="m1",
+                multicast_dev_addr="01",
+                group_type="CLASS_C",
+                data_rate=0,
+                frequency=923300000,
+                ping_slot_period=0,
+            )
+        ],
+    )
+
+
+def test_lookups():
+    """Test the lookups by key and by indexed field."""
+    fleet = make_index()
+    device_ = fleet.device("a1")
+    assert device_ is not None
+    assert device_.deveui == "a1"
+    assert fleet.device("missing") is None
+    assert sorted(d.deveui for d in fleet.find_devices(device_profile="dp1")) == ["a1", "a2", "a3"]
+    assert sorted(d.deveui for d in fleet.find_devices(device_profile="dp1", group_id="g1")) == ["a1", "a2"]
+    assert fleet.find_devices(output_profile="other") == []
+    assert len(fleet.find_devices()) == 3
+    assert fleet.groups_of("a2") == {"g1"}
+    gw = fleet.gateway_by_node_id("node1")
+    assert gw is not None
+    assert gw.id == "gw1"
+    assert fleet.gateway_by_mac_address("00") == gw
+    assert fleet.multicast_group("m1") is not None
+
+
+def test_incremental_updates():
+    """Test that patches, upserts and removals keep the indexes consistent."""
+    fleet = make_index()
+    fleet.patch_device("a1", DevicePatch(device_profile="dp2", remove_output_profile=True))
+    assert [d.deveui for d in fleet.find_devices(device_profile="dp2")] == ["a1"]
+    assert [d.deveui for d in fleet.find_devices(output_profile="")] == ["a1"]
+    assert "a1" not in {d.deveui for d in fleet.find_devices(device_profile="dp1")}
+    assert fleet.patch_device("missing", DevicePatch(name="x")) is None
+
+    fleet.remove_device("a2")
+    assert [d.deveui for d in fleet.find_devices(group_id="g1")] == ["a1"]
+
+    fleet.upsert_device(DeviceInstance.model_validate(device("a4", profile="dp2")))
+    assert sorted(d.deveui for d in fleet.find_devices(device_profile="dp2")) == ["a1", "a4"]
+
+    fleet.patch_device_group("g1", DeviceGroupPatch(device_list=["a3", "a4"]))
+    assert fleet.groups_of("a1") == set()
+    assert sorted(d.deveui for d in fleet.find_devices(group_id="g1")) == ["a3", "a4"]
+    fleet.remove_device_group("g1")
+    assert fleet.groups_of("a3") == set()
+
+    fleet.patch_gateway("gw1", GatewayPatch(name="renamed"))
+    gw = fleet.gateway_by_node_id("node1")
+    assert gw is not None
+    assert gw.name == "renamed"
+    fleet.remove_gateway("gw1")
+    assert fleet.gateway_by_node_id("node1") is None
+    fleet.remove_multicast_group("m1")
+    assert fleet.multicast_groups == []
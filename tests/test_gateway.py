@@ -28,6 +28,22 @@ class TestGateways:
         """Test listing all gateways."""
         await gateways_api.get_all()
 
+    async def test_get_all_lazy(self, gateways_api: AsyncGateways):
+        """Test that the lazy listing holds the same gateways as the eager one."""
+        gateways = await gateways_api.get_all()
+        lazy = await gateways_api.get_all(lazy=True)
+        assert len(lazy) == len(gateways)
+        assert [gateway.id for gateway in lazy] == [gateway.id for gateway in gateways]
+
+    async def test_iter_all(self, gateways_api: AsyncGateways):
+        """Test that streaming the listing yields the same gateways as the eager one."""
+        gateways = await gateways_api.get_all()
+        if isinstance(gateways_api, AsyncGateways):
+            streamed = [gateway async for gateway in gateways_api.aiter_all()]
+        else:
+            streamed = list(await gateways_api.iter_all())
+        assert [gateway.id for gateway in streamed] == [gateway.id for gateway in gateways]
+
     async def test_get_existing_gateway(self, gateways_api: AsyncGateways):
         """Test retrieving a specific gateway."""
         gateways = await gateways_api.get_all()
@@ -114,6 +130,37 @@ class TestGateways:
         finally:
             await gateways_api.delete(created_id)
 
+    async def test_patch_and_delete_many(self, client: AsyncTestClient, gateways_api: AsyncGateways):
+        """Test patching and deleting gateways in bulk, with a failing item in each batch."""
+        gateway_profile = await self.get_gateway_profile(client)
+        created_ids = [
+            await gateways_api.create(
+                GatewayCreate(
+                    node_id=random_gateway_id(),
+                    name=random_name(),
+                    gateway_profile=gateway_profile,
+                    mac_address=random_mac_address(),
+                    coordinates=Coordinates(X="0", Y="0"),
+                )
+            )
+            for _ in range(2)
+        ]
+        missing_id = random_gateway_id()
+
+        try:
+            patches = {gateway_id: GatewayPatch(name=random_name()) for gateway_id in [*created_ids, missing_id]}
+            results = {r.id: r for r in await gateways_api.patch_many(patches, concurrency=2)}
+            assert all(results[gateway_id].response for gateway_id in created_ids)
+            assert not results[missing_id].response
+            for gateway_id in created_ids:
+                fetched = await gateways_api.get(gateway_id)
+                assert fetched.name == patches[gateway_id].name
+        finally:
+            results = {r.id: r for r in await gateways_api.delete_many([*created_ids, missing_id])}
+        assert all(results[gateway_id].response for gateway_id in created_ids)
+        assert not results[missing_id].response
+        assert results[missing_id].error
+
     async def test_get_statistics(self, gateways_api: AsyncGateways):
         """Test getting gateway statistics."""
         gateways = await gateways_api.get_all()
@@ -157,6 +204,12 @@ class TestGateways:
             health = await gateways_api.get_health()
             assert gateway_id in [gw.node_id for gw in health.initializing]
 
+            # Test projected connection status and health
+            projected_status = await gateways_api.get_connection_status(fields=("id", "node_id"))
+            assert gateway_id in [gw.node_id for gw in projected_status["never_connected"]]
+            projected_health = await gateways_api.get_health(fields=("node_id",))
+            assert gateway_id in [gw.node_id for gw in projected_health["initializing"]]
+
         finally:
             await gateways_api.delete(created_id)
 
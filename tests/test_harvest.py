@@ -0,0 +1,44 @@
+"""Tests for the concurrent payload harvester."""
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from sample_data.api import FakeApi
+
+from machineq import AsyncClient, SyncClient
+from machineq.client import NotFound
+
+PAYLOAD = {"Time": "2026-01-01T00:00:00Z", "Data": {"value": 1}, "ApplicationData": {}}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Answer the payloads of device a, a malformed page for b, an invalid body for c, and 404 otherwise"""
+    deveui = request.url.path.split("/")[-2]
+    if deveui == "a":
+        return httpx.Response(200, json={"Payloads": [PAYLOAD]})
+    if deveui == "b":
+        return httpx.Response(200, json={"Payloads": [{"Time": "not a time"}]})
+    if deveui == "c":
+        return httpx.Response(200, content=b"<html>")
+    return httpx.Response(404, json={"code": 5, "message": "not found"})
+
+
+def test_failures_do_not_abort():
+    """Test that devices whose payloads cannot be retrieved or validated are recorded as failures."""
+    client = SyncClient("id", "secret", transport=FakeApi(handler))
+    harvester = client.devices.harvest_payloads(["a", "b", "c", "d"], concurrency=2)
+    assert [deveui for deveui, _ in harvester] == ["a"]
+    assert sorted(harvester.failures) == ["b", "c", "d"]
+    assert isinstance(harvester.failures["b"], ValidationError)
+    assert isinstance(harvester.failures["d"], NotFound)
+    assert harvester.devices_harvested == 1
+
+
+@pytest.mark.asyncio
+async def test_async_failures_do_not_abort():
+    """Test that the async harvester records failures the same way."""
+    client = AsyncClient("id", "secret", transport=FakeApi(handler))
+    harvester = client.devices.harvest_payloads(["a", "b", "c", "d"], concurrency=2)
+    assert [deveui async for deveui, _ in harvester] == ["a"]
+    assert sorted(harvester.failures) == ["b", "c", "d"]
+    assert isinstance(harvester.failures["b"], ValidationError)
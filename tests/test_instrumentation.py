@@ -0,0 +1,89 @@
+"""Tests for the instrumentation hooks and the metrics collector."""
+
+import httpx
+import pytest
+from sample_data.api import VERSION, FakeApi
+
+from machineq import AsyncClient, InstrumentationHook, MetricsCollector, RetryPolicy, SyncClient
+from machineq.client import RequestEvent
+
+
+def make_handler(statuses: list[int]):
+    """Answer API requests with the given status codes (200 once exhausted)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0) if statuses else 200, json=VERSION)
+
+    return handler
+
+
+class RecordingHook(InstrumentationHook):
+    """Hook recording the events it receives."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, RequestEvent]] = []
+
+    def before_request(self, event: RequestEvent) -> None:
+        event.request.headers["X-Test"] = "1"
+        self.events.append(("before", event))
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.events.append(("after", event))
+
+
+def test_hooks_and_metrics():
+    """Test that each attempt reaches the hooks and the metrics, retries included."""
+    hook = RecordingHook()
+    metrics = MetricsCollector()
+    client = SyncClient(
+        "id",
+        "secret",
+        retry_policy=RetryPolicy(backoff_base=0),
+        transport=FakeApi(make_handler([503])),
+        hooks=[hook, metrics],
+    )
+    assert client.version.get().semantic == "1.2.3"
+    assert [(kind, event.attempt) for kind, event in hook.events] == [
+        ("before", 1),
+        ("after", 1),
+        ("before", 2),
+        ("after", 2),
+    ]
+    assert hook.events[-1][1].request.headers["X-Test"] == "1"
+
+    snapshot = metrics.snapshot()
+    assert snapshot["outcomes"] == {"GET /version": {"503": 1, "200": 1}}
+    assert snapshot["retries"] == {"GET /version": 1}
+    assert snapshot["latency"]["GET /version"]["count"] == 2
+    assert snapshot["latency"]["GET /version"]["buckets"]["+Inf"] == 2
+    assert snapshot["bytes_received"]["/version"] > 0
+    assert snapshot["parse"]["validate /version"]["count"] == 1
+    assert snapshot["auth_refresh"]["count"] == 1
+
+    text = metrics.to_prometheus()
+    assert 'machineq_requests_total{resource="/version",method="GET",outcome="503"} 1' in text
+    assert 'machineq_request_duration_seconds_bucket{resource="/version",method="GET",le="+Inf"} 2' in text
+    assert "machineq_auth_refresh_duration_seconds_count 1" in text
+
+    metrics.reset()
+    assert metrics.snapshot()["latency"] == {}
+
+
+@pytest.mark.asyncio
+async def test_async_transport_error():
+    """Test that transport errors are reported to the hooks of the async client."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    metrics = MetricsCollector()
+    client = AsyncClient(
+        "id",
+        "secret",
+        retry_policy=RetryPolicy(max_attempts=1),
+        transport=FakeApi(handler),
+        hooks=[metrics],
+    )
+    with pytest.raises(httpx.ConnectError):
+        await client.version.get()
+    assert metrics.snapshot()["outcomes"] == {"GET /version": {"ConnectError": 1}}
@@ -0,0 +1,108 @@
+"""Tests for the local inventory mirror."""
+
+import sqlite3
+from pathlib import Path
+
+import httpx
+import pytest
+from sample_data.api import FakeApi
+from sample_data.inventory import device, gateway
+
+from machineq import AsyncClient, InventoryMirror, SyncClient
+from machineq.core.device.models import DeviceInstance
+from machineq.core.shared.models import LazyList
+
+
+class Inventory:
+    """Serve the listings of a mutable inventory"""
+
+    def __init__(self) -> None:
+        self.devices = [device("a1"), device("a2")]
+        self.groups = [{"Id": "g1", "Name": "group", "DeviceList": ["a1"], "Devices": []}]
+        self.gateways = [gateway("gw1", "node1")]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/devices":
+            return httpx.Response(200, json={"Devices": self.devices})
+        if path == "/v1/groups/devices":
+            return httpx.Response(200, json={"DeviceGroups": self.groups})
+        if path == "/v1/gateways":
+            return httpx.Response(200, json={"Gateways": self.gateways})
+        return httpx.Response(404, json={"code": 5, "message": "not found"})
+
+
+def test_refresh(tmp_path: Path):
+    """Test that refreshes apply additions, removals and changes, and that lookups use the mirror."""
+    inventory = Inventory()
+    client = SyncClient("id", "secret", transport=FakeApi(inventory))
+    with InventoryMirror(tmp_path / "inventory.db") as mirror:
+        changes = mirror.refresh(client)
+        assert changes["devices"].added == ["a1", "a2"]
+        assert changes["device_groups"].added == ["g1"]
+        assert changes["gateways"].added == ["gw1"]
+        assert not any(mirror.refresh(client).values())
+
+        inventory.devices = [device("a1", profile="dp2", updated_at="2026-02-01T00:00:00Z"), device("a3")]
+        inventory.groups[0]["DeviceList"] = ["a1", "a3"]
+        changes = mirror.refresh(client)
+        assert (changes["devices"].added, changes["devices"].removed, changes["devices"].changed) == (
+            ["a3"],
+            ["a2"],
+            ["a1"],
+        )
+        assert changes["device_groups"].changed == ["g1"]
+        assert not changes["gateways"]
+
+    with InventoryMirror(tmp_path / "inventory.db") as mirror:
+        mirrored = mirror.device("a1")
+        assert mirrored is not None
+        assert mirrored.device_profile == "dp2"
+        assert mirror.device("a2") is None
+        assert [d.deveui for d in mirror.devices(device_profile="dp1")] == ["a3"]
+        assert sorted(d.deveui for d in mirror.devices(group_id="g1", output_profile="op")) == ["a1", "a3"]
+        assert mirror.groups_of("a3") == ["g1"]
+        gw = mirror.gateway_by_node_id("node1")
+        assert gw is not None
+        assert gw.id == "gw1"
+
+
+@pytest.mark.asyncio
+async def test_refresh_async():
+    """Test refreshing the mirror with the async client."""
+    client = AsyncClient("id", "secret", transport=FakeApi(Inventory()))
+    with InventoryMirror() as mirror:
+        changes = await mirror.refresh_async(client)
+        assert changes["devices"].added == ["a1", "a2"]
+        assert mirror.group_members("g1") == ["a1"]
+        gw = mirror.gateway("gw1")
+        assert gw is not None
+        assert gw.node_id == "node1"
+
+
+def test_null_columns(tmp_path: Path):
+    """Test that null profiles are stored as NULL, not as the text "None", and that old mirrors are rebuilt."""
+    path = tmp_path / "inventory.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE devices (deveui TEXT PRIMARY KEY, output_profile TEXT NOT NULL)")
+    unassigned = device("a2")
+    unassigned["OutputProfile"] = None
+    with InventoryMirror(path) as mirror:
+        mirror.apply(LazyList(DeviceInstance, [device("a1"), unassigned]), [], [])
+        assert [d.deveui for d in mirror.devices(output_profile="op")] == ["a1"]
+        assert mirror.devices(output_profile="None") == []
+        rows = mirror._connection.execute("SELECT deveui FROM devices WHERE output_profile IS NULL")
+        assert list(rows) == [("a2",)]
+
+
+def test_apply_models_after_refresh():
+    """Test that models and raw items of unchanged devices compare equal, whatever their time format."""
+    inventory = Inventory()
+    inventory.devices = [device("a1", updated_at="2026-01-01T00:00:00.000Z")]
+    client = SyncClient("id", "secret", transport=FakeApi(inventory))
+    with InventoryMirror() as mirror:
+        mirror.refresh(client)
+        devices = client.devices.get_all()
+        groups = client.device_groups.get_all()
+        gateways = client.gateways.get_all()
+        assert not any(mirror.apply(devices, groups, gateways).values())
@@ -1,11 +1,18 @@
 """Tests for Logs API."""
 
-from datetime import datetime, timedelta
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 
+import httpx
 import pytest
 from async_test_client import AsyncTestClient
+from sample_data.api import FakeApi
+from sample_data.logs import log as raw_log
 
+from machineq import AsyncClient
 from machineq.core.logs.api import AsyncLogs
+from machineq.core.logs.columns import LogColumns
 
 
 @pytest.fixture
@@ -38,3 +45,117 @@ class TestLogs:
         with pytest.warns(UserWarning, match="Naive datetime provided.*"):
             logs = await logs_api.get_all(start_time=ten_hours_ago, end_time=now)
             assert len(logs) > 0
+
+    async def test_iter_all(self, logs_api: AsyncLogs):
+        """Test iterating over logs across pages."""
+        now = datetime.now(timezone.utc)
+        start_time = now - timedelta(hours=1)
+        limit = 10
+        if isinstance(logs_api, AsyncLogs):
+            logs = []
+            async for log in logs_api.aiter_all(start_time=start_time, end_time=now):
+                logs.append(log)
+                if len(logs) == limit:
+                    break
+        else:
+            logs = list(islice(await logs_api.iter_all(start_time=start_time, end_time=now), limit))
+        first_page = await logs_api.get_all(start_time=start_time, end_time=now, page=1)
+        assert [log.timestamp for log in logs] == [log.timestamp for log in first_page[:limit]]
+
+    async def test_iter_all_streaming(self, logs_api: AsyncLogs):
+        """Test that streaming pages yields the same logs in the same order."""
+        now = datetime.now(timezone.utc)
+        start_time = now - timedelta(hours=1)
+        first_page = await logs_api.get_all(start_time=start_time, end_time=now, page=1)
+        if isinstance(logs_api, AsyncLogs):
+            logs = []
+            async for log in logs_api.aiter_all(start_time=start_time, end_time=now, streaming=True):
+                logs.append(log)
+                if len(logs) == len(first_page):
+                    break
+        else:
+            iterator = await logs_api.iter_all(start_time=start_time, end_time=now, streaming=True)
+            logs = list(islice(iterator, len(first_page)))
+        assert logs == first_page
+
+    async def test_aiter_all_prefetch(self, logs_api: AsyncLogs):
+        """Test that prefetching pages yields the same logs in the same order."""
+        if not isinstance(logs_api, AsyncLogs):
+            pytest.skip("prefetching is only available on the async client")
+        now = datetime.now(timezone.utc)
+        start_time = now - timedelta(hours=1)
+        sequential = [log.timestamp async for log in logs_api.aiter_all(start_time=start_time, end_time=now)]
+        prefetched = [
+            log.timestamp async for log in logs_api.aiter_all(start_time=start_time, end_time=now, prefetch=4)
+        ]
+        assert prefetched == sequential
+
+    async def test_export(self, logs_api: AsyncLogs):
+        """Test that a sharded export returns the same logs in timestamp order."""
+        if not isinstance(logs_api, AsyncLogs):
+            pytest.skip("sharded export is only available on the async client")
+        now = datetime.now(timezone.utc)
+        start_time = now - timedelta(hours=1)
+        exporter = logs_api.export(start_time, now, shard_duration=timedelta(minutes=10), concurrency=4)
+        exported = [log async for log in exporter]
+        timestamps = [log.timestamp for log in exported]
+        assert timestamps == sorted(timestamps)
+        paginated = [log async for log in logs_api.aiter_all(start_time=start_time, end_time=now)]
+        assert {(log.deveui, log.timestamp) for log in exported} == {(log.deveui, log.timestamp) for log in paginated}
+
+    async def test_to_columns(self, logs_api: AsyncLogs):
+        """Test that columnar decoding matches the validated logs."""
+        pytest.importorskip("numpy")
+        if not isinstance(logs_api, AsyncLogs):
+            pytest.skip("compared against aiter_all, which is only available on the async client")
+        now = datetime.now(timezone.utc)
+        start_time = now - timedelta(hours=1)
+        columns = await logs_api.to_columns(start_time=start_time, end_time=now, columns=("timestamp", "deveui"))
+        logs = [log async for log in logs_api.aiter_all(start_time=start_time, end_time=now)]
+        assert len(columns) == len(logs)
+        assert columns.to_numpy()["deveui"].tolist() == [log.deveui for log in logs]
+
+    async def test_to_arrow(self, logs_api: AsyncLogs):
+        """Test exporting logs to an Arrow table."""
+        pytest.importorskip("pyarrow")
+        now = datetime.now(timezone.utc)
+        table = await logs_api.to_arrow(start_time=now - timedelta(hours=1), end_time=now)
+        assert table.column_names[0] == "timestamp"
+
+
+@pytest.mark.asyncio
+async def test_export_sparse_window():
+    """Test that a sparse window is paginated, not bisected, while the page size is unknown."""
+    start_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    timestamps = [start_time + timedelta(minutes=minutes) for minutes in (5, 20, 40)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("Page", "1"))
+        return httpx.Response(200, json={"Logs": [raw_log(t) for t in timestamps] if page == 1 else []})
+
+    client = AsyncClient("id", "secret", transport=FakeApi(handler))
+    exporter = client.logs.export(start_time, start_time + timedelta(hours=1))
+    assert [log.timestamp async for log in exporter] == timestamps
+    assert exporter.shards_split == 0
+    assert exporter.pages_fetched == 2
+
+
+def test_columns_from_raw_logs():
+    """Test the decoding of raw logs into columns, the boolean late flag included."""
+    np = pytest.importorskip("numpy")
+    start_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    raw = [raw_log(start_time + timedelta(seconds=i), late=late) for i, late in enumerate(["false", "true", "1"])]
+    columns = LogColumns(("timestamp", "fport", "primary_gateway_rssi", "late"))
+    columns.extend(raw)
+    arrays = columns.to_numpy()
+    assert arrays["timestamp"][0] == np.datetime64("2026-01-01T00:00:00")
+    assert arrays["fport"].tolist() == [2, 2, 2]
+    assert arrays["primary_gateway_rssi"].tolist() == [-97.0] * 3
+    assert arrays["late"].dtype == np.bool_
+    assert arrays["late"].tolist() == [False, True, True]
+
+    columns = LogColumns(("late",))
+    columns.extend([*raw, raw_log(start_time, late="")])
+    assert np.isnan(columns.to_numpy()["late"][-1])
+    if importlib.util.find_spec("pyarrow") is not None:
+        assert columns.to_arrow().column("late").to_pylist() == [False, True, True, None]
@@ -0,0 +1,54 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from machineq import AsyncRateLimiter, RateLimit, RateLimiter
+
+
+class TestRateLimiter:
+    """Sync rate limiter tests."""
+
+    def test_burst_is_not_throttled(self):
+        """Test that requests within the burst go through immediately."""
+        limiter = RateLimiter(RateLimit(rate=1, burst=3))
+        for _ in range(3):
+            limiter.acquire("/devices")
+        assert limiter.throttled == 0
+
+    def test_paces_requests(self):
+        """Test that requests beyond the burst are paced at the configured rate."""
+        limiter = RateLimiter(RateLimit(rate=20))
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire("/devices")
+        assert time.monotonic() - start >= 0.19
+        assert limiter.throttled == 4
+
+    def test_family_limits_are_separate(self):
+        """Test that an endpoint family limit does not throttle other families."""
+        limiter = RateLimiter(family_limits={"/logs": RateLimit(rate=1)})
+        limiter.acquire("/logs")
+        for _ in range(5):
+            limiter.acquire("/devices")
+        assert limiter.throttled == 0
+
+    def test_invalid_limit(self):
+        """Test that the limits are validated."""
+        with pytest.raises(ValueError, match="rate"):
+            RateLimit(rate=0)
+
+
+@pytest.mark.asyncio
+class TestAsyncRateLimiter:
+    """Async rate limiter tests."""
+
+    async def test_paces_concurrent_requests(self):
+        """Test that concurrent coroutines are paced at the configured rate."""
+        limiter = AsyncRateLimiter(RateLimit(rate=50, burst=5))
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("/devices") for _ in range(15)))
+        assert time.monotonic() - start >= 0.19
+        assert limiter.throttled == 10
@@ -0,0 +1,46 @@
+"""Tests for the retry policy."""
+
+import httpx
+import pytest
+
+from machineq import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Retry policy tests."""
+
+    def test_retries_transient_status_on_idempotent_method(self):
+        """Test that a 503 on GET is retried with a bounded backoff."""
+        policy = RetryPolicy(backoff_base=1, backoff_max=2)
+        delay = policy.next_delay("GET", 1, response=httpx.Response(503))
+        assert delay is not None
+        assert 0 <= delay <= 1
+
+    def test_does_not_retry_non_idempotent_method(self):
+        """Test that POST is not retried by default."""
+        policy = RetryPolicy()
+        assert policy.next_delay("POST", 1, response=httpx.Response(503)) is None
+        assert policy.next_delay("POST", 1, error=httpx.ConnectError("reset")) is None
+
+    def test_does_not_retry_permanent_errors(self):
+        """Test that client errors and successes are not retried."""
+        policy = RetryPolicy()
+        assert policy.next_delay("GET", 1, response=httpx.Response(404)) is None
+        assert policy.next_delay("GET", 1, response=httpx.Response(200)) is None
+
+    def test_stops_after_max_attempts(self):
+        """Test that the number of attempts is bounded."""
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.next_delay("GET", 1, error=httpx.ConnectError("reset")) is not None
+        assert policy.next_delay("GET", 2, error=httpx.ConnectError("reset")) is None
+
+    def test_honors_retry_after(self):
+        """Test that Retry-After is used instead of the backoff, unless it is too long."""
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.next_delay("GET", 1, response=httpx.Response(429, headers={"Retry-After": "3"})) == 3
+        assert policy.next_delay("GET", 1, response=httpx.Response(429, headers={"Retry-After": "30"})) is None
+
+    def test_invalid_max_attempts(self):
+        """Test that max_attempts is validated."""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
@@ -0,0 +1,38 @@
+"""Tests for the incremental JSON array parser."""
+
+import json
+
+import pytest
+
+from machineq.client.streaming import JsonArrayParser
+
+DOCUMENT = {
+    "Meta": {"Devices": [0]},
+    "Name": "Devices",
+    "Escaped": ['a,b\\"]', "é€"],
+    "Devices": [{"Name": 'x\\"y,]}', "Tags": [1, {"A": None}]}, 12345, -1.5e3, "s", None, True, [], {}],
+    "Empty": [],
+    "Other": [{"Id": 1}],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_split_items(chunk_size: int):
+    """Test that the items of the requested arrays are decoded whatever the chunk boundaries."""
+    raw = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+    parser = JsonArrayParser(["Devices", "Empty", "Other"])
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        items.extend(parser.feed(raw[start : start + chunk_size]))
+    parser.close()
+    expected = [("Devices", item) for item in DOCUMENT["Devices"]] + [("Other", item) for item in DOCUMENT["Other"]]
+    assert items == expected
+
+
+def test_truncated_document():
+    """Test that a truncated document is reported on close."""
+    raw = json.dumps(DOCUMENT).encode()
+    parser = JsonArrayParser(["Devices"])
+    parser.feed(raw[: len(raw) // 2])
+    with pytest.raises(ValueError, match="Truncated"):
+        parser.close()
@@ -0,0 +1,101 @@
+"""Tests for the OpenTelemetry tracing of API calls."""
+
+import inspect
+from typing import Any
+
+import httpx
+import pytest
+from sample_data.api import FakeApi, version
+
+from machineq import AsyncClient, RetryPolicy, SyncClient, Tracing
+from machineq.client import NotFound
+from machineq.client.tracing import TracedCall, _resource_name
+from machineq.core.device.api import AsyncDevices, SyncDevices
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.startswith("/v1/devices/"):
+        return httpx.Response(404, json={"code": 5, "message": "device not found"})
+    return version(request)
+
+
+class FakeSpan:
+    def __init__(self) -> None:
+        self.attributes: dict[str, Any] = {}
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+
+def test_resource_methods_are_wrapped():
+    """Test that the traced resource methods keep their names, signatures and kinds."""
+    assert SyncDevices.get.__name__ == "get"
+    assert list(inspect.signature(SyncDevices.get).parameters) == ["self", "deveui"]
+    assert inspect.iscoroutinefunction(AsyncDevices.get)
+    assert inspect.isgeneratorfunction(SyncDevices.iter_all)
+    assert _resource_name("SyncRFRegions") == "rf_regions"
+    assert _resource_name("AsyncGatewayGroups") == "gateway_groups"
+
+
+def test_traced_call_attributes():
+    """Test the attributes recorded for an API call that failed after a retry."""
+    span = FakeSpan()
+    call = TracedCall(span, {"0011": "deveui"})
+    request = httpx.Request("GET", "https://api.machineq.net/v1/devices/0011/payloads")
+    call.record_request(request, 1, 0.25)
+    call.record_request(request, 2, 0.0)
+    call.record_response(httpx.Response(404))
+    call.finish(NotFound("device not found", code=5, status_code=404))
+    assert span.attributes == {
+        "machineq.request_count": 2,
+        "machineq.token_wait_seconds": 0.25,
+        "http.request.resend_count": 1,
+        "http.request.method": "GET",
+        "url.template": "/v1/devices/{deveui}/payloads",
+        "http.response.status_code": 404,
+        "error.type": "NotFound",
+        "machineq.error_code": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_tracing_without_tracer():
+    """Test that calls go through unchanged when tracing has no tracer (OpenTelemetry not installed)."""
+    tracing = Tracing()
+    tracing.tracer = None
+    client = AsyncClient("id", "secret", transport=FakeApi(handler), tracing=tracing)
+    assert (await client.version.get()).semantic == "1.2.3"
+    with pytest.raises(NotFound):
+        await client.devices.get("0011")
+
+
+def test_spans():
+    """Test the spans exported for successful and failed calls."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider  # ty:ignore[unresolved-import]
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # ty:ignore[unresolved-import]
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # ty:ignore[unresolved-import]
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    client = SyncClient(
+        "id",
+        "secret",
+        retry_policy=RetryPolicy(max_attempts=1),
+        transport=FakeApi(handler),
+        tracing=Tracing(provider),
+    )
+    client.version.get()
+    with pytest.raises(NotFound):
+        client.devices.get("0011")
+
+    version, device = exporter.get_finished_spans()
+    assert version.name == "version.get"
+    assert version.attributes["http.response.status_code"] == 200
+    assert device.name == "devices.get"
+    assert device.attributes["url.template"] == "/v1/devices/{deveui}"
+    assert device.attributes["machineq.error_code"] == 5
+    assert not device.status.is_ok
@@ -0,0 +1,69 @@
+"""Tests for the payload high-water marks."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+import pytest
+from sample_data.api import FakeApi
+
+from machineq import SyncClient
+from machineq.core.device import DevicePayload
+from machineq.core.device.watermarks import PayloadWatermarks
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def payload(seconds: int, value: int) -> DevicePayload:
+    return DevicePayload(time=T0 + timedelta(seconds=seconds), data={"value": value}, application_data={})
+
+
+def test_watermarks(tmp_path: Path):
+    """Test that marks advance, skip the payloads already seen at the boundary, and persist."""
+    path = tmp_path / "state.json"
+    watermarks = PayloadWatermarks(path)
+    assert watermarks.last_seen("a") is None
+    assert watermarks.start_time("a", T0) == T0
+    watermarks.advance("a", [payload(0, 1), payload(10, 2), payload(10, 3)])
+    watermarks.save()
+
+    watermarks = PayloadWatermarks(path)
+    assert watermarks.last_seen("a") == T0 + timedelta(seconds=10)
+    assert watermarks.start_time("a", T0) == T0 + timedelta(seconds=10)
+    assert watermarks.start_time("a", T0 + timedelta(hours=1)) == T0 + timedelta(hours=1)
+    assert not watermarks.is_new("a", payload(10, 2))
+    assert watermarks.is_new("a", payload(10, 4))
+    assert watermarks.is_new("a", payload(11, 2))
+    assert not watermarks.is_new("a", payload(5, 5))
+    assert watermarks.is_new("b", payload(0, 1))
+
+    watermarks.advance("a", [payload(10, 4)])
+    assert not watermarks.is_new("a", payload(10, 3))
+    assert not watermarks.is_new("a", payload(10, 4))
+    watermarks.advance("a", [payload(20, 5)])
+    assert watermarks.is_new("a", payload(20, 6))
+    assert not watermarks.is_new("a", payload(10, 4))
+
+
+def test_harvest_naive_range(tmp_path: Path):
+    """Test that a naive time range works with and without watermarks, which are timezone-aware."""
+    sent = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["StartTime"].endswith("Z")
+        return httpx.Response(200, json={"Payloads": [{"Time": sent, "Data": {"value": 1}, "ApplicationData": {}}]})
+
+    client = SyncClient("id", "secret", transport=FakeApi(handler))
+    end = datetime.now()
+    start = end - timedelta(days=1)
+    with pytest.warns(UserWarning, match="Naive datetime"):
+        harvester = client.devices.harvest_payloads(["a", "b"], start_time=start, end_time=end)
+    assert sorted(deveui for deveui, _ in harvester) == ["a", "b"]
+
+    watermarks = PayloadWatermarks(tmp_path / "state.json")
+    watermarks.advance("a", [payload(0, 1)])
+    with pytest.warns(UserWarning, match="Naive datetime"):
+        harvester = client.devices.harvest_payloads(["a", "b"], start_time=start, end_time=end, watermarks=watermarks)
+    assert sorted(deveui for deveui, _ in harvester) == ["a", "b"]
+    assert not harvester.failures
+    assert not list(harvester)